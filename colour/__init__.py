@@ -166,7 +166,8 @@ from .volume import (
     RGB_colourspace_volume_MonteCarlo,
     RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
     is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
-from .graph import describe_conversion_path, convert
+from .graph import (describe_conversion_path, conversion_plan, convert,
+                    convert_many)
 
 from colour.utilities import is_matplotlib_installed
 
@@ -346,7 +347,9 @@ __all__ += [
     'is_within_mesh_volume', 'is_within_pointer_gamut',
     'is_within_visible_spectrum'
 ]
-__all__ += ['describe_conversion_path', 'convert']
+__all__ += [
+    'describe_conversion_path', 'conversion_plan', 'convert', 'convert_many'
+]
 
 __application_name__ = 'Colour'
 
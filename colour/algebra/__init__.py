@@ -5,7 +5,7 @@ from . import coordinates
 from .common import (is_spow_enabled, set_spow_enable, spow_enable, spow,
                      normalise_maximum, vector_dot, matrix_dot,
                      linear_conversion, linstep_function, lerp,
-                     smoothstep_function, smooth, is_identity)
+                     smoothstep_function, smooth, stencil_filter, is_identity)
 from .extrapolation import Extrapolator
 from .geometry import (
     normalise_vector, euclidean_distance, manhattan_distance,
@@ -28,7 +28,8 @@ __all__ += coordinates.__all__
 __all__ += [
     'is_spow_enabled', 'set_spow_enable', 'spow_enable', 'spow',
     'normalise_maximum', 'vector_dot', 'matrix_dot', 'linear_conversion',
-    'linstep_function', 'lerp', 'smoothstep_function', 'smooth', 'is_identity'
+    'linstep_function', 'lerp', 'smoothstep_function', 'smooth',
+    'stencil_filter', 'is_identity'
 ]
 __all__ += ['Extrapolator']
 __all__ += [
@@ -22,7 +22,8 @@ __status__ = 'Production'
 __all__ = [
     'is_spow_enabled', 'set_spow_enable', 'spow_enable', 'spow',
     'normalise_maximum', 'vector_dot', 'matrix_dot', 'linear_conversion',
-    'linstep_function', 'lerp', 'smoothstep_function', 'smooth', 'is_identity'
+    'linstep_function', 'lerp', 'smoothstep_function', 'smooth',
+    'stencil_filter', 'is_identity'
 ]
 
 _SPOW_ENABLED = True
@@ -427,6 +428,79 @@ def smoothstep_function(x, a=0, b=1, clip=False):
 smooth = smoothstep_function
 
 
+def stencil_filter(a, stencil, left_coefficients=None,
+                   right_coefficients=None):
+    """
+    Applies given stencil along the last axis of given array :math:`a`.
+
+    The stencil is correlated with the array, i.e. it is not flipped, and only
+    the values where it fully overlaps the array are returned. The array can
+    optionally be padded with one value on each side, the padding values being
+    linear combinations of the first or last values of the array, e.g.
+    *Lagrange* extrapolation coefficients.
+
+    Parameters
+    ----------
+    a : array_like
+        Array :math:`a` to filter, a stack of arrays can be given, the
+        filtered values being in the last axis.
+    stencil : array_like
+        Stencil coefficients.
+    left_coefficients : array_like, optional
+        Coefficients applied to the first values of the array :math:`a` to
+        compute the left padding value.
+    right_coefficients : array_like, optional
+        Coefficients applied to the last values of the array :math:`a` to
+        compute the right padding value.
+
+    Returns
+    -------
+    ndarray
+        Filtered array :math:`a`.
+
+    Examples
+    --------
+    >>> a = np.array([1, 2, 4, 8, 16])
+    >>> stencil_filter(a, [0.5, 0.5])
+    array([  1.5,   3. ,   6. ,  12. ])
+    >>> stencil_filter(a, [-1, 3, -1], [1], [1])
+    array([  0.,   1.,   2.,   4.,  24.])
+    """
+
+    a = as_float_array(a)
+    stencil = as_float_array(stencil)
+
+    padding = []
+    if left_coefficients is not None:
+        left_coefficients = as_float_array(left_coefficients)
+        padding.append(
+            np.dot(a[..., :len(left_coefficients)],
+                   left_coefficients)[..., np.newaxis])
+
+    padding.append(a)
+
+    if right_coefficients is not None:
+        right_coefficients = as_float_array(right_coefficients)
+        padding.append(
+            np.dot(a[..., -len(right_coefficients):],
+                   right_coefficients)[..., np.newaxis])
+
+    if len(padding) != 1:
+        a = np.concatenate(padding, axis=-1)
+
+    n = a.shape[-1] - len(stencil) + 1
+
+    assert n > 0, (
+        'Array with {0} values along the last axis is too short for a '
+        'stencil with {1} coefficients!'.format(a.shape[-1], len(stencil)))
+
+    b = stencil[0] * a[..., :n]
+    for i in range(1, len(stencil)):
+        b += stencil[i] * a[..., i:i + n]
+
+    return b
+
+
 def is_identity(a, n=3):
     """
     Returns if :math:`a` array is an identity matrix.
@@ -72,6 +72,10 @@ class Extrapolator:
     Notes
     -----
     -   The interpolator must define *x* and *y* attributes.
+    -   The interpolator *y* attribute can be 2-dimensional, i.e. the
+        interpolator is defining multiple columns sharing the same *x*
+        attribute, in which case the extrapolated values have an extra last
+        dimension.
 
     References
     ----------
@@ -111,6 +115,17 @@ class Extrapolator:
     >>> extrapolator = Extrapolator(interpolator, method='Constant', left=0)
     >>> extrapolator(np.array([0.1, 0.2, 8, 9]))
     array([ 0.,  0.,  3.,  3.])
+
+    Extrapolating an interpolator with multiple columns:
+
+    >>> from colour.algebra import CubicSplineInterpolator
+    >>> x = np.array([3, 4, 5, 6])
+    >>> y = np.array([[1, 2], [2, 4], [3, 6], [4, 8]])
+    >>> interpolator = CubicSplineInterpolator(x, y)
+    >>> extrapolator = Extrapolator(interpolator)
+    >>> extrapolator(np.array([1, 7]))
+    array([[ -1.,  -2.],
+           [  5.,  10.]])
     """
 
     def __init__(self,
@@ -278,11 +293,18 @@ class Extrapolator:
             Extrapolated points value(s).
         """
 
+        ndim = np.ndim(x)
+
         x = np.atleast_1d(x).astype(self._dtype)
 
-        xe = as_float(self._evaluate(x))
+        xe = self._evaluate(x)
+
+        # A numeric "x" yields the values of the columns of a 2-dimensional
+        # "y" variable, consistently with the interpolators.
+        if ndim == 0 and xe.ndim > 1:
+            xe = xe[0]
 
-        return xe
+        return as_float(xe)
 
     def _evaluate(self, x):
         """
@@ -300,14 +322,17 @@ class Extrapolator:
         """
 
         xi = self._interpolator.x
-        yi = self._interpolator.y
+        yi = np.asarray(self._interpolator.y)
 
-        y = np.empty_like(x)
+        y = np.empty(x.shape + yi.shape[1:], dtype=x.dtype)
 
         if self._method == 'linear':
-            y[x < xi[0]] = (yi[0] + (x[x < xi[0]] - xi[0]) * (yi[1] - yi[0]) /
-                            (xi[1] - xi[0]))
-            y[x > xi[-1]] = (yi[-1] + (x[x > xi[-1]] - xi[-1]) *
+            # Broadcasting the points against the "y" variable columns.
+            x_b = np.reshape(x, x.shape + (1, ) * (yi.ndim - 1))
+
+            y[x < xi[0]] = (yi[0] + (x_b[x < xi[0]] - xi[0]) *
+                            (yi[1] - yi[0]) / (xi[1] - xi[0]))
+            y[x > xi[-1]] = (yi[-1] + (x_b[x > xi[-1]] - xi[-1]) *
                              (yi[-1] - yi[-2]) / (xi[-1] - xi[-2]))
         elif self._method == 'constant':
             y[x < xi[0]] = yi[0]
@@ -66,9 +66,9 @@ from collections.abc import Mapping
 from functools import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import (
-    CaseInsensitiveMapping, as_float_array, as_float, closest_indexes,
-    interval, is_integer, is_numeric, runtime_warning, tsplit, validate_method)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
+                              closest_indexes, interval, is_integer,
+                              is_numeric, runtime_warning, validate_method)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -83,9 +83,9 @@ __all__ = [
     'NearestNeighbourInterpolator', 'LinearInterpolator',
     'SpragueInterpolator', 'CubicSplineInterpolator', 'PchipInterpolator',
     'NullInterpolator', 'lagrange_coefficients',
-    'vertices_and_relative_coordinates', 'table_interpolation_trilinear',
-    'table_interpolation_tetrahedral', 'TABLE_INTERPOLATION_METHODS',
-    'table_interpolation'
+    'vertices_and_relative_coordinates', 'TABLE_INTERPOLATION_TILE_SIZE',
+    'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
+    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
 ]
 
 
@@ -283,7 +283,8 @@ class KernelInterpolator:
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpreted as
+        multiple columns sharing the :math:`x` variable.
     window : int, optional
         Width of the window in samples on each side.
     kernel : callable, optional
@@ -346,6 +347,13 @@ class KernelInterpolator:
     ...     kernel_kwargs={'a': 16})
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 5.3961792...,  5.6521093...])
+
+    Interpolating multiple columns at once:
+
+    >>> f = KernelInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
+    array([[  6.1806208...,  12.3612416...],
+           [  8.0823848...,  16.1647697...]])
     """
 
     def __init__(self,
@@ -458,13 +466,22 @@ class KernelInterpolator:
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             self._y = value
 
             if self._window is not None:
-                self._y_p = np.pad(self._y, **self._padding_kwargs)
+                padding_kwargs = self._padding_kwargs
+                if self._y.ndim == 2:
+                    # Padding only occurs along the interpolation axis.
+                    padding_kwargs = dict(padding_kwargs)
+                    padding_kwargs['pad_width'] = np.vstack([
+                        np.broadcast_to(padding_kwargs['pad_width'], (1, 2)),
+                        [0, 0]
+                    ])
+
+                self._y_p = np.pad(self._y, **padding_kwargs)
 
     @property
     def window(self):
@@ -619,11 +636,12 @@ class KernelInterpolator:
             Interpolated value(s).
         """
 
-        x = np.atleast_1d(x).astype(self._dtype)
+        xi = self._evaluate(np.atleast_1d(x).astype(self._dtype))
 
-        xi = as_float(self._evaluate(x))
+        if self._y.ndim == 2 and np.ndim(x) == 0:
+            xi = xi[0]
 
-        return xi
+        return as_float(xi)
 
     def _evaluate(self, x):
         """
@@ -653,11 +671,15 @@ class KernelInterpolator:
         windows = np.clip(windows, clip_l, clip_h) - clip_l
         windows = np.around(windows).astype(DEFAULT_INT_DTYPE)
 
-        return np.sum(
-            self._y_p[windows] * self._kernel(
-                x[:, np.newaxis] / x_interval - windows -
-                min(self._x_p) / x_interval, **self._kernel_kwargs),
-            axis=-1)
+        weights = self._kernel(
+            x[:, np.newaxis] / x_interval - windows -
+            min(self._x_p) / x_interval, **self._kernel_kwargs)
+
+        if self._y_p.ndim == 2:
+            # The kernel weights are shared by all the columns.
+            return np.einsum('ij,ijk->ik', weights, self._y_p[windows])
+
+        return np.sum(self._y_p[windows] * weights, axis=-1)
 
     def _validate_dimensions(self):
         """
@@ -926,7 +948,8 @@ class SpragueInterpolator:
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpreted as
+        multiple columns sharing the :math:`x` variable.
     dtype : type
         Data type used for internal conversions.
 
@@ -964,6 +987,13 @@ class SpragueInterpolator:
 
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 6.7295161...,  7.8140625...])
+
+    Interpolating multiple columns at once:
+
+    >>> f = SpragueInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
+    array([[  6.7295161...,  13.4590322...],
+           [  7.8140625...,  15.6281250...]])
     """
 
     SPRAGUE_C_COEFFICIENTS = np.array([
@@ -1069,27 +1099,18 @@ class SpragueInterpolator:
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             assert len(value) >= 6, (
                 '"y" dependent variable values count must be equal to or '
                 'greater than 6!')
 
-            yp1 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[0],
-                        np.array(value[0:6]).reshape([6, 1]))) / 209)[0]
-            yp2 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[1],
-                        np.array(value[0:6]).reshape([6, 1]))) / 209)[0]
-            yp3 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[2],
-                        np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
-            yp4 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[3],
-                        np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
-
-            self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            # The boundary points are generated for all the columns at once.
+            yp12 = np.dot(self.SPRAGUE_C_COEFFICIENTS[0:2], value[0:6]) / 209
+            yp34 = np.dot(self.SPRAGUE_C_COEFFICIENTS[2:4], value[-6:]) / 209
+
+            self._yp = np.concatenate((yp12, value, yp34))
 
         self._y = value
 
@@ -1133,6 +1154,9 @@ class SpragueInterpolator:
         i = np.searchsorted(self._xp, x) - 1
         X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
 
+        if self._yp.ndim == 2:
+            X = X[..., np.newaxis]
+
         r = self._yp
 
         a0p = r[i]
@@ -1189,9 +1213,14 @@ class CubicSplineInterpolator(scipy.interpolate.interp1d):
     Notes
     -----
     -   This class is a wrapper around *scipy.interpolate.interp1d* class.
+    -   The interpolation is performed along the first axis by default, thus
+        the columns of a 2-dimensional :math:`y` variable are interpolated at
+        once.
     """
 
     def __init__(self, *args, **kwargs):
+        kwargs['axis'] = kwargs.get('axis', 0)
+
         super(CubicSplineInterpolator, self).__init__(
             kind='cubic', *args, **kwargs)
 
@@ -1680,6 +1709,160 @@ def vertices_and_relative_coordinates(V_xyz, table):
     return vertices, V_xyzr
 
 
+TABLE_INTERPOLATION_TILE_SIZE = 2 ** 15
+"""
+Count of :math:`V_{xyz}` values processed at once by the
+:func:`colour.algebra.table_interpolation_trilinear` and
+:func:`colour.algebra.table_interpolation_tetrahedral` definitions, the default
+value keeps the temporary arrays of a tile within a typical processor cache.
+
+TABLE_INTERPOLATION_TILE_SIZE : int
+"""
+
+
+def _table_interpolation_tiled(V_xyz, table, tile_kernel):
+    """
+    Performs interpolation of given :math:`V_{xyz}` values using given
+    interpolation table and tile kernel, processing the values in tiles of
+    :attr:`colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE` values.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+    tile_kernel : callable
+        Kernel interpolating a tile with the following signature:
+        ``tile_kernel(table, i_f, V_xyzr, strides, output)`` where ``table``
+        is the flattened interpolation table, ``i_f`` the flat indexes of the
+        origin vertices, ``V_xyzr`` the indexes relative :math:`V_{xyzr}`
+        values, ``strides`` the flat strides of the table axes and ``output``
+        the array to write the interpolated values into.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+    """
+
+    V_xyz = np.asarray(V_xyz)
+
+    dtype = (np.float32 if V_xyz.dtype == np.float32 else DEFAULT_FLOAT_DTYPE)
+
+    table = np.asarray(table, dtype)
+
+    size = np.array(table.shape[0:-1])
+    # Using the last cell on a given axis for the maximum values so that the
+    # ceiling vertices are always within the table.
+    i_m = np.maximum(size - 1, 1)
+    i_l = np.maximum(size - 2, 0)
+    strides = np.array([size[1] * size[2], size[2], 1]) * (size > 1)
+
+    table = np.reshape(table, (-1, table.shape[-1]))
+
+    V_xyz_f = np.reshape(V_xyz, (-1, 3))
+    output = np.empty((V_xyz_f.shape[0], table.shape[-1]), dtype)
+
+    for i in range(0, V_xyz_f.shape[0], TABLE_INTERPOLATION_TILE_SIZE):
+        tile = slice(i, i + TABLE_INTERPOLATION_TILE_SIZE)
+
+        V_xyzr = np.clip(V_xyz_f[tile], 0, 1).astype(dtype, copy=False)
+        V_xyzr *= i_m.astype(dtype)
+
+        # "NaN" values are assigned to the origin vertex and propagate
+        # through the relative coordinates.
+        i_f = np.nan_to_num(V_xyzr).astype(DEFAULT_INT_DTYPE)
+        i_f = np.minimum(i_f, i_l)
+        V_xyzr -= i_f
+
+        tile_kernel(table, np.dot(i_f, strides), V_xyzr, strides, output[tile])
+
+    return np.reshape(output, V_xyz.shape[0:-1] + (table.shape[-1], ))
+
+
+def _table_interpolation_trilinear_tile(table, i_f, V_xyzr, strides, output):
+    """
+    Performs trilinear interpolation of a tile of indexes relative
+    :math:`V_{xyzr}` values with successive linear interpolations along the
+    table axes.
+
+    Parameters
+    ----------
+    table : ndarray
+        Flattened interpolation table.
+    i_f : ndarray
+        Flat indexes of the origin vertices.
+    V_xyzr : ndarray
+        Indexes relative :math:`V_{xyzr}` values.
+    strides : ndarray
+        Flat strides of the table axes.
+    output : ndarray
+        Array to write the interpolated values into.
+    """
+
+    def lerp(a, b, t):
+        """
+        Linearly interpolates in-place between given arrays.
+        """
+
+        b -= a
+        b *= t
+        b += a
+
+        return b
+
+    s_x, s_y, s_z = strides
+    x, y, z = [V_xyzr[..., i, np.newaxis] for i in range(3)]
+
+    V_0 = lerp(
+        lerp(table[i_f], table[i_f + s_z], z),
+        lerp(table[i_f + s_y], table[i_f + s_y + s_z], z), y)
+    i_f = i_f + s_x
+    V_1 = lerp(
+        lerp(table[i_f], table[i_f + s_z], z),
+        lerp(table[i_f + s_y], table[i_f + s_y + s_z], z), y)
+
+    output[...] = lerp(V_0, V_1, x)
+
+
+def _table_interpolation_tetrahedral_tile(table, i_f, V_xyzr, strides, output):
+    """
+    Performs tetrahedral interpolation of a tile of indexes relative
+    :math:`V_{xyzr}` values: the enclosing tetrahedron is defined by the
+    descending order of the relative coordinates.
+
+    Parameters
+    ----------
+    table : ndarray
+        Flattened interpolation table.
+    i_f : ndarray
+        Flat indexes of the origin vertices.
+    V_xyzr : ndarray
+        Indexes relative :math:`V_{xyzr}` values.
+    strides : ndarray
+        Flat strides of the table axes.
+    output : ndarray
+        Array to write the interpolated values into.
+    """
+
+    order = np.argsort(-V_xyzr, axis=-1, kind='stable')
+    r_1, r_2, r_3 = [
+        r[..., np.newaxis]
+        for r in np.transpose(np.take_along_axis(V_xyzr, order, axis=-1))
+    ]
+    s_1, s_2, s_3 = np.transpose(strides[order])
+
+    V_xyz = table[i_f] * (1 - r_1)
+    i_f = i_f + s_1
+    V_xyz += table[i_f] * (r_1 - r_2)
+    i_f += s_2
+    V_xyz += table[i_f] * (r_2 - r_3)
+    V_xyz += table[i_f + s_3] * r_3
+
+    output[...] = V_xyz
+
+
 def table_interpolation_trilinear(V_xyz, table):
     """
     Performs trilinear interpolation of given :math:`V_{xyz}` values using
@@ -1697,6 +1880,17 @@ def table_interpolation_trilinear(V_xyz, table):
     ndarray
         Interpolated :math:`V_{xyz}` values.
 
+    Notes
+    -----
+    -   The :math:`V_{xyz}` values are processed in tiles of
+        :attr:`colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE`
+        values and the encompassing vertices are gathered from the flattened
+        interpolation table pairwise, bounding the temporary memory
+        irrespective of the :math:`V_{xyz}` values count.
+    -   *float32* :math:`V_{xyz}` values are interpolated and returned as
+        *float32*, other types use
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
+
     References
     ----------
     :cite:`Bourkeb`
@@ -1722,22 +1916,8 @@ def table_interpolation_trilinear(V_xyz, table):
            [ 1.0976519...,  0.1785998...,  0.2299897...]])
     """
 
-    V_xyz = as_float_array(V_xyz)
-
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
-
-    vertices = np.moveaxis(vertices, 0, 1)
-    x, y, z = [f[:, np.newaxis] for f in tsplit(V_xyzr)]
-
-    weights = np.moveaxis(
-        np.transpose(
-            [(1 - x) * (1 - y) * (1 - z), (1 - x) * (1 - y) * z,
-             (1 - x) * y * (1 - z), (1 - x) * y * z, x * (1 - y) * (1 - z),
-             x * (1 - y) * z, x * y * (1 - z), x * y * z]), 0, -1)
-
-    xyz_o = np.reshape(np.sum(vertices * weights, 1), V_xyz.shape)
-
-    return xyz_o
+    return _table_interpolation_tiled(V_xyz, table,
+                                      _table_interpolation_trilinear_tile)
 
 
 def table_interpolation_tetrahedral(V_xyz, table):
@@ -1757,6 +1937,17 @@ def table_interpolation_tetrahedral(V_xyz, table):
     ndarray
         Interpolated :math:`V_{xyz}` values.
 
+    Notes
+    -----
+    -   The :math:`V_{xyz}` values are processed in tiles of
+        :attr:`colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE`
+        values and only the four vertices of the enclosing tetrahedron are
+        gathered from the flattened interpolation table, bounding the
+        temporary memory irrespective of the :math:`V_{xyz}` values count.
+    -   *float32* :math:`V_{xyz}` values are interpolated and returned as
+        *float32*, other types use
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
+
     References
     ----------
     :cite:`Kirk2006`
@@ -1782,33 +1973,8 @@ def table_interpolation_tetrahedral(V_xyz, table):
            [ 1.1178206...,  0.1762039...,  0.2209534...]])
     """
 
-    V_xyz = as_float_array(V_xyz)
-
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
-
-    vertices = np.moveaxis(vertices, 0, -1)
-    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
-    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
-
-    xyz_o = np.select([
-        np.logical_and(x > y, y > z),
-        np.logical_and(x > y, x > z),
-        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
-        np.logical_and(x <= y, z > y),
-        np.logical_and(x <= y, z > x),
-        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
-    ], [
-        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
-        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
-    ])
-
-    xyz_o = np.reshape(xyz_o, V_xyz.shape)
-
-    return xyz_o
+    return _table_interpolation_tiled(V_xyz, table,
+                                      _table_interpolation_tetrahedral_tile)
 
 
 TABLE_INTERPOLATION_METHODS = CaseInsensitiveMapping({
@@ -9,7 +9,7 @@ import unittest
 from colour.algebra import (is_spow_enabled, set_spow_enable, spow_enable,
                             spow, smoothstep_function, normalise_maximum,
                             vector_dot, matrix_dot, linear_conversion,
-                            linstep_function, is_identity)
+                            linstep_function, stencil_filter, is_identity)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -22,7 +22,7 @@ __all__ = [
     'TestIsSpowEnabled', 'TestSetSpowEnabled', 'TestSpowEnable', 'TestSpow',
     'TestSmoothstepFunction', 'TestNormaliseMaximum', 'TestVectorDot',
     'TestMatrixDot', 'TestLinearConversion', 'TestLinstepFunction',
-    'TestIsIdentity'
+    'TestStencilFilter', 'TestIsIdentity'
 ]
 
 
@@ -370,6 +370,64 @@ class TestSmoothstepFunction(unittest.TestCase):
             np.array([0.00000, 0.15625, 0.50000, 0.84375, 1.00000]))
 
 
+class TestStencilFilter(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.common.stencil_filter` definition unit tests
+    methods.
+    """
+
+    def test_stencil_filter(self):
+        """
+        Tests :func:`colour.algebra.common.stencil_filter` definition.
+        """
+
+        a = np.array([1, 2, 4, 8, 16])
+
+        np.testing.assert_almost_equal(
+            stencil_filter(a, [0.5, 0.5]),
+            np.array([1.5, 3.0, 6.0, 12.0]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            stencil_filter(a, [-1, 3, -1], [1], [1]),
+            np.array([0.0, 1.0, 2.0, 4.0, 24.0]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            stencil_filter(a, [-0.0625, 0.5625, 0.5625, -0.0625], [3, -3, 1],
+                           [1, -3, 3]),
+            np.array([1.3750, 2.8125, 5.6250, 11.5000]),
+            decimal=7)
+
+    def test_n_dimensional_stencil_filter(self):
+        """
+        Tests :func:`colour.algebra.common.stencil_filter` definition
+        n-dimensional arrays support.
+        """
+
+        a = np.array([1, 2, 4, 8, 16])
+        b = stencil_filter(a, [-1, 3, -1], [1], [1])
+
+        a = np.tile(a, (6, 1))
+        b = np.tile(b, (6, 1))
+        np.testing.assert_almost_equal(
+            stencil_filter(a, [-1, 3, -1], [1], [1]), b, decimal=7)
+
+        a = np.reshape(a, (2, 3, 5))
+        b = np.reshape(b, (2, 3, 5))
+        np.testing.assert_almost_equal(
+            stencil_filter(a, [-1, 3, -1], [1], [1]), b, decimal=7)
+
+    def test_raise_exception_stencil_filter(self):
+        """
+        Tests :func:`colour.algebra.common.stencil_filter` definition raised
+        exception.
+        """
+
+        self.assertRaises(AssertionError, stencil_filter, np.array([1, 2]),
+                          [1, 2, 3])
+
+
 class TestIsIdentity(unittest.TestCase):
     """
     Defines :func:`colour.algebra.matrix.is_identity` definition unit tests
@@ -141,6 +141,15 @@ class TestExtrapolator(unittest.TestCase):
             extrapolator((0.1, 0.2, 8.0, 9.0)), (-1.9, -1.8, 6.0, 7.0))
         self.assertEqual(extrapolator(9), 7.)
 
+        extrapolator = Extrapolator(
+            CubicSplineInterpolator(
+                np.array([3, 4, 5, 6]),
+                np.array([[1, 2], [2, 4], [3, 6], [4, 8]])))
+        np.testing.assert_almost_equal(
+            extrapolator((0.1, 0.2, 8.0, 9.0)),
+            np.array([[-1.9, -3.8], [-1.8, -3.6], [6.0, 12.0], [7.0, 14.0]]))
+        np.testing.assert_almost_equal(extrapolator(9), np.array([7, 14]))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -14,6 +14,7 @@ import os
 import unittest
 from itertools import permutations
 
+import colour.algebra.interpolation
 from colour.algebra.interpolation import vertices_and_relative_coordinates
 from colour.algebra import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
@@ -23,7 +24,7 @@ from colour.algebra import (
     table_interpolation_trilinear, table_interpolation_tetrahedral)
 from colour.algebra import random_triplet_generator
 from colour.io import read_LUT
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -508,6 +509,27 @@ padding_kwargs` property.
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+        y = tstack([y, y * 2, y * 3])
+        kernel_interpolator = KernelInterpolator(
+            x_1, y, padding_kwargs={
+                'pad_width': (3, 3),
+                'mode': 'mean'
+            })
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                kernel_interpolator(x_i)[..., i],
+                KernelInterpolator(
+                    x_1,
+                    y[..., i],
+                    padding_kwargs={
+                        'pad_width': (3, 3),
+                        'mode': 'mean'
+                    })(x_i),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            kernel_interpolator(1.5), kernel_interpolator([1.5])[0], decimal=7)
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.KernelInterpolator.__call__`
@@ -724,6 +746,22 @@ class TestSpragueInterpolator(unittest.TestCase):
                           len(DATA_POINTS_A) - 1 + interval, interval)),
             DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES)
 
+        sprague_interpolator = SpragueInterpolator(
+            x, tstack([DATA_POINTS_A,
+                       np.array(DATA_POINTS_A) * 2]))
+        np.testing.assert_almost_equal(
+            sprague_interpolator(
+                np.arange(0,
+                          len(DATA_POINTS_A) - 1 + interval, interval)),
+            tstack([
+                DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES,
+                np.array(DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES) * 2
+            ]))
+
+        np.testing.assert_almost_equal(
+            sprague_interpolator(0.5),
+            sprague_interpolator([0.5])[0])
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.SpragueInterpolator.__call__`
@@ -1089,6 +1127,70 @@ table_interpolation_trilinear` definition.
                 [0.59220355, 0.93136492, 0.30063692],
             ]))
 
+    def test_interpolation_trilinear_tiles(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition consistency across tiles.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(64, random_state=prng)
+        V_xyz = np.reshape(V_xyz, (4, 16, 3))
+
+        V_o = table_interpolation_trilinear(V_xyz, LUT_TABLE)
+
+        tile_size = colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE
+        try:
+            colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE = 5
+
+            np.testing.assert_almost_equal(
+                table_interpolation_trilinear(V_xyz, LUT_TABLE),
+                V_o,
+                decimal=12)
+        finally:
+            colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE = (
+                tile_size)
+
+        np.testing.assert_almost_equal(
+            np.reshape(
+                table_interpolation_trilinear(
+                    np.reshape(V_xyz, (-1, 3)), LUT_TABLE), V_xyz.shape),
+            V_o,
+            decimal=12)
+
+    def test_dtype_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition output dtype.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(16, random_state=prng)
+
+        V_o = table_interpolation_trilinear(V_xyz, LUT_TABLE)
+        self.assertEqual(V_o.dtype, np.float64)
+
+        V_o_f32 = table_interpolation_trilinear(
+            V_xyz.astype(np.float32), LUT_TABLE)
+        self.assertEqual(V_o_f32.dtype, np.float32)
+
+        np.testing.assert_allclose(V_o_f32, V_o, atol=1e-6)
+
+    @ignore_numpy_errors
+    def test_nan_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition nan support.
+        """
+
+        V_o = table_interpolation_trilinear(
+            np.array([[np.nan, 0.5, 0.5], [0.5, 0.5, 0.5]]), LUT_TABLE)
+
+        self.assertTrue(np.all(np.isnan(V_o[0])))
+        self.assertTrue(np.all(np.isfinite(V_o[1])))
+
 
 class TestTableInterpolationTetrahedral(unittest.TestCase):
     """
@@ -1127,6 +1229,70 @@ table_interpolation_tetrahedral` definition.
                 [0.61272658, 0.92799297, 0.29650424],
             ]))
 
+    def test_interpolation_tetrahedral_tiles(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition consistency across tiles.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(64, random_state=prng)
+        V_xyz = np.reshape(V_xyz, (4, 16, 3))
+
+        V_o = table_interpolation_tetrahedral(V_xyz, LUT_TABLE)
+
+        tile_size = colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE
+        try:
+            colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE = 5
+
+            np.testing.assert_almost_equal(
+                table_interpolation_tetrahedral(V_xyz, LUT_TABLE),
+                V_o,
+                decimal=12)
+        finally:
+            colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE = (
+                tile_size)
+
+        np.testing.assert_almost_equal(
+            np.reshape(
+                table_interpolation_tetrahedral(
+                    np.reshape(V_xyz, (-1, 3)), LUT_TABLE), V_xyz.shape),
+            V_o,
+            decimal=12)
+
+    def test_dtype_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition output dtype.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(16, random_state=prng)
+
+        V_o = table_interpolation_tetrahedral(V_xyz, LUT_TABLE)
+        self.assertEqual(V_o.dtype, np.float64)
+
+        V_o_f32 = table_interpolation_tetrahedral(
+            V_xyz.astype(np.float32), LUT_TABLE)
+        self.assertEqual(V_o_f32.dtype, np.float32)
+
+        np.testing.assert_allclose(V_o_f32, V_o, atol=1e-6)
+
+    @ignore_numpy_errors
+    def test_nan_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition nan support.
+        """
+
+        V_o = table_interpolation_tetrahedral(
+            np.array([[np.nan, 0.5, 0.5], [0.5, 0.5, 0.5]]), LUT_TABLE)
+
+        self.assertTrue(np.all(np.isnan(V_o[0])))
+        self.assertTrue(np.all(np.isfinite(V_o[1])))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -26,7 +26,9 @@ References
 """
 
 import numpy as np
+from scipy.signal import lfilter
 
+from colour.algebra import stencil_filter
 from colour.utilities import CaseInsensitiveMapping, validate_method
 
 __author__ = 'Colour Developers'
@@ -51,13 +53,20 @@ def bandpass_correction_Stearns1988(sd):
 
     Parameters
     ----------
-    sd : SpectralDistribution
-        Spectral distribution.
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions.
 
     Returns
     -------
-    SpectralDistribution
-        Spectral bandpass dependence corrected spectral distribution.
+    SpectralDistribution or MultiSpectralDistributions
+        Spectral bandpass dependence corrected spectral distribution or
+        multi-spectral distributions.
+
+    Notes
+    -----
+    -   The correction of a given value uses the already corrected preceding
+        value, the intermediate values are thus computed with a first order
+        recursive filter applied to all the spectral distributions at once.
 
     References
     ----------
@@ -90,17 +99,24 @@ def bandpass_correction_Stearns1988(sd):
                          extrapolator_kwargs={...})
     """
 
-    values = np.copy(sd.values)
-    values[0] = (1 + CONSTANT_ALPHA_STEARNS
-                 ) * values[0] - CONSTANT_ALPHA_STEARNS * values[1]
-    values[-1] = (1 + CONSTANT_ALPHA_STEARNS
-                  ) * values[-1] - CONSTANT_ALPHA_STEARNS * values[-2]
-    for i in range(1, len(values) - 1):
-        values[i] = (-CONSTANT_ALPHA_STEARNS * values[i - 1] +
-                     (1 + 2 * CONSTANT_ALPHA_STEARNS) * values[i] -
-                     CONSTANT_ALPHA_STEARNS * values[i + 1])
-
-    sd.values = values
+    alpha = CONSTANT_ALPHA_STEARNS
+
+    values = np.transpose(sd.values)
+
+    values_f = stencil_filter(values[..., :2], [1 + alpha, -alpha])
+    values_l = stencil_filter(values[..., -2:], [-alpha, 1 + alpha])
+
+    values_i = values[..., 1:-1]
+    if values_i.shape[-1] != 0:
+        values_i = lfilter(
+            [1], [1, alpha],
+            stencil_filter(
+                np.concatenate([values_i, values_l], axis=-1),
+                [1 + 2 * alpha, -alpha]),
+            zi=-alpha * values_f)[0]
+
+    sd.values = np.transpose(
+        np.concatenate([values_f, values_i, values_l], axis=-1))
 
     return sd
 
@@ -11,6 +11,7 @@ Defines the classes and objects handling spectral data computations:
 -   :class:`colour.MultiSpectralDistributions`
 -   :func:`colour.colorimetry.sds_and_msds_to_sds`
 -   :func:`colour.colorimetry.sds_and_msds_to_msds`
+-   :func:`colour.colorimetry.resampling_operator`
 
 References
 ----------
@@ -25,14 +26,17 @@ References
 """
 
 import numpy as np
+import scipy.sparse
+from fractions import Fraction
+from math import ceil, floor, gcd
 
 from colour.algebra import (Extrapolator, CubicSplineInterpolator,
-                            SpragueInterpolator)
+                            LinearInterpolator, SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal, MultiSignals
-from colour.utilities import (as_float, as_int, first_item, is_iterable,
-                              is_numeric, is_string, is_uniform, interval,
-                              runtime_warning, tstack)
+from colour.utilities import (LRUCache, as_float, as_int, is_iterable,
+                              is_numeric, is_string, interval, runtime_warning,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -43,9 +47,54 @@ __status__ = 'Production'
 
 __all__ = [
     'SpectralShape', 'SPECTRAL_SHAPE_DEFAULT', 'SpectralDistribution',
-    'MultiSpectralDistributions', 'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
+    'MultiSpectralDistributions', 'sds_and_msds_to_sds',
+    'sds_and_msds_to_msds', 'resampling_operator'
 ]
 
+_CACHE_RESAMPLING_OPERATORS = LRUCache(
+    'colour.colorimetry.spectrum._CACHE_RESAMPLING_OPERATORS',
+    maximum_size=256,
+    maximum_nbytes=2 ** 26)
+
+SPECTRAL_SHAPE_MAXIMUM_DENOMINATOR = 10 ** 6
+"""
+Maximum denominator of the rational numbers representing the spectral shape
+*start*, *end* and *interval* attributes, i.e. the finest sub-nanometre unit
+used to generate the spectral shape range exactly.
+
+SPECTRAL_SHAPE_MAXIMUM_DENOMINATOR : int
+"""
+
+_LINEAR_INTERPOLATORS = (SpragueInterpolator, LinearInterpolator)
+"""
+Interpolator classes whose output is a linear combination of the :math:`y`
+dependent variable values neighbouring the evaluation point, i.e. that can be
+expressed with a sparse resampling operator.
+
+_LINEAR_INTERPOLATORS : tuple
+"""
+
+_OPERATOR_STENCIL_RADIUS = 7
+"""
+Radius in samples, around the evaluation point, of the stencil of the
+:attr:`colour.colorimetry.spectrum._LINEAR_INTERPOLATORS` attribute
+interpolators and of the :class:`colour.Extrapolator` class, e.g. *Sprague
+(1880)* interpolation uses the 6 neighbouring samples or the 6 first or last
+samples at the boundaries.
+
+_OPERATOR_STENCIL_RADIUS : int
+"""
+
+_OPERATOR_MINIMUM_DISTRIBUTIONS = 16
+"""
+Minimum number of multi-spectral distributions resampled with a sparse
+operator, fewer distributions, e.g. colour matching functions or a single
+spectral distribution, are resampled directly with the interpolator so that
+the values rounding is exactly that of the interpolator.
+
+_OPERATOR_MINIMUM_DISTRIBUTIONS : int
+"""
+
 
 class SpectralShape:
     """
@@ -80,6 +129,15 @@ class SpectralShape:
     -   :meth:`~colour.SpectralShape.__ne__`
     -   :meth:`~colour.SpectralShape.range`
 
+    Notes
+    -----
+    -   The spectral shape *start*, *end* and *interval* attributes are
+        represented with rational numbers whose denominator does not exceed
+        :attr:`colour.colorimetry.spectrum.\
+SPECTRAL_SHAPE_MAXIMUM_DENOMINATOR` attribute value: fractional intervals,
+        e.g. 0.1nm, are supported exactly and equal spectral shapes have the
+        same hash.
+
     Examples
     --------
     >>> SpectralShape(360, 830, 1)
@@ -88,6 +146,7 @@ class SpectralShape:
 
     def __init__(self, start=None, end=None, interval=None):
         self._range = None
+        self._fractions = None
 
         self._start = None
         self._end = None
@@ -133,6 +192,7 @@ class SpectralShape:
         # Invalidating the *range* cache.
         if value != self._start:
             self._range = None
+            self._fractions = None
 
         self._start = value
 
@@ -173,6 +233,7 @@ class SpectralShape:
         # Invalidating the *range* cache.
         if value != self._end:
             self._range = None
+            self._fractions = None
 
         self._end = value
 
@@ -208,6 +269,7 @@ class SpectralShape:
         # Invalidating the *range* cache.
         if value != self._interval:
             self._range = None
+            self._fractions = None
 
         self._interval = value
 
@@ -283,7 +345,7 @@ class SpectralShape:
             Object hash.
         """
 
-        return hash(repr(self))
+        return hash(self._as_fractions())
 
     def __iter__(self):
         """
@@ -312,7 +374,7 @@ class SpectralShape:
         10.0
         """
 
-        return iter(self.range())
+        return iter(self._cached_range())
 
     def __contains__(self, wavelength):
         """
@@ -348,7 +410,7 @@ class SpectralShape:
         return np.all(
             np.in1d(
                 np.around(wavelength / tolerance).astype(np.int64),
-                np.around(self.range() / tolerance).astype(np.int64)))
+                np.around(self._cached_range() / tolerance).astype(np.int64)))
 
     def __len__(self):
         """
@@ -365,7 +427,7 @@ class SpectralShape:
         101
         """
 
-        return len(self.range())
+        return len(self._cached_range())
 
     def __eq__(self, shape):
         """
@@ -387,10 +449,12 @@ class SpectralShape:
         True
         >>> SpectralShape(0, 10, 0.1) == SpectralShape(0, 10, 1)
         False
+        >>> SpectralShape(0, 10, 1) == SpectralShape(0.0, 10.0, 1.0)
+        True
         """
 
         return (isinstance(shape, self.__class__) and
-                np.array_equal(self.range(), shape.range()))
+                self._as_fractions() == shape._as_fractions())
 
     def __ne__(self, shape):
         """
@@ -420,6 +484,10 @@ class SpectralShape:
         """
         Returns an iterable range for the spectral shape.
 
+        The range is generated exactly, i.e. each wavelength is computed in
+        integer sub-nanometre units and rounded once, and cached until the
+        spectral shape is modified, a copy of the cached range is returned.
+
         Parameters
         ----------
         dtype : type
@@ -456,28 +524,76 @@ class SpectralShape:
         if dtype is None:
             dtype = DEFAULT_FLOAT_DTYPE
 
+        return self._cached_range().astype(dtype)
+
+    def _cached_range(self):
+        """
+        Returns the cached read-only range for the spectral shape, generating
+        it if required.
+
+        Returns
+        -------
+        ndarray
+            Read-only range for the spectral distribution shape.
+        """
+
         if None in (self._start, self._end, self._interval):
             raise RuntimeError(('One of the spectral shape "start", "end" or '
                                 '"interval" attributes is not defined!'))
 
         if self._range is None:
-            samples = as_int(
-                round((self._interval + self._end - self._start) /
-                      self._interval))
-            range_, current_interval = np.linspace(
-                self._start, self._end, samples, retstep=True, dtype=dtype)
+            start, end, interval = self._as_fractions()
 
-            self._range = range_
+            samples = (end - start) / interval
+            if samples.denominator == 1:
+                # Generating the range in integer sub-nanometre units.
+                d_s, d_i = start.denominator, interval.denominator
+                denominator = d_s * d_i // gcd(d_s, d_i)
 
-            if current_interval != self._interval:
-                self._interval = current_interval
-                runtime_warning(
-                    ('"{0}" shape could not be honoured, using '
-                     '"{1}"!').format((self._start, self._end, self._interval),
-                                      self))
+                indexes = np.arange(samples.numerator + 1, dtype=np.int64)
+                range_ = (int(start * denominator) +
+                          indexes * int(interval * denominator)) / denominator
+            else:
+                samples = as_int(
+                    round((self._interval + self._end - self._start) /
+                          self._interval))
+                range_, current_interval = np.linspace(
+                    self._start, self._end, samples, retstep=True)
+
+                runtime_warning(('"{0}" shape could not be honoured, using '
+                                 '"{1}"!').format(
+                                     self,
+                                     SpectralShape(self._start, self._end,
+                                                   current_interval)))
+
+            range_ = range_.astype(DEFAULT_FLOAT_DTYPE)
+            range_.setflags(write=False)
+
+            self._range = range_
 
         return self._range
 
+    def _as_fractions(self):
+        """
+        Returns the spectral shape *start*, *end* and *interval* attributes as
+        rational numbers.
+
+        Returns
+        -------
+        tuple
+            Spectral shape *start*, *end* and *interval* attributes rational
+            numbers, undefined attributes are returned as is.
+        """
+
+        if self._fractions is None:
+            self._fractions = tuple(
+                Fraction(float(value)).limit_denominator(
+                    SPECTRAL_SHAPE_MAXIMUM_DENOMINATOR)
+                if value is not None else value
+                for value in (self._start, self._end, self._interval))
+
+        return self._fractions
+
 
 SPECTRAL_SHAPE_DEFAULT = SpectralShape(360, 780, 1)
 """
@@ -487,6 +603,38 @@ SPECTRAL_SHAPE_DEFAULT : SpectralShape
 """
 
 
+def _wavelengths_intervals(wavelengths):
+    """
+    Returns the unique intervals of given wavelengths, as the nearest rational
+    numbers with a denominator lower than
+    :attr:`colour.colorimetry.spectrum.SPECTRAL_SHAPE_MAXIMUM_DENOMINATOR`
+    attribute, i.e. the wavelengths of a spectral shape range have a single
+    interval equal to the spectral shape interval.
+
+    Parameters
+    ----------
+    wavelengths : array_like
+        Wavelengths to return the unique intervals of.
+
+    Returns
+    -------
+    ndarray
+        Wavelengths unique intervals.
+
+    Examples
+    --------
+    >>> _wavelengths_intervals(SpectralShape(360, 830, 0.1).range())
+    array([ 0.1])
+    """
+
+    return np.unique([
+        float(
+            Fraction(float(value)).limit_denominator(
+                SPECTRAL_SHAPE_MAXIMUM_DENOMINATOR))
+        for value in interval(wavelengths)
+    ])
+
+
 class SpectralDistribution(Signal):
     """
     Defines the spectral distribution: the base object for spectral
@@ -542,6 +690,7 @@ dict_like, optional
     Methods
     -------
     -   :meth:`~colour.SpectralDistribution.__init__`
+    -   :meth:`~colour.SpectralDistribution.is_uniform`
     -   :meth:`~colour.SpectralDistribution.interpolate`
     -   :meth:`~colour.SpectralDistribution.extrapolate`
     -   :meth:`~colour.SpectralDistribution.align`
@@ -617,7 +766,8 @@ dict_like, optional
                   if isinstance(domain, SpectralShape) else domain)
         domain, range_ = self.signal_unpack_data(data, domain)
 
-        uniform = is_uniform(domain) if domain is not None else True
+        uniform = (_wavelengths_intervals(domain).size == 1
+                   if domain is not None else True)
 
         # Initialising with *CIE 15:2004* and *CIE 167:2005* recommendations
         # defaults.
@@ -768,7 +918,7 @@ dict_like, optional
         SpectralShape(500.0, 600.0, 10.0)
         """
 
-        wavelengths_interval = interval(self.wavelengths)
+        wavelengths_interval = _wavelengths_intervals(self.wavelengths)
         if wavelengths_interval.size != 1:
             runtime_warning(('"{0}" spectral distribution is not uniform, '
                              'using minimum interval!'.format(self.name)))
@@ -777,6 +927,28 @@ dict_like, optional
             min(self.wavelengths), max(self.wavelengths),
             as_float(min(wavelengths_interval)))
 
+    def is_uniform(self):
+        """
+        Returns if the spectral distribution has a uniformly spaced
+        independent variable.
+
+        The wavelengths intervals are compared as rational numbers, thus the
+        wavelengths of a spectral shape range are uniformly spaced.
+
+        Returns
+        -------
+        bool
+            Is the spectral distribution uniform.
+
+        Examples
+        --------
+        >>> shape = SpectralShape(360, 830, 0.1)
+        >>> SpectralDistribution(np.ones(len(shape)), shape).is_uniform()
+        True
+        """
+
+        return _wavelengths_intervals(self.wavelengths).size == 1
+
     def interpolate(self, shape, interpolator=None, interpolator_kwargs=None):
         """
         Interpolates the spectral distribution in-place according to
@@ -1070,48 +1242,7 @@ dict_like, optional
          [ 600.            0.136    ...]]
         """
 
-        self_shape = self.shape
-        s_e_i = zip((shape.start, shape.end, shape.interval),
-                    (self_shape.start, self_shape.end, self_shape.interval))
-        shape = SpectralShape(
-            *[x[0] if x[0] is not None else x[1] for x in s_e_i])
-        # Defining proper interpolation bounds.
-        # TODO: Provide support for fractional interval like 0.1, etc...
-        if (round(self_shape.start) != self_shape.start or
-                round(self_shape.end) != self_shape.end):
-            runtime_warning(
-                'Fractional bound encountered, rounding will occur!')
-
-        shape.start = max(shape.start, np.ceil(self_shape.start))
-        shape.end = min(shape.end, np.floor(self_shape.end))
-
-        if interpolator is None:
-            # User has specifically chosen the interpolator thus it is used
-            # instead of those from *CIE 167:2005* recommendation.
-            if self.interpolator not in (SpragueInterpolator,
-                                         CubicSplineInterpolator):
-                interpolator = self.interpolator
-            elif self.is_uniform():
-                interpolator = SpragueInterpolator
-            else:
-                interpolator = CubicSplineInterpolator
-
-        if interpolator_kwargs is None:
-            # User has specifically chosen the interpolator thus its keyword
-            # arguments are used.
-            if self.interpolator not in (SpragueInterpolator,
-                                         CubicSplineInterpolator):
-                interpolator_kwargs = self.interpolator_kwargs
-            else:
-                interpolator_kwargs = {}
-
-        interpolator = interpolator(self.wavelengths, self.values,
-                                    **interpolator_kwargs)
-
-        self.domain = shape.range()
-        self.range = interpolator(self.domain)
-
-        return self
+        return _interpolate(self, shape, interpolator, interpolator_kwargs)
 
     def extrapolate(self, shape, extrapolator=None, extrapolator_kwargs=None):
         """
@@ -1555,6 +1686,7 @@ MultiSpectralDistributions or array_like or dict_like, optional
     Methods
     -------
     -   :meth:`~colour.MultiSpectralDistributions.__init__`
+    -   :meth:`~colour.MultiSpectralDistributions.is_uniform`
     -   :meth:`~colour.MultiSpectralDistributions.interpolate`
     -   :meth:`~colour.MultiSpectralDistributions.extrapolate`
     -   :meth:`~colour.MultiSpectralDistributions.align`
@@ -1651,10 +1783,11 @@ MultiSpectralDistributions or array_like or dict_like, optional
     def __init__(self, data=None, domain=None, labels=None, **kwargs):
         domain = (domain.range()
                   if isinstance(domain, SpectralShape) else domain)
-        signals = self.multi_signals_unpack_data(data, domain, labels)
+        domain, range_, labels = self._multi_signals_unpack_data(
+            data, domain, labels)
 
-        domain = signals[list(signals.keys())[0]].domain if signals else None
-        uniform = is_uniform(domain) if domain is not None else True
+        uniform = (_wavelengths_intervals(domain).size == 1
+                   if domain is not None else True)
 
         # Initialising with *CIE 15:2004* and *CIE 167:2005* recommendations
         # defaults.
@@ -1671,7 +1804,7 @@ MultiSpectralDistributions or array_like or dict_like, optional
         })
 
         super(MultiSpectralDistributions, self).__init__(
-            signals, domain, signal_type=SpectralDistribution, **kwargs)
+            range_, domain, labels, signal_type=SpectralDistribution, **kwargs)
 
         self._strict_name = None
         self.strict_name = kwargs.get('strict_name')
@@ -1854,8 +1987,39 @@ MultiSpectralDistributions or array_like or dict_like, optional
         SpectralShape(500.0, 560.0, 1.0)
         """
 
-        if self.signals:
-            return first_item(self._signals.values()).shape
+        if self.labels:
+            wavelengths_interval = _wavelengths_intervals(self.wavelengths)
+            if wavelengths_interval.size != 1:
+                runtime_warning(
+                    ('"{0}" multi-spectral distributions is not uniform, '
+                     'using minimum interval!'.format(self.name)))
+
+            return SpectralShape(
+                min(self.wavelengths), max(self.wavelengths),
+                as_float(min(wavelengths_interval)))
+
+    def is_uniform(self):
+        """
+        Returns if the multi-spectral distributions have a uniformly spaced
+        independent variable.
+
+        The wavelengths intervals are compared as rational numbers, thus the
+        wavelengths of a spectral shape range are uniformly spaced.
+
+        Returns
+        -------
+        bool
+            Are the multi-spectral distributions uniform.
+
+        Examples
+        --------
+        >>> shape = SpectralShape(360, 830, 0.1)
+        >>> MultiSpectralDistributions(
+        ...     np.ones([len(shape), 3]), shape).is_uniform()
+        True
+        """
+
+        return _wavelengths_intervals(self.wavelengths).size == 1
 
     def interpolate(self, shape, interpolator=None, interpolator_kwargs=None):
         """
@@ -2067,10 +2231,9 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.interpolate(shape, interpolator, interpolator_kwargs)
-
-        return self
+        # All the spectral distributions are interpolated at once.
+        return _interpolate(self, shape, interpolator, interpolator_kwargs,
+                            self._instantiate_interpolator)
 
     def extrapolate(self, shape, extrapolator=None, extrapolator_kwargs=None):
         """
@@ -2146,8 +2309,47 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 700.         0.5945     0.995      0.0039 ]]
         """
 
-        for signal in self.signals.values():
-            signal.extrapolate(shape, extrapolator, extrapolator_kwargs)
+        self_shape = self.shape
+        wavelengths = np.hstack([
+            np.arange(shape.start, self_shape.start, self_shape.interval),
+            np.arange(self_shape.end + self_shape.interval,
+                      shape.end + self_shape.interval, self_shape.interval)
+        ])
+
+        if extrapolator is None:
+            extrapolator = Extrapolator
+
+        if extrapolator_kwargs is None:
+            extrapolator_kwargs = {
+                'method': 'Constant',
+                'left': None,
+                'right': None
+            }
+
+        if (extrapolator is Extrapolator and
+                extrapolator_kwargs.get('left') is None and
+                extrapolator_kwargs.get('right') is None and
+                _is_operator_resampled(self)):
+            values = _extrapolating_operator(
+                self_shape, shape, extrapolator_kwargs).dot(self.values)
+
+            self.domain = np.sort(np.hstack([self.domain, wavelengths]))
+            self.range = values
+
+            return self
+
+        self_extrapolator = self.extrapolator
+        self_extrapolator_kwargs = self.extrapolator_kwargs
+
+        self.extrapolator = extrapolator
+        self.extrapolator_kwargs = extrapolator_kwargs
+
+        # The following self-assignment is written as intended and triggers the
+        # extrapolation.
+        self[wavelengths] = self[wavelengths]
+
+        self.extrapolator = self_extrapolator
+        self.extrapolator_kwargs = self_extrapolator_kwargs
 
         return self
 
@@ -2286,9 +2488,8 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 565.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.align(shape, interpolator, interpolator_kwargs,
-                         extrapolator, extrapolator_kwargs)
+        self.interpolate(shape, interpolator, interpolator_kwargs)
+        self.extrapolate(shape, extrapolator, extrapolator_kwargs)
 
         return self
 
@@ -2366,8 +2567,17 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.trim(shape)
+        start = max(shape.start, self.shape.start)
+        end = min(shape.end, self.shape.end)
+
+        indexes = np.where(
+            np.logical_and(self.domain >= start, self.domain <= end))
+
+        wavelengths = self.wavelengths[indexes]
+        values = self.values[indexes]
+
+        self.wavelengths = wavelengths
+        self.values = values
 
         return self
 
@@ -2415,8 +2625,7 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            1.       ...    1.       ...    0.0143382...]]
         """
 
-        for signal in self.signals.values():
-            signal.normalise(factor)
+        self *= 1 / np.max(self.values, axis=0)[np.newaxis, :] * factor
 
         return self
 
@@ -2472,7 +2681,6 @@ MultiSpectralDistributions or array_like or dict_like, optional
 
         sds = []
         for i, signal in enumerate(self.signals.values()):
-            signal = signal.copy()
             signal.strict_name = (None if self.strict_labels is None else
                                   str(self.strict_labels[i]))
             sds.append(signal)
@@ -2659,3 +2867,321 @@ def sds_and_msds_to_msds(sds):
             tstack(values), shape.range(), labels, strict_labels=strict_labels)
 
     return msds
+
+
+def _interpolate(distribution,
+                 shape,
+                 interpolator=None,
+                 interpolator_kwargs=None,
+                 instantiate_interpolator=None):
+    """
+    Interpolates given spectral distribution or multi-spectral distributions
+    in-place, see :meth:`colour.SpectralDistribution.interpolate` method for
+    the interpolator selection logic.
+
+    Parameters
+    ----------
+    distribution : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions to interpolate.
+    shape : SpectralShape
+        Spectral shape used for interpolation.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+    instantiate_interpolator : callable, optional
+        Callable instantiating the interpolator class with the wavelengths,
+        values and interpolator keyword arguments, default to calling the
+        interpolator class.
+
+    Returns
+    -------
+    SpectralDistribution or MultiSpectralDistributions
+        Interpolated spectral distribution or multi-spectral distributions.
+    """
+
+    distribution_shape = distribution.shape
+    s_e_i = zip((shape.start, shape.end, shape.interval),
+                (distribution_shape.start, distribution_shape.end,
+                 distribution_shape.interval))
+    shape = SpectralShape(*[x[0] if x[0] is not None else x[1] for x in s_e_i])
+    # Defining proper interpolation bounds.
+    shape.boundaries = _interpolation_boundaries(distribution_shape, shape)
+
+    if interpolator is None:
+        # User has specifically chosen the interpolator thus it is used
+        # instead of those from *CIE 167:2005* recommendation.
+        if distribution.interpolator not in (SpragueInterpolator,
+                                             CubicSplineInterpolator):
+            interpolator = distribution.interpolator
+        elif distribution.is_uniform():
+            interpolator = SpragueInterpolator
+        else:
+            interpolator = CubicSplineInterpolator
+
+    if interpolator_kwargs is None:
+        # User has specifically chosen the interpolator thus its keyword
+        # arguments are used.
+        if distribution.interpolator not in (SpragueInterpolator,
+                                             CubicSplineInterpolator):
+            interpolator_kwargs = distribution.interpolator_kwargs
+        else:
+            interpolator_kwargs = {}
+
+    if (interpolator in _LINEAR_INTERPOLATORS and
+            _is_operator_resampled(distribution)):
+        values = resampling_operator(distribution_shape, shape, interpolator,
+                                     interpolator_kwargs).dot(
+                                         distribution.values)
+
+        distribution.domain = shape.range()
+        distribution.range = values
+
+        return distribution
+
+    if instantiate_interpolator is None:
+        interpolator = interpolator(distribution.wavelengths,
+                                    distribution.values, **interpolator_kwargs)
+    else:
+        interpolator = instantiate_interpolator(
+            interpolator, distribution.wavelengths, distribution.values,
+            **interpolator_kwargs)
+
+    distribution.domain = shape.range()
+    distribution.range = interpolator(distribution.domain)
+
+    return distribution
+
+
+def _interpolation_boundaries(shape_source, shape_target):
+    """
+    Returns the boundaries of given target spectral shape clipped to given
+    source spectral shape boundaries.
+
+    The source boundaries are rounded, inwards, to the resolution of the
+    target interval, e.g. integers for a *1nm* or *5nm* interval and a single
+    decimal for a *0.1nm* interval.
+
+    Parameters
+    ----------
+    shape_source : SpectralShape
+        Spectral shape of the values to interpolate.
+    shape_target : SpectralShape
+        Spectral shape to interpolate the values to.
+
+    Returns
+    -------
+    tuple
+        Target spectral shape boundaries.
+    """
+
+    start, end, interval = shape_target._as_fractions()
+    start_s, end_s = shape_source._as_fractions()[:2]
+
+    resolution = Fraction(1, interval.denominator)
+
+    start_s = ceil(start_s / resolution) * resolution
+    # Drifting source boundaries must not be exceeded.
+    if float(start_s) < shape_source.start:
+        start_s += resolution
+
+    end_s = floor(end_s / resolution) * resolution
+    if float(end_s) > shape_source.end:
+        end_s -= resolution
+
+    return float(max(start, start_s)), float(min(end, end_s))
+
+
+def _is_operator_resampled(distribution):
+    """
+    Returns whether given spectral distribution or multi-spectral distributions
+    are resampled with a sparse operator, i.e. whether they are uniform
+    multi-spectral distributions with at least
+    :attr:`colour.colorimetry.spectrum._OPERATOR_MINIMUM_DISTRIBUTIONS`
+    attribute distributions.
+
+    Parameters
+    ----------
+    distribution : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions to resample.
+
+    Returns
+    -------
+    bool
+        Whether given spectral distribution or multi-spectral distributions
+        are resampled with a sparse operator.
+    """
+
+    return (isinstance(distribution, MultiSignals) and
+            len(distribution.labels) >= _OPERATOR_MINIMUM_DISTRIBUTIONS and
+            distribution.is_uniform() and
+            len(distribution.shape) == len(distribution.domain))
+
+
+def _sparse_operator(function, wavelengths, x):
+    """
+    Returns the sparse operator of given linear function, whose stencil is
+    within :attr:`colour.colorimetry.spectrum._OPERATOR_STENCIL_RADIUS`
+    attribute samples of the evaluation points, built without evaluating the
+    function on the identity matrix.
+
+    Parameters
+    ----------
+    function : callable
+        Callable returning the function, e.g. an interpolator, of given
+        wavelengths and 2-dimensional values.
+    wavelengths : ndarray
+        Wavelengths of the values the operator is applied to.
+    x : ndarray
+        Points to evaluate the function at.
+
+    Returns
+    -------
+    csr_matrix
+        Sparse operator of shape :math:`(len(x), len(wavelengths))`.
+    """
+
+    count = len(wavelengths)
+    stencil = np.arange(-_OPERATOR_STENCIL_RADIUS,
+                        _OPERATOR_STENCIL_RADIUS + 1)
+
+    # The samples are partitioned into groups whose members are further apart
+    # than the stencil width, evaluating the function once per group with the
+    # indicator of its members then yields the weights of all of them.
+    groups = min(count, len(stencil))
+    indicators = (np.arange(count)[:, np.newaxis] %
+                  groups == np.arange(groups)).astype(DEFAULT_FLOAT_DTYPE)
+    weights = np.reshape(
+        function(wavelengths, indicators)(x), (len(x), groups))
+
+    columns = (np.clip(np.searchsorted(wavelengths, x), 0, count - 1)
+               [:, np.newaxis] + stencil)
+    rows = np.broadcast_to(np.arange(len(x))[:, np.newaxis], columns.shape)
+    valid = np.logical_and(columns >= 0, columns < count)
+    rows, columns = rows[valid], columns[valid]
+
+    data = weights[rows, columns % groups]
+    nonzero = data != 0
+
+    return scipy.sparse.csr_matrix(
+        (data[nonzero], (rows[nonzero], columns[nonzero])),
+        shape=(len(x), count))
+
+
+def resampling_operator(shape_source,
+                        shape_target,
+                        interpolator=SpragueInterpolator,
+                        interpolator_kwargs=None):
+    """
+    Returns the sparse resampling operator interpolating values sampled
+    according to given source spectral shape to given target spectral shape.
+
+    The operator only depends on the spectral shapes and interpolator, it is
+    thus computed once and cached: resampling any number of spectral
+    distributions is then a single sparse matrix product.
+
+    Parameters
+    ----------
+    shape_source : SpectralShape
+        Spectral shape of the values to interpolate.
+    shape_target : SpectralShape
+        Spectral shape to interpolate the values to, its range must be within
+        the boundaries of the source spectral shape.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function, either
+        :class:`colour.SpragueInterpolator` or
+        :class:`colour.LinearInterpolator`.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    csr_matrix
+        Read-only resampling operator of shape
+        :math:`(len(shape\\_target), len(shape\\_source))`.
+
+    Raises
+    ------
+    ValueError
+        If the interpolator is not supported.
+
+    Examples
+    --------
+    >>> operator = resampling_operator(
+    ...     SpectralShape(500, 600, 20), SpectralShape(500, 600, 10))
+    >>> operator.shape
+    (11, 6)
+    >>> values = np.array([0.0651, 0.0705, 0.0772, 0.0870, 0.1128, 0.1360])
+    >>> operator.dot(values)[1:8:2]  # doctest: +ELLIPSIS
+    array([ 0.0676692...,  0.0737808...,  0.0806671...,  0.0988081...])
+    """
+
+    if interpolator not in _LINEAR_INTERPOLATORS:
+        raise ValueError(
+            '"{0}" interpolator cannot be expressed with a sparse resampling '
+            'operator!'.format(getattr(interpolator, '__name__',
+                                       interpolator)))
+
+    if interpolator_kwargs is None:
+        interpolator_kwargs = {}
+
+    hash_key = tuple(
+        repr(item) for item in (shape_source, shape_target, interpolator,
+                                interpolator_kwargs))
+    operator = _CACHE_RESAMPLING_OPERATORS.get(hash_key)
+    if operator is not None:
+        return operator
+
+    operator = _sparse_operator(
+        lambda x, y: MultiSignals._instantiate_interpolator(
+            interpolator, x, y, **interpolator_kwargs),
+        shape_source.range(), shape_target.range())
+
+    return _CACHE_RESAMPLING_OPERATORS.set(hash_key, operator)
+
+
+def _extrapolating_operator(shape_source, shape_target, extrapolator_kwargs):
+    """
+    Returns the sparse operator extrapolating values sampled according to given
+    source spectral shape to given target spectral shape boundaries using the
+    :class:`colour.Extrapolator` class.
+
+    Parameters
+    ----------
+    shape_source : SpectralShape
+        Spectral shape of the values to extrapolate.
+    shape_target : SpectralShape
+        Spectral shape to extrapolate the values to.
+    extrapolator_kwargs : dict_like
+        Arguments to use when instantiating the extrapolating function, the
+        *left* and *right* arguments must be *None*.
+
+    Returns
+    -------
+    csr_matrix
+        Read-only extrapolating operator.
+    """
+
+    hash_key = tuple(
+        repr(item)
+        for item in (shape_source, shape_target, extrapolator_kwargs))
+    operator = _CACHE_RESAMPLING_OPERATORS.get(hash_key)
+    if operator is not None:
+        return operator
+
+    wavelengths = shape_source.range()
+
+    operator = _sparse_operator(
+        lambda x, y: Extrapolator(
+            MultiSignals._instantiate_interpolator(LinearInterpolator, x, y),
+            **extrapolator_kwargs),
+        wavelengths,
+        np.hstack([
+            np.arange(shape_target.start, shape_source.start,
+                      shape_source.interval), wavelengths,
+            np.arange(shape_source.end + shape_source.interval,
+                      shape_target.end + shape_source.interval,
+                      shape_source.interval)
+        ]))
+
+    return _CACHE_RESAMPLING_OPERATORS.set(hash_key, operator)
@@ -7,7 +7,9 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import (SpectralDistribution,
+                                MultiSpectralDistributions,
                                 bandpass_correction_Stearns1988)
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -54,6 +56,14 @@ bandpass_correction_Stearns1988` definition.
             bandpass_correction_Stearns1988(sd).values,
             DATA_BANDPASS_CORRECTED)
 
+        msds = MultiSpectralDistributions(
+            tstack([DATA_NON_BANDPASS_CORRECTED] * 3),
+            range(len(DATA_NON_BANDPASS_CORRECTED)))
+
+        np.testing.assert_almost_equal(
+            bandpass_correction_Stearns1988(msds).values,
+            tstack([DATA_BANDPASS_CORRECTED] * 3))
+
 
 if __name__ == '__main__':
     unittest.main()
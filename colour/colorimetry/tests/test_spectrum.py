@@ -8,9 +8,11 @@ import unittest
 import scipy
 from distutils.version import LooseVersion
 
+from colour.algebra import (CubicSplineInterpolator, LinearInterpolator,
+                            SpragueInterpolator)
 from colour.colorimetry.spectrum import (
     SpectralShape, SpectralDistribution, MultiSpectralDistributions,
-    sds_and_msds_to_sds, sds_and_msds_to_msds)
+    sds_and_msds_to_sds, sds_and_msds_to_msds, resampling_operator)
 from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
@@ -26,7 +28,7 @@ __all__ = [
     'DATA_STANDARD_OBSERVER_2_DEGREE_CIE1931', 'DATA_CMFS',
     'DATA_SAMPLE_ABRIDGED', 'DATA_MULTI_SAMPLE_ABRIDGED', 'TestSpectralShape',
     'TestSpectralDistribution', 'TestMultiSpectralDistributions',
-    'TestSdsAndMdsToSds', 'TestSdsAndMsdsToMsds'
+    'TestSdsAndMdsToSds', 'TestSdsAndMsdsToMsds', 'TestResamplingOperator'
 ]
 
 DATA_SAMPLE = {
@@ -1294,6 +1296,9 @@ class TestSpectralShape(unittest.TestCase):
 
         self.assertIsInstance(hash(SpectralShape(0, 10, 0.1)), int)
 
+        self.assertEqual(
+            hash(SpectralShape(0, 10, 1)), hash(SpectralShape(0.0, 10.0, 1.0)))
+
     def test__iter__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.SpectralShape.__iter__`
@@ -1334,6 +1339,9 @@ class TestSpectralShape(unittest.TestCase):
 
         self.assertEqual(SpectralShape(0, 10, 0.1), SpectralShape(0, 10, 0.1))
 
+        self.assertEqual(
+            SpectralShape(0, 10, 1), SpectralShape(0.0, 10.0, 1.0))
+
     def test__ne__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.SpectralShape.__ne__`
@@ -1352,6 +1360,26 @@ class TestSpectralShape(unittest.TestCase):
             [wavelength for wavelength in SpectralShape(0, 10, 0.1)],
             np.arange(0, 10 + 0.1, 0.1))
 
+        shape = SpectralShape(360, 830, 0.1)
+        np.testing.assert_equal(shape.range()[[0, 1, 3, 4700]],
+                                [360, 360.1, 360.3, 830])
+        self.assertEqual(shape.interval, 0.1)
+        range_ = shape.range()
+        self.assertIsNot(range_, shape.range())
+        range_[0] = 0
+        self.assertEqual(shape.range()[0], 360)
+
+        shape = SpectralShape(380, 780, 0.3)
+        hash_ = hash(shape)
+        self.assertEqual(len(shape), 1334)
+        self.assertEqual(shape.interval, 0.3)
+        self.assertEqual(hash(shape), hash_)
+        self.assertEqual(shape, SpectralShape(380, 780, 0.3))
+
+        shape = SpectralShape(380, 780.2, 0.3)
+        self.assertEqual(shape.range()[-1], 780.2)
+        self.assertEqual(shape.interval, 0.3)
+
     def test_raise_exception_range(self):
         """
         Tests :func:`colour.colorimetry.spectrum.SpectralShape.range` method
@@ -1396,8 +1424,8 @@ class TestSpectralDistribution(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ('__init__', 'interpolate', 'extrapolate', 'align',
-                            'trim', 'normalise')
+        required_methods = ('__init__', 'is_uniform', 'interpolate',
+                            'extrapolate', 'align', 'trim', 'normalise')
 
         for method in required_methods:
             self.assertIn(method, dir(SpectralDistribution))
@@ -1444,6 +1472,24 @@ SpectralDistribution.shape` attribute.
 
         self.assertEqual(self._sd.shape, SpectralShape(340, 820, 20))
 
+        shape = SpectralShape(360, 830, 0.1)
+        self.assertEqual(
+            SpectralDistribution(np.ones(len(shape)), shape).shape, shape)
+
+    def test_is_uniform(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+SpectralDistribution.is_uniform` method.
+        """
+
+        self.assertTrue(self._sd.is_uniform())
+
+        shape = SpectralShape(360, 830, 0.1)
+        self.assertTrue(
+            SpectralDistribution(np.ones(len(shape)), shape).is_uniform())
+
+        self.assertFalse(self._non_uniform_sd.is_uniform())
+
     def test__init__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.SpectralDistribution.__init__`
@@ -1600,8 +1646,9 @@ class TestMultiSpectralDistributions(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ('__init__', 'interpolate', 'extrapolate', 'align',
-                            'trim', 'normalise', 'to_sds')
+        required_methods = ('__init__', 'is_uniform', 'interpolate',
+                            'extrapolate', 'align', 'trim', 'normalise',
+                            'to_sds')
 
         for method in required_methods:
             self.assertIn(method, dir(MultiSpectralDistributions))
@@ -1661,6 +1708,26 @@ MultiSpectralDistributions.shape` attribute.
 
         self.assertEqual(self._msds.shape, SpectralShape(380, 780, 5))
 
+        shape = SpectralShape(360, 830, 0.1)
+        self.assertEqual(
+            MultiSpectralDistributions(np.ones([len(shape), 3]), shape).shape,
+            shape)
+
+    def test_is_uniform(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralDistributions.is_uniform` method.
+        """
+
+        self.assertTrue(self._msds.is_uniform())
+
+        shape = SpectralShape(360, 830, 0.1)
+        self.assertTrue(
+            MultiSpectralDistributions(np.ones([len(shape), 3]),
+                                       shape).is_uniform())
+
+        self.assertFalse(self._non_uniform_sample_msds.is_uniform())
+
     def test__init__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -1860,5 +1927,67 @@ class TestSdsAndMsdsToMsds(unittest.TestCase):
             decimal=7)
 
 
+class TestResamplingOperator(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.spectrum.resampling_operator`
+    definition unit tests methods.
+    """
+
+    def test_resampling_operator(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.resampling_operator`
+        definition.
+        """
+
+        shape_source = SpectralShape(340, 820, 20)
+        shape_target = SpectralShape(340, 820, 1)
+        values = np.array(list(DATA_SAMPLE.values()))
+
+        operator = resampling_operator(shape_source, shape_target)
+        self.assertTupleEqual(operator.shape, (481, 25))
+        self.assertLessEqual(operator.nnz, 6 * 481)
+        self.assertFalse(operator.data.flags.writeable)
+        self.assertIs(
+            resampling_operator(shape_source, shape_target), operator)
+
+        np.testing.assert_almost_equal(
+            operator.dot(values),
+            SpragueInterpolator(shape_source.range(),
+                                values)(shape_target.range()),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            operator.dot(tstack([values, values * 2])),
+            tstack([operator.dot(values),
+                    operator.dot(values) * 2]),
+            decimal=7)
+
+        operator = resampling_operator(shape_source, shape_target,
+                                       LinearInterpolator)
+        self.assertLessEqual(operator.nnz, 2 * 481)
+        np.testing.assert_almost_equal(
+            operator.dot(values),
+            np.interp(shape_target.range(), shape_source.range(), values),
+            decimal=7)
+
+        msds = MultiSpectralDistributions(
+            tstack([values * i for i in range(1, 17)]), shape_source.range())
+        sd = SpectralDistribution(values, shape_source.range())
+        np.testing.assert_almost_equal(
+            msds.interpolate(shape_target).values[..., -1],
+            sd.interpolate(shape_target).values * 16,
+            decimal=7)
+
+    def test_raise_exception_resampling_operator(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.resampling_operator`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, resampling_operator,
+                          SpectralShape(340, 820, 20),
+                          SpectralShape(340, 820, 1), CubicSplineInterpolator)
+
+
 if __name__ == '__main__':
     unittest.main()
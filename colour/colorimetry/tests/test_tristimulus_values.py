@@ -21,8 +21,8 @@ from colour.colorimetry import (
     adjust_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
     sd_to_XYZ, msds_to_XYZ_integration, msds_to_XYZ_ASTME308,
-    wavelength_to_XYZ)
-from colour.utilities import domain_range_scale
+    TristimulusKernel, wavelength_to_XYZ)
+from colour.utilities import as_float_array, domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -42,7 +42,7 @@ __all__ = [
     'TestAdjustTristimulusWeightingFactorsASTME308',
     'TestSd_to_XYZ_integration', 'TestSd_to_XYZ_ASTME308', 'TestSd_to_XYZ',
     'TestMsds_to_XYZ_integration', 'TestMsds_to_XYZ_ASTME308',
-    'TestWavelength_to_XYZ'
+    'TestTristimulusKernel', 'TestWavelength_to_XYZ'
 ]
 
 SD_SAMPLE = SpectralDistribution({
@@ -447,13 +447,14 @@ lagrange_coefficients_ASTME2022` definition.
             LAGRANGE_COEFFICIENTS_B,
             decimal=7)
 
-        # Testing that the cache returns a copy of the data.
+        # Testing that the cache returns read-only data.
         lagrange_coefficients = lagrange_coefficients_ASTME2022(10)
 
         np.testing.assert_almost_equal(
             lagrange_coefficients, LAGRANGE_COEFFICIENTS_A, decimal=7)
 
-        lagrange_coefficients *= 10
+        with self.assertRaises(ValueError):
+            lagrange_coefficients *= 10
 
         np.testing.assert_almost_equal(
             lagrange_coefficients_ASTME2022(10),
@@ -1012,13 +1013,14 @@ class TestSd_to_XYZ(unittest.TestCase):
         definition.
         """
 
-        # Testing that the cache returns a copy of the data.
+        # Testing that the cache returns read-only data.
         XYZ = sd_to_XYZ(self._sd, self._cmfs, self._A)
 
         np.testing.assert_almost_equal(
             XYZ, np.array([14.46372680, 10.85832950, 2.04663200]), decimal=7)
 
-        XYZ *= 10
+        with self.assertRaises(ValueError):
+            XYZ *= 10
 
         np.testing.assert_almost_equal(
             sd_to_XYZ(self._sd, self._cmfs, self._A),
@@ -1107,6 +1109,58 @@ msds_to_XYZ_ASTME308` definition.
             TVS_D65_ASTME308_K1_MSDS,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_ASTME308(
+                np.reshape(np.transpose(msds.values), [2, 6, -1]),
+                cmfs,
+                SDS_ILLUMINANTS['D65'],
+                shape=msds.shape),
+            np.reshape(TVS_D65_ASTME308_MSDS, [2, 6, 3]),
+            decimal=7)
+
+    def test_msds_to_XYZ_ASTME308_sd_to_XYZ_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus_values.\
+msds_to_XYZ_ASTME308` definition consistency with
+        :func:`colour.colorimetry.tristimulus_values.sd_to_XYZ_ASTME308`
+        definition.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        A = sd_CIE_standard_illuminant_A(cmfs.shape)
+        for shape in (SpectralShape(360, 830, 1), SpectralShape(400, 700, 5),
+                      SpectralShape(400, 700, 10), SpectralShape(360, 820,
+                                                                 20)):
+            msds = MSDS_TWO.copy().align(shape)
+            for kwargs in ({}, {
+                    'use_practice_range': False
+            }, {
+                    'mi_5nm_omission_method': False
+            }, {
+                    'mi_20nm_interpolation_method': False
+            }, {
+                    'k': 1
+            }):
+                XYZ = as_float_array([
+                    sd_to_XYZ_ASTME308(sd, cmfs, A, **kwargs)
+                    for sd in msds.to_sds()
+                ])
+
+                np.testing.assert_almost_equal(
+                    msds_to_XYZ_ASTME308(msds, cmfs, A, **kwargs),
+                    XYZ,
+                    decimal=7)
+
+                np.testing.assert_almost_equal(
+                    msds_to_XYZ_ASTME308(
+                        np.transpose(msds.values),
+                        cmfs,
+                        A,
+                        shape=shape,
+                        **kwargs),
+                    XYZ,
+                    decimal=7)
+
     def test_domain_range_scale_msds_to_XYZ_ASTME308(self):
         """
         Tests :func:`colour.colorimetry.tristimulus_values.\
@@ -1130,7 +1184,123 @@ msds_to_XYZ_ASTME308` definition domain and range scale support.
 msds_to_XYZ_ASTME308` definition raise exception.
         """
 
-        self.assertRaises(ValueError, msds_to_XYZ_ASTME308, DATA_TWO)
+        self.assertRaises(
+            ValueError,
+            msds_to_XYZ_ASTME308,
+            DATA_TWO,
+            shape=SpectralShape(400, 700, 60))
+
+
+class TestTristimulusKernel(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.tristimulus_values.TristimulusKernel`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('cmfs', 'illuminant', 'shape', 'method', 'k',
+                               'weights')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(TristimulusKernel))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(TristimulusKernel))
+
+    def test_weights(self):
+        """
+        Tests :attr:`colour.colorimetry.tristimulus_values.\
+TristimulusKernel.weights` property.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(400, 700, 20)
+        kernel = TristimulusKernel(cmfs, SDS_ILLUMINANTS['D65'], shape)
+
+        self.assertTupleEqual(kernel.weights.shape, (3, 16))
+        self.assertFalse(kernel.weights.flags.writeable)
+
+        np.testing.assert_almost_equal(
+            kernel(np.ones(16)), [95.04685733, 100.00000000, 108.88297345],
+            decimal=7)
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.colorimetry.tristimulus_values.\
+TristimulusKernel.__call__` method.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        msds = MSDS_TWO.copy().align(SpectralShape(400, 700, 20))
+
+        kernel = TristimulusKernel(cmfs, SDS_ILLUMINANTS['D65'], msds.shape)
+        np.testing.assert_almost_equal(
+            kernel(msds), TVS_D65_ASTME308_MSDS, decimal=7)
+
+        np.testing.assert_almost_equal(
+            kernel(np.reshape(np.transpose(msds.values), [2, 6, -1])),
+            np.reshape(TVS_D65_ASTME308_MSDS, [2, 6, 3]),
+            decimal=7)
+
+        kernel = TristimulusKernel(
+            cmfs, SDS_ILLUMINANTS['D65'], msds.shape, k=1)
+        np.testing.assert_almost_equal(
+            kernel(msds), TVS_D65_ASTME308_K1_MSDS, decimal=7)
+
+        kernel = TristimulusKernel(cmfs, SDS_ILLUMINANTS['D65'],
+                                   SpectralShape(400, 700, 60), 'Integration')
+        np.testing.assert_almost_equal(
+            kernel(DATA_TWO), TVS_D65_ARRAY_INTEGRATION, decimal=7)
+
+        A = sd_CIE_standard_illuminant_A(cmfs.shape)
+        for shape in (SpectralShape(360, 830, 1), SpectralShape(400, 700, 5),
+                      SpectralShape(400, 700, 10), SpectralShape(360, 820,
+                                                                 20)):
+            values = np.transpose(MSDS_TWO.copy().align(shape).values)
+            for kwargs in ({}, {
+                    'use_practice_range': False
+            }, {
+                    'mi_5nm_omission_method': False
+            }, {
+                    'mi_20nm_interpolation_method': False
+            }):
+                np.testing.assert_almost_equal(
+                    TristimulusKernel(cmfs, A, shape, **kwargs)(values),
+                    msds_to_XYZ_ASTME308(
+                        values, cmfs, A, shape=shape, **kwargs),
+                    decimal=7)
+
+            np.testing.assert_almost_equal(
+                TristimulusKernel(cmfs, A, shape, 'Integration')(values),
+                msds_to_XYZ_integration(values, cmfs, A, shape=shape),
+                decimal=7)
+
+    def test_domain_range_scale__call__(self):
+        """
+        Tests :meth:`colour.colorimetry.tristimulus_values.\
+TristimulusKernel.__call__` method domain and range scale support.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        msds = MSDS_TWO.copy().align(SpectralShape(400, 700, 20))
+        kernel = TristimulusKernel(cmfs, SDS_ILLUMINANTS['D65'], msds.shape)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    kernel(msds), TVS_D65_ASTME308_MSDS * factor, decimal=7)
 
 
 class TestWavelength_to_XYZ(unittest.TestCase):
@@ -17,6 +17,7 @@ sd_to_XYZ_tristimulus_weighting_factors_ASTME308`
 -   :func:`colour.colorimetry.msds_to_XYZ_ASTME308`
 -   :attr:`colour.MSDS_TO_XYZ_METHODS`
 -   :func:`colour.msds_to_XYZ`
+-   :class:`colour.colorimetry.TristimulusKernel`
 -   :func:`colour.wavelength_to_XYZ`
 
 The default implementation is based on practise *ASTM E308-15* method.
@@ -36,14 +37,15 @@ References
 
 import numpy as np
 
-from colour.algebra import lagrange_coefficients
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
+from colour.algebra import lagrange_coefficients, stencil_filter
+from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT, SpectralDistribution,
                                 MultiSpectralDistributions, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (
-    CaseInsensitiveMapping, as_float_array, filter_kwargs, from_range_100,
-    get_domain_range_scale, runtime_warning, tsplit, validate_method)
+from colour.utilities import (CaseInsensitiveMapping, LRUCache, as_float_array,
+                              domain_range_scale, filter_kwargs,
+                              from_range_100, get_domain_range_scale,
+                              runtime_warning, tsplit, validate_method)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -59,7 +61,7 @@ __all__ = [
     'sd_to_XYZ_tristimulus_weighting_factors_ASTME308', 'sd_to_XYZ_ASTME308',
     'SD_TO_XYZ_METHODS', 'sd_to_XYZ', 'msds_to_XYZ_integration',
     'msds_to_XYZ_ASTME308', 'MSDS_TO_XYZ_METHODS', 'msds_to_XYZ',
-    'wavelength_to_XYZ'
+    'TristimulusKernel', 'wavelength_to_XYZ'
 ]
 
 SPECTRAL_SHAPE_ASTME308 = SPECTRAL_SHAPE_DEFAULT
@@ -73,11 +75,20 @@ References
 SPECTRAL_SHAPE_ASTME308 : SpectralShape
 """
 
-_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = None
+_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = LRUCache(
+    'colour.colorimetry.tristimulus_values.'
+    '_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS',
+    maximum_size=64)
 
-_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = None
+_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = LRUCache(
+    'colour.colorimetry.tristimulus_values.'
+    '_CACHE_TRISTIMULUS_WEIGHTING_FACTORS',
+    maximum_size=256,
+    maximum_nbytes=2 ** 26)
 
-_CACHE_SD_TO_XYZ = None
+_CACHE_SD_TO_XYZ = LRUCache(
+    'colour.colorimetry.tristimulus_values._CACHE_SD_TO_XYZ',
+    maximum_size=2 ** 14)
 
 
 def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
@@ -129,13 +140,10 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
            [ 0.05...,  0.99..., -0.04...]])
     """
 
-    global _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS
-    if _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS is None:
-        _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = {}
-
     hash_key = tuple([hash(arg) for arg in (interval, interval_type)])
-    if hash_key in _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS:
-        return np.copy(_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key])
+    lica = _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS.get(hash_key)
+    if lica is not None:
+        return lica
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
@@ -145,9 +153,7 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
 
     lica = (as_float_array([lagrange_coefficients(r, d) for r in r_n]))
 
-    _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key] = np.copy(lica)
-
-    return lica
+    return _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS.set(hash_key, lica)
 
 
 def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
@@ -251,16 +257,13 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _CACHE_TRISTIMULUS_WEIGHTING_FACTORS
-    if _CACHE_TRISTIMULUS_WEIGHTING_FACTORS is None:
-        _CACHE_TRISTIMULUS_WEIGHTING_FACTORS = {}
-
     hash_key = tuple([
         hash(arg) for arg in (cmfs, illuminant, shape, k,
                               get_domain_range_scale())
     ])
-    if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
-        return np.copy(_CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key])
+    W = _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.get(hash_key)
+    if W is not None:
+        return W
 
     Y = cmfs.values
     S = illuminant.values
@@ -315,9 +318,7 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
 
     W *= 100 / np.sum(W, axis=0)[1] if k_n is None else k_n
 
-    _CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key] = np.copy(W)
-
-    return W
+    return _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.set(hash_key, W)
 
 
 def adjust_tristimulus_weighting_factors_ASTME308(W, shape_r, shape_t):
@@ -734,34 +735,18 @@ def sd_to_XYZ_ASTME308(
             cmfs = cmfs.copy().interpolate(SpectralShape(interval=5))
         method = sd_to_XYZ_integration
     elif sd.shape.interval == 20 and mi_20nm_interpolation_method:
-        sd = sd.copy()
         if sd.shape.boundaries != cmfs.shape.boundaries:
             runtime_warning(
                 'Trimming "{0}" spectral distribution shape to "{1}" '
                 'colour matching functions shape.'.format(
                     illuminant.name, cmfs.name))
-            sd.trim(cmfs.shape)
-
-        # Extrapolation of additional 20nm padding intervals.
-        sd.align(SpectralShape(sd.shape.start - 20, sd.shape.end + 20, 10))
-        for i in range(2):
-            sd[sd.wavelengths[i]] = (
-                    3 * sd.values[i + 2] -
-                    3 * sd.values[i + 4] + sd.values[i + 6])  # yapf: disable
-            i_e = len(sd.domain) - 1 - i
-            sd[sd.wavelengths[i_e]] = (
-                sd.values[i_e - 6] - 3 * sd.values[i_e - 4] +
-                3 * sd.values[i_e - 2])
-
-        # Interpolating every odd numbered values.
-        # TODO: Investigate code vectorisation.
-        for i in range(3, len(sd.domain) - 3, 2):
-            sd[sd.wavelengths[i]] = (
-                -0.0625 * sd.values[i - 3] + 0.5625 * sd.values[i - 1] +
-                0.5625 * sd.values[i + 1] - 0.0625 * sd.values[i + 3])
-
-        # Discarding the additional 20nm padding intervals.
-        sd.trim(SpectralShape(sd.shape.start + 20, sd.shape.end - 20, 10))
+            sd = sd.copy().trim(cmfs.shape)
+
+        shape = sd.shape
+        sd = SpectralDistribution(
+            _interpolate_20nm_ASTME308(sd.values),
+            SpectralShape(shape.start, shape.end, 10),
+            name=sd.name)
 
     XYZ = method(sd, cmfs, illuminant, k=k)
 
@@ -905,25 +890,20 @@ def sd_to_XYZ(
 
     method = validate_method(method, SD_TO_XYZ_METHODS)
 
-    global _CACHE_SD_TO_XYZ
-    if _CACHE_SD_TO_XYZ is None:
-        _CACHE_SD_TO_XYZ = {}
-
     hash_key = tuple([
         hash(arg) for arg in (sd, cmfs, illuminant, k, method,
                               tuple(kwargs.items()), get_domain_range_scale())
     ])
-    if hash_key in _CACHE_SD_TO_XYZ:
-        return np.copy(_CACHE_SD_TO_XYZ[hash_key])
+    XYZ = _CACHE_SD_TO_XYZ.get(hash_key)
+    if XYZ is not None:
+        return XYZ
 
     function = SD_TO_XYZ_METHODS[method]
 
     XYZ = function(
         sd, cmfs, illuminant, k=k, **filter_kwargs(function, **kwargs))
 
-    _CACHE_SD_TO_XYZ[hash_key] = np.copy(XYZ)
-
-    return XYZ
+    return _CACHE_SD_TO_XYZ.set(hash_key, XYZ)
 
 
 def msds_to_XYZ_integration(
@@ -1104,6 +1084,111 @@ def msds_to_XYZ_integration(
         return from_range_100(np.rollaxis(XYZ, 0, msds.ndim))
 
 
+def _trim_msds_array(R, shape, shape_t):
+    """
+    Trims given multi-spectral distributions array wavelengths to given
+    spectral shape, the wavelengths are expected to be in the last axis.
+
+    Parameters
+    ----------
+    R : ndarray
+        Multi-spectral distributions array.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral distributions array.
+    shape_t : SpectralShape
+        Spectral shape used for trimming.
+
+    Returns
+    -------
+    tuple
+        Trimmed multi-spectral distributions array and its spectral shape.
+    """
+
+    wavelengths = shape.range()
+    indexes = np.logical_and(wavelengths >= max(shape.start, shape_t.start),
+                             wavelengths <= min(shape.end, shape_t.end))
+    wavelengths = wavelengths[indexes]
+
+    return R[..., indexes], SpectralShape(wavelengths[0], wavelengths[-1],
+                                          shape.interval)
+
+
+def _align_msds_array(R, shape, shape_t, msds=None):
+    """
+    Aligns given multi-spectral distributions array to given spectral shape,
+    the wavelengths are expected to be in the last axis.
+
+    The alignment is performed with index arithmetic when both spectral shapes
+    share the same wavelengths grid, otherwise the array is aligned with the
+    :meth:`colour.MultiSpectralDistributions.align` method.
+
+    Parameters
+    ----------
+    R : ndarray
+        Multi-spectral distributions array.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral distributions array.
+    shape_t : SpectralShape
+        Spectral shape used for alignment.
+    msds : MultiSpectralDistributions, optional
+        Multi-spectral distributions the array has been extracted from, its
+        interpolation settings are used if the array needs to be interpolated.
+
+    Returns
+    -------
+    ndarray
+        Aligned multi-spectral distributions array.
+    """
+
+    wavelengths = shape.range()
+    indexes = (shape_t.range() - wavelengths[0]) / shape.interval
+    if (shape.interval == shape_t.interval and
+            np.allclose(indexes, np.around(indexes))):
+        # Interpolation is the identity on a shared wavelengths grid and the
+        # *Constant* extrapolation repeats the boundary values.
+        indexes = np.clip(
+            np.around(indexes).astype(DEFAULT_INT_DTYPE), 0,
+            len(wavelengths) - 1)
+
+        return R[..., indexes]
+
+    if msds is None:
+        msds = MultiSpectralDistributions(
+            np.transpose(np.reshape(R, (-1, R.shape[-1]))), wavelengths)
+
+    return np.reshape(
+        np.transpose(msds.copy().align(shape_t).values), R.shape[:-1] + (-1, ))
+
+
+def _interpolate_20nm_ASTME308(R):
+    """
+    Interpolates given 20 nm spectral data to 10 nm using practise
+    *ASTM E308-15* dedicated 20 nm interpolation method, a stack of spectral
+    data can be given, the wavelengths being in the last axis.
+
+    The first and last 20 nm padding intervals are extrapolated with the
+    third degree *Lagrange Coefficients* and every odd numbered value is
+    interpolated with the fourth degree *Lagrange Coefficients*.
+
+    Parameters
+    ----------
+    R : ndarray
+        20 nm spectral data.
+
+    Returns
+    -------
+    ndarray
+        10 nm spectral data.
+    """
+
+    R_i = np.zeros(R.shape[:-1] + (R.shape[-1] * 2 - 1, ))
+    R_i[..., ::2] = R
+    R_i[..., 1::2] = stencil_filter(R, [-0.0625, 0.5625, 0.5625, -0.0625],
+                                    [3, -3, 1], [1, -3, 3])
+
+    return R_i
+
+
 def msds_to_XYZ_ASTME308(
         msds,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -1112,7 +1197,8 @@ def msds_to_XYZ_ASTME308(
         use_practice_range=True,
         mi_5nm_omission_method=True,
         mi_20nm_interpolation_method=True,
-        k=None):
+        k=None,
+        shape=SPECTRAL_SHAPE_DEFAULT):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant according to practise
@@ -1121,7 +1207,9 @@ def msds_to_XYZ_ASTME308(
     Parameters
     ----------
     msds : MultiSpectralDistributions or array_like
-        Multi-spectral distributions.
+        Multi-spectral distributions, if an *array_like* the wavelengths are
+        expected to be in the last axis, e.g. for a 512x384 multi-spectral
+        image with 22 bins, ``msds`` shape should be (384, 512, 22).
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -1154,13 +1242,21 @@ def msds_to_XYZ_ASTME308(
         be the spectral concentration of the radiometric quantity corresponding
         to the photometric quantity required.
     shape : SpectralShape, optional
-        Spectral shape of the multi-spectral distributions, ``cmfs`` and
-        ``illuminant`` will be aligned to it.
+        Spectral shape of the multi-spectral distributions array :math:`msds`,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
 
     Returns
     -------
     array_like
-        *CIE XYZ* tristimulus values.
+        *CIE XYZ* tristimulus values, for a 512x384 multi-spectral image with
+        22 bins, the output shape will be (384, 512, 3).
+
+    Raises
+    ------
+    ValueError
+        If the multi-spectral distributions measurement interval is not equal
+        to 1, 5, 10 or 20 nm.
 
     Notes
     -----
@@ -1171,17 +1267,17 @@ def msds_to_XYZ_ASTME308(
     | ``XYZ``   | [0, 100]              | [0, 1]        |
     +-----------+-----------------------+---------------+
 
-    -   The code path using the *array_like* multi-spectral distributions
-        produces results different to the code path using a
-        :class:`colour.MultiSpectralDistributions` class instance: the former
-        favours execution speed by aligning the colour matching functions and
-        illuminant to the given spectral shape while the latter favours
-        precision by aligning the multi-spectral distributions to the colour
-        matching functions.
+    -   The multi-spectral distributions are converted at once: the table of
+        tristimulus weighting factors, or the weighted colour matching
+        functions for the 1 nm and 5 nm measurement intervals, are computed a
+        single time and applied to all the spectral distributions with a
+        matrix product. The results are equal to those of
+        :func:`colour.colorimetry.sd_to_XYZ_ASTME308` definition applied to
+        each spectral distribution.
 
     References
     ----------
-    :cite:`Wyszecki2000bf`
+    :cite:`ASTMInternational2015b`
 
     Examples
     --------
@@ -1218,18 +1314,98 @@ def msds_to_XYZ_ASTME308(
            [ 43.9113380...,  28.0003541...,  11.6852531...],
            [  8.5496209...,  19.6913570...,  17.7400079...],
            [ 23.8866733...,  26.2147704...,  30.6297684...]])
+    >>> msds_to_XYZ_ASTME308(
+    ...     np.transpose(msds.values)[:2], illuminant=D65, shape=msds.shape)
+    ... # doctest: +ELLIPSIS
+    array([[  7.5052758...,   3.9557516...,   8.38929  ...],
+           [ 26.9408494...,  15.0987746...,  28.6631260...]])
     """
 
     if isinstance(msds, MultiSpectralDistributions):
-        return as_float_array([
-            sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
-                               mi_5nm_omission_method,
-                               mi_20nm_interpolation_method, k)
-            for sd in msds.to_sds()
-        ])
+        if not msds.is_uniform():
+            return as_float_array([
+                sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
+                                   mi_5nm_omission_method,
+                                   mi_20nm_interpolation_method, k)
+                for sd in msds.to_sds()
+            ])
+
+        R, shape = np.transpose(msds.values), msds.shape
+    else:
+        R, msds = as_float_array(msds), None
+
+        msd_shape_m_1, shape_wl_count = R.shape[-1], len(shape.range())
+        assert msd_shape_m_1 == shape_wl_count, (
+            'Multi-spectral distributions array with {0} wavelengths '
+            'is not compatible with spectral shape with {1} wavelengths!'.
+            format(msd_shape_m_1, shape_wl_count))
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if use_practice_range:
+        cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_ASTME308)
+
+    if shape.interval == 1 or (shape.interval == 5 and mi_5nm_omission_method):
+        if shape.interval == 5 and cmfs.shape.interval != 5:
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=5))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        if shape != cmfs.shape:
+            runtime_warning(
+                'Aligning multi-spectral distributions shape to "{0}" colour '
+                'matching functions shape.'.format(cmfs.name))
+            R = _align_msds_array(R, shape, cmfs.shape, msds)
+
+        W = cmfs.values * illuminant.values[..., np.newaxis]
+        W *= 100 / np.sum(W[..., 1]) if k is None else k * cmfs.shape.interval
     else:
-        raise ValueError('"ASTM E308-15" method does not support "array_like" '
-                         'multi-spectral distributions!')
+        if shape.interval == 20 and mi_20nm_interpolation_method:
+            if shape.boundaries != cmfs.shape.boundaries:
+                runtime_warning(
+                    'Trimming multi-spectral distributions shape to "{0}" '
+                    'colour matching functions shape.'.format(cmfs.name))
+                R, shape = _trim_msds_array(R, shape, cmfs.shape)
+
+            R = _interpolate_20nm_ASTME308(R)
+            shape = SpectralShape(shape.start, shape.end, 10)
+
+        if cmfs.shape.interval != 1:
+            runtime_warning('Interpolating "{0}" cmfs to 1nm interval.'.format(
+                cmfs.name))
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        if shape.boundaries != cmfs.shape.boundaries:
+            runtime_warning(
+                'Trimming multi-spectral distributions shape to "{0}" colour '
+                'matching functions shape.'.format(cmfs.name))
+            R, shape = _trim_msds_array(R, shape, cmfs.shape)
+
+        W = tristimulus_weighting_factors_ASTME2022(
+            cmfs, illuminant,
+            SpectralShape(cmfs.shape.start, cmfs.shape.end, shape.interval), k)
+        start_w = cmfs.shape.start
+        end_w = cmfs.shape.start + shape.interval * (W.shape[0] - 1)
+        W = adjust_tristimulus_weighting_factors_ASTME308(
+            W, SpectralShape(start_w, end_w, shape.interval), shape)
+
+    XYZ = np.dot(R, W)
+
+    return from_range_100(XYZ)
 
 
 MSDS_TO_XYZ_METHODS = CaseInsensitiveMapping({
@@ -1265,10 +1441,10 @@ def msds_to_XYZ(
         **kwargs):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
-    using given colour matching functions and illuminant. For the *Integration*
-    method, the multi-spectral distributions can be either a
-    :class:`colour.MultiSpectralDistributions` class instance or an
-    *array_like* in which case the ``shape`` must be passed.
+    using given colour matching functions and illuminant. The multi-spectral
+    distributions can be either a :class:`colour.MultiSpectralDistributions`
+    class instance or an *array_like* in which case the ``shape`` must be
+    passed.
 
     Parameters
     ----------
@@ -1317,7 +1493,8 @@ def msds_to_XYZ(
         tristimulus values will use a dedicated interpolation method instead
         of a table of tristimulus weighting factors.
     shape : SpectralShape, optional
-        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`,
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
         Spectral shape of the multi-spectral distributions array :math:`msds`,
         ``cmfs`` and ``illuminant`` will be aligned to it.
 
@@ -1424,6 +1601,251 @@ def msds_to_XYZ(
                     **filter_kwargs(function, **kwargs))
 
 
+class TristimulusKernel:
+    """
+    Defines a kernel converting spectral data to *CIE XYZ* tristimulus values
+    with a table of weighting factors precomputed for given colour matching
+    functions, illuminant, spectral shape and method.
+
+    The conversion of spectral data to *CIE XYZ* tristimulus values with the
+    *Integration* and *ASTM E308* methods is linear, the table of weighting
+    factors is thus built once, by converting the unit spectral distributions
+    of given spectral shape, and the conversion reduces to a single matrix
+    product.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    shape : SpectralShape, optional
+        Spectral shape of the spectral data the kernel is applied to.
+    method : unicode, optional
+        **{'ASTM E308', 'Integration'}**,
+        Computation method.
+    k : numeric, optional
+        Normalisation constant :math:`k`, see
+        :func:`colour.colorimetry.sd_to_XYZ_integration` definition.
+
+    Other Parameters
+    ----------------
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        5 nm measurement intervals multi-spectral distributions conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        20 nm measurement intervals multi-spectral distributions conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.colorimetry.TristimulusKernel.cmfs`
+    -   :attr:`~colour.colorimetry.TristimulusKernel.illuminant`
+    -   :attr:`~colour.colorimetry.TristimulusKernel.shape`
+    -   :attr:`~colour.colorimetry.TristimulusKernel.method`
+    -   :attr:`~colour.colorimetry.TristimulusKernel.k`
+    -   :attr:`~colour.colorimetry.TristimulusKernel.weights`
+
+    Methods
+    -------
+    -   :meth:`~colour.colorimetry.TristimulusKernel.__init__`
+    -   :meth:`~colour.colorimetry.TristimulusKernel.__call__`
+
+    Notes
+    -----
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The kernel returns the same *CIE XYZ* tristimulus values than the
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308` and
+        :func:`colour.colorimetry.msds_to_XYZ_integration` definitions with
+        *array_like* multi-spectral distributions.
+
+    References
+    ----------
+    :cite:`ASTMInternational2011a`, :cite:`ASTMInternational2015b`,
+    :cite:`Wyszecki2000bf`
+
+    Examples
+    --------
+    >>> from colour import MSDS_CMFS, SDS_ILLUMINANTS
+    >>> cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> illuminant = SDS_ILLUMINANTS['D65']
+    >>> shape = SpectralShape(400, 700, 20)
+    >>> kernel = TristimulusKernel(cmfs, illuminant, shape)
+    >>> kernel.weights.shape
+    (3, 16)
+    >>> data = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ... ])
+    >>> kernel(data)  # doctest: +ELLIPSIS
+    array([[ 10.8401953...,   9.6841740...,   6.2158913...],
+           [ 10.8401953...,   9.6841740...,   6.2158913...]])
+    """
+
+    def __init__(self,
+                 cmfs=MSDS_CMFS_STANDARD_OBSERVER[
+                     'CIE 1931 2 Degree Standard Observer']
+                 .copy().trim(SPECTRAL_SHAPE_DEFAULT),
+                 illuminant=sd_ones(),
+                 shape=SPECTRAL_SHAPE_DEFAULT,
+                 method='ASTM E308',
+                 k=None,
+                 **kwargs):
+        method = validate_method(method, MSDS_TO_XYZ_METHODS)
+
+        self._cmfs = cmfs
+        self._illuminant = illuminant
+        self._shape = shape
+        self._method = method
+        self._k = k
+
+        function = MSDS_TO_XYZ_METHODS[method]
+
+        with domain_range_scale('reference'):
+            self._weights = np.transpose(
+                function(
+                    np.identity(len(shape.range())),
+                    cmfs,
+                    illuminant,
+                    k=k,
+                    shape=shape,
+                    **filter_kwargs(function, **kwargs)))
+        self._weights.setflags(write=False)
+
+    @property
+    def cmfs(self):
+        """
+        Getter property for the kernel colour matching functions.
+
+        Returns
+        -------
+        XYZ_ColourMatchingFunctions
+            Kernel colour matching functions.
+        """
+
+        return self._cmfs
+
+    @property
+    def illuminant(self):
+        """
+        Getter property for the kernel illuminant.
+
+        Returns
+        -------
+        SpectralDistribution
+            Kernel illuminant.
+        """
+
+        return self._illuminant
+
+    @property
+    def shape(self):
+        """
+        Getter property for the kernel spectral shape.
+
+        Returns
+        -------
+        SpectralShape
+            Kernel spectral shape.
+        """
+
+        return self._shape
+
+    @property
+    def method(self):
+        """
+        Getter property for the kernel computation method.
+
+        Returns
+        -------
+        unicode
+            Kernel computation method.
+        """
+
+        return self._method
+
+    @property
+    def k(self):
+        """
+        Getter property for the kernel normalisation constant :math:`k`.
+
+        Returns
+        -------
+        numeric
+            Kernel normalisation constant :math:`k`.
+        """
+
+        return self._k
+
+    @property
+    def weights(self):
+        """
+        Getter property for the kernel table of weighting factors.
+
+        Returns
+        -------
+        ndarray, (3, n)
+            Kernel table of weighting factors.
+        """
+
+        return self._weights
+
+    def __call__(self, msds):
+        """
+        Converts given spectral data to *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        msds : array_like or SpectralDistribution or \
+MultiSpectralDistributions
+            Spectral data, if an *array_like* the wavelengths are expected to
+            be in the last axis, e.g. for a 512x384 multi-spectral image with
+            16 bins, ``msds`` shape should be (384, 512, 16).
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values, for a 512x384 multi-spectral image
+            with 16 bins, the output shape will be (384, 512, 3).
+        """
+
+        if isinstance(msds,
+                      (SpectralDistribution, MultiSpectralDistributions)):
+            assert msds.shape == self._shape, (
+                '"{0}" shape is not compatible with "{1}" kernel '
+                'shape!'.format(msds.shape, self._shape))
+
+            msds = np.transpose(msds.values)
+        else:
+            msds = as_float_array(msds)
+
+            msd_shape_m_1, shape_wl_count = (msds.shape[-1],
+                                             self._weights.shape[-1])
+            assert msd_shape_m_1 == shape_wl_count, (
+                'Multi-spectral distributions array with {0} wavelengths '
+                'is not compatible with spectral shape with {1} wavelengths!'.
+                format(msd_shape_m_1, shape_wl_count))
+
+        return from_range_100(np.dot(msds, np.transpose(self._weights)))
+
+
 def wavelength_to_XYZ(wavelength,
                       cmfs=MSDS_CMFS_STANDARD_OBSERVER[
                           'CIE 1931 2 Degree Standard Observer']):
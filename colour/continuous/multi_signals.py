@@ -9,14 +9,18 @@ Defines the class implementing support for multi-continuous signals:
 """
 
 import numpy as np
+from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
+                      itruediv)
 from collections import OrderedDict
 from collections.abc import Iterator, KeysView, Mapping, Sequence, ValuesView
 
+from colour.algebra import (Extrapolator, KernelInterpolator,
+                            SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import AbstractContinuousFunction, Signal
-from colour.utilities import (as_float_array, first_item, is_iterable,
-                              is_pandas_installed, required, tsplit, tstack,
-                              validate_method)
+from colour.utilities import (as_array, as_float_array, fill_nan, is_iterable,
+                              is_pandas_installed, required, runtime_warning,
+                              tsplit, tstack, validate_method)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -27,11 +31,20 @@ __status__ = 'Production'
 
 __all__ = ['MultiSignals']
 
+_MULTI_COLUMNS_INTERPOLATORS = (KernelInterpolator, SpragueInterpolator)
+"""
+Interpolator classes supporting a 2-dimensional dependent :math:`y` variable,
+i.e. evaluating all the multi-continuous signals columns at once.
+
+_MULTI_COLUMNS_INTERPOLATORS : tuple
+"""
+
 
 class MultiSignals(AbstractContinuousFunction):
     """
     Defines the base class for multi-continuous signals, a container for
-    multiple :class:`colour.continuous.Signal` sub-class instances.
+    multiple continuous signals sharing the same independent domain :math:`x`
+    variable.
 
     .. important::
 
@@ -107,6 +120,16 @@ dict_like, optional
     -   :meth:`~colour.continuous.MultiSignals.fill_nan`
     -   :meth:`~colour.continuous.MultiSignals.to_dataframe`
 
+    Notes
+    -----
+    -   The multi-continuous signals values are stored in a single contiguous
+        array of shape :math:`(n_{domain}, n_{labels})` and are evaluated at
+        once with a single interpolator instance. The
+        :class:`colour.continuous.Signal` sub-class instances returned by the
+        :attr:`colour.continuous.MultiSignals.signals` attribute are views
+        created on demand: their modifications are written back into the
+        multi-continuous signals and vice versa.
+
     Examples
     --------
     Instantiation with implicit *domain* and a single signal:
@@ -259,10 +282,33 @@ dict_like, optional
     def __init__(self, data=None, domain=None, labels=None, **kwargs):
         super(MultiSignals, self).__init__(kwargs.get('name'))
 
+        self._hash = None
+        self._function = None
+        self._dtype = None
+        self._domain = None
+        self._range = None
+        self._labels = []
+        self._signals = None
+        self._interpolator = KernelInterpolator
+        self._interpolator_kwargs = {}
+        self._extrapolator = Extrapolator
+        self._extrapolator_kwargs = {
+            'method': 'Constant',
+            'left': np.nan,
+            'right': np.nan
+        }
+
         self._signal_type = kwargs.get('signal_type', Signal)
 
-        self._signals = self.multi_signals_unpack_data(data, domain, labels,
-                                                       **kwargs)
+        self._domain, self._range, self._labels = (
+            self._multi_signals_unpack_data(data, domain, labels))
+
+        self.dtype = kwargs.get('dtype', DEFAULT_FLOAT_DTYPE)
+
+        self.interpolator = kwargs.get('interpolator')
+        self.interpolator_kwargs = kwargs.get('interpolator_kwargs')
+        self.extrapolator = kwargs.get('extrapolator')
+        self.extrapolator_kwargs = kwargs.get('extrapolator_kwargs')
 
     @property
     def dtype(self):
@@ -280,8 +326,7 @@ dict_like, optional
             Continuous signal dtype.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).dtype
+        return self._dtype
 
     @dtype.setter
     def dtype(self, value):
@@ -290,30 +335,40 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.dtype = value
+            assert value in np.sctypes['float'], (
+                '"dtype" must be one of the following types: {0}'.format(
+                    np.sctypes['float']))
+
+            self._dtype = value
+
+            if self._domain is not None:
+                self._domain = self._domain.astype(value)
+
+            if self._range is not None:
+                self._range = self._range.astype(value)
+
+            self._invalidate_function()
 
     @property
     def domain(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances independent domain :math:`x` variable.
+        Getter and setter property for the multi-continuous signals
+        independent domain :math:`x` variable.
 
         Parameters
         ----------
         value : array_like
-            Value to set the :class:`colour.continuous.Signal` sub-class
-            instances independent domain :math:`x` variable with.
+            Value to set the multi-continuous signals independent domain
+            :math:`x` variable with.
 
         Returns
         -------
         ndarray
-            :class:`colour.continuous.Signal` sub-class instances independent
-            domain :math:`x` variable.
+            Multi-continuous signals independent domain :math:`x` variable.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).domain
+        if self._domain is not None:
+            return np.copy(self._domain)
 
     @domain.setter
     def domain(self, value):
@@ -322,30 +377,50 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.domain = value
+            if not np.all(np.isfinite(value)):
+                runtime_warning(
+                    '"{0}" new "domain" variable is not finite: {1}, '
+                    'unpredictable results may occur!'.format(
+                        self.name, value))
+
+            value = np.copy(as_array(value, self.dtype)).ravel()
+
+            if self._range is not None:
+                if value.size != self._range.shape[0]:
+                    runtime_warning(
+                        '"{0}" new "domain" and current "range" variables '
+                        'have different size, "range" variable will be '
+                        'resized to "domain" variable shape!'.format(
+                            self.name))
+                    self._range = np.resize(
+                        self._range, (value.size, self._range.shape[-1]))
+
+            self._domain = value
+            self._invalidate_function()
 
     @property
     def range(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances corresponding range :math:`y` variable.
+        Getter and setter property for the multi-continuous signals
+        corresponding range :math:`y` variable, i.e. the
+        :math:`(n_{domain}, n_{labels})` shaped array storing the values of
+        the signals.
 
         Parameters
         ----------
         value : array_like
-            Value to set the :class:`colour.continuous.Signal` sub-class
-            instances corresponding range :math:`y` variable with.
+            Value to set the multi-continuous signals corresponding range
+            :math:`y` variable with, a numeric or 1-dimensional array is
+            assigned to every signal.
 
         Returns
         -------
         ndarray
-            :class:`colour.continuous.Signal` sub-class instances corresponding
-            range :math:`y` variable.
+            Multi-continuous signals corresponding range :math:`y` variable.
         """
 
-        if self._signals:
-            return tstack([signal.range for signal in self._signals.values()])
+        if self._labels:
+            return np.copy(self._range)
 
     @range.setter
     def range(self, value):
@@ -354,40 +429,47 @@ dict_like, optional
         """
 
         if value is not None:
-            value = as_float_array(value)
+            if not np.all(np.isfinite(value)):
+                runtime_warning(
+                    '"{0}" new "range" variable is not finite: {1}, '
+                    'unpredictable results may occur!'.format(
+                        self.name, value))
+
+            value = as_array(value, self.dtype)
 
             if value.ndim in (0, 1):
-                for signal in self._signals.values():
-                    signal.range = value
+                value = np.tile(
+                    np.reshape(value, (-1, 1)), (1, len(self._labels)))
             else:
-                assert value.shape[-1] == len(self._signals), (
+                assert value.shape[-1] == len(self._labels), (
                     'Corresponding "y" variable columns must have '
                     'same count than underlying "Signal" components!')
 
-                for signal, y in zip(self._signals.values(), tsplit(value)):
-                    signal.range = y
+            if self._domain is not None:
+                assert value.shape[0] == self._domain.size, (
+                    '"domain" and "range" variables must have same size!')
+
+            self._range = np.copy(value)
+            self._invalidate_function()
 
     @property
     def interpolator(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances interpolator type.
+        Getter and setter property for the multi-continuous signals
+        interpolator type.
 
         Parameters
         ----------
         value : type
-            Value to set the :class:`colour.continuous.Signal` sub-class
-            instances interpolator type with.
+            Value to set the multi-continuous signals interpolator type with.
 
         Returns
         -------
         type
-            :class:`colour.continuous.Signal` sub-class instances interpolator
-            type.
+            Multi-continuous signals interpolator type.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).interpolator
+        return self._interpolator
 
     @interpolator.setter
     def interpolator(self, value):
@@ -396,30 +478,29 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.interpolator = value
+            self._interpolator = value
+            self._invalidate_function()
 
     @property
     def interpolator_kwargs(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances interpolator instantiation time arguments.
+        Getter and setter property for the multi-continuous signals
+        interpolator instantiation time arguments.
 
         Parameters
         ----------
         value : dict
-            Value to set the :class:`colour.continuous.Signal` sub-class
-            instances interpolator instantiation time arguments to.
+            Value to set the multi-continuous signals interpolator
+            instantiation time arguments to.
 
         Returns
         -------
         dict
-            :class:`colour.continuous.Signal` sub-class instances interpolator
-            instantiation time arguments.
+            Multi-continuous signals interpolator instantiation time
+            arguments.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).interpolator_kwargs
+        return self._interpolator_kwargs
 
     @interpolator_kwargs.setter
     def interpolator_kwargs(self, value):
@@ -428,30 +509,31 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.interpolator_kwargs = value
+            assert isinstance(value, (dict, OrderedDict)), (
+                '"{0}" attribute: "{1}" type is not "dict" or "OrderedDict"!'.
+                format('interpolator_kwargs', value))
+
+            self._interpolator_kwargs = value
+            self._invalidate_function()
 
     @property
     def extrapolator(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances extrapolator type.
+        Getter and setter property for the multi-continuous signals
+        extrapolator type.
 
         Parameters
         ----------
         value : type
-            Value to set the :class:`colour.continuous.Signal` sub-class
-            instances extrapolator type with.
+            Value to set the multi-continuous signals extrapolator type with.
 
         Returns
         -------
         type
-            :class:`colour.continuous.Signal` sub-class instances extrapolator
-            type.
+            Multi-continuous signals extrapolator type.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).extrapolator
+        return self._extrapolator
 
     @extrapolator.setter
     def extrapolator(self, value):
@@ -460,30 +542,30 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.extrapolator = value
+            # TODO: Check for extrapolator capabilities.
+            self._extrapolator = value
+            self._invalidate_function()
 
     @property
     def extrapolator_kwargs(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances extrapolator instantiation time arguments.
+        Getter and setter property for the multi-continuous signals
+        extrapolator instantiation time arguments.
 
         Parameters
         ----------
         value : dict
-            Value to set the :class:`colour.continuous.Signal` sub-class
-            instances extrapolator instantiation time arguments to.
+            Value to set the multi-continuous signals extrapolator
+            instantiation time arguments to.
 
         Returns
         -------
         dict
-            :class:`colour.continuous.Signal` sub-class instances extrapolator
-            instantiation time arguments.
+            Multi-continuous signals extrapolator instantiation time
+            arguments.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).extrapolator_kwargs
+        return self._extrapolator_kwargs
 
     @extrapolator_kwargs.setter
     def extrapolator_kwargs(self, value):
@@ -492,23 +574,35 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.extrapolator_kwargs = value
+            assert isinstance(value, (dict, OrderedDict)), (
+                '"{0}" attribute: "{1}" type is not "dict" or "OrderedDict"!'.
+                format('extrapolator_kwargs', value))
+
+            self._extrapolator_kwargs = value
+            self._invalidate_function()
 
     @property
     def function(self):
         """
-        Getter property for the :class:`colour.continuous.Signal` sub-class
-        instances callable.
+        Getter property for the multi-continuous signals callable.
 
         Returns
         -------
         callable
-            :class:`colour.continuous.Signal` sub-class instances callable.
+            Multi-continuous signals callable, evaluating all the signals at
+            once and returning an array with an extra last dimension of
+            :math:`n_{labels}` size.
+
+        Notes
+        -----
+        -   The callable is created lazily upon first access and whenever the
+            multi-continuous signals have been modified.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).function
+        if self._function is None:
+            self._create_function()
+
+        return self._function
 
     @property
     def signals(self):
@@ -526,9 +620,30 @@ or dict_like
         -------
         OrderedDict
             :class:`colour.continuous.Signal` sub-class instances.
+
+        Notes
+        -----
+        -   The :class:`colour.continuous.Signal` sub-class instances are
+            views created on demand from the multi-continuous signals range
+            :math:`y` variable columns: modifying them modifies the
+            multi-continuous signals and vice versa. A signal whose domain
+            is modified changes the domain of the multi-continuous signals,
+            the other signals being evaluated on the new domain. The
+            interpolator and extrapolator are shared by all the signals.
+        -   Copies of the :class:`colour.continuous.Signal` sub-class
+            instances are independent from the multi-continuous signals.
         """
 
-        return self._signals
+        if self._signals is None:
+            signals = OrderedDict()
+            for i, label in enumerate(self._labels):
+                signal = self._create_signal(i)
+                signal._multi_signals = self
+                signals[label] = signal
+
+            self._signals = signals
+
+        return OrderedDict(self._signals)
 
     @signals.setter
     def signals(self, value):
@@ -537,8 +652,11 @@ or dict_like
         """
 
         if value is not None:
-            self._signals = self.multi_signals_unpack_data(
-                value, signal_type=self._signal_type)
+            domain, range_, labels = self._multi_signals_unpack_data(
+                value, dtype=self.dtype)
+
+            self._domain, self._range, self._labels = domain, range_, labels
+            self._invalidate_function()
 
     @property
     def labels(self):
@@ -558,8 +676,8 @@ or dict_like
             :class:`colour.continuous.Signal` sub-class instance name.
         """
 
-        if self._signals:
-            return list(self._signals.keys())
+        if self._labels:
+            return list(self._labels)
 
     @labels.setter
     def labels(self, value):
@@ -575,13 +693,18 @@ or dict_like
             assert len(set(value)) == len(value), (
                 '"{0}" attribute: values must be unique!'.format('labels'))
 
-            assert len(value) == len(
-                self.labels), ('"{0}" attribute: length must be "{1}"!'.format(
-                    'labels', len(self._signals)))
+            assert len(value) == len(self._labels), (
+                '"{0}" attribute: length must be "{1}"!'.format(
+                    'labels', len(self._labels)))
 
-            self._signals = OrderedDict(
-                [(value[i], signal)
-                 for i, (_key, signal) in enumerate(self._signals.items())])
+            self._labels = list(value)
+            self._hash = None
+
+            if self._signals is not None:
+                self._signals = OrderedDict(
+                    zip(self._labels, self._signals.values()))
+                for label, signal in self._signals.items():
+                    signal.name = str(label)
 
     @property
     def signal_type(self):
@@ -700,16 +823,25 @@ or dict_like
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is computed once and cached until the multi-continuous
+            signals are modified.
         """
 
-        return hash((
-            self.domain.tobytes(),
-            self.range.tobytes(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._domain.tobytes() if self._domain is not None else None,
+                self._range.tobytes() if self._range is not None else None,
+                repr(self._labels),
+                self._interpolator.__name__,
+                repr(self._interpolator_kwargs),
+                self._extrapolator.__name__,
+                repr(self._extrapolator_kwargs),
+            ))
+
+        return self._hash
 
     def __getitem__(self, x):
         """
@@ -773,9 +905,13 @@ or dict_like
 
         x_r, x_c = (x[0], x[1]) if isinstance(x, tuple) else (x, slice(None))
 
-        if self._signals:
-            return tstack(
-                [signal[x_r] for signal in self._signals.values()])[..., x_c]
+        if self._labels:
+            if isinstance(x_r, slice):
+                return np.copy(self._range[x_r])[..., x_c]
+            else:
+                y = self.function(x_r)
+
+                return np.reshape(y, np.shape(x_r) + y.shape[-1:])[..., x_c]
         else:
             raise RuntimeError('No underlying "Signal" defined!')
 
@@ -893,16 +1029,45 @@ or dict_like
             'or 2-dimensional array!')
 
         if y.ndim == 0:
-            y = np.tile(y, len(self._signals))
+            y = np.tile(y, len(self._labels))
         elif y.ndim == 1:
             y = y[np.newaxis, :]
 
-        assert y.shape[-1] == len(self._signals), (
+        assert y.shape[-1] == len(self._labels), (
             'Corresponding "y" variable columns must have same count than '
             'underlying "Signal" components!')
 
-        for signal, y in list(zip(self._signals.values(), tsplit(y)))[x_c]:
-            signal[x_r] = y
+        if isinstance(x_r, slice):
+            self._range[x_r, x_c] = y[..., x_c]
+        else:
+            x_r = np.ravel(x_r).astype(self.dtype)
+            y = np.resize(y, (x_r.size, y.shape[-1]))
+            columns = np.atleast_1d(np.arange(len(self._labels))[x_c])
+
+            # Matching domain, updating existing `self._range` values.
+            mask = np.in1d(x_r, self._domain)
+            x_m = x_r[mask]
+            indexes = np.searchsorted(self._domain, x_m)
+            self._range[indexes[:, np.newaxis], columns] = y[mask][:, columns]
+
+            # Non matching domain, inserting into existing `self.domain`
+            # and `self.range`, the columns not being set are evaluated with
+            # the underlying function.
+            x_nm = x_r[~mask]
+            indexes = np.searchsorted(self._domain, x_nm)
+            if indexes.size != 0:
+                if columns.size == len(self._labels):
+                    y_nm = y[~mask]
+                else:
+                    self._invalidate_function()
+                    y_nm = np.reshape(
+                        self.function(x_nm), (x_nm.size, len(self._labels)))
+                    y_nm[:, columns] = y[~mask][:, columns]
+
+                self._domain = np.insert(self._domain, indexes, x_nm)
+                self._range = np.insert(self._range, indexes, y_nm, axis=0)
+
+        self._invalidate_function()
 
     def __contains__(self, x):
         """
@@ -931,8 +1096,14 @@ or dict_like
         False
         """
 
-        if self._signals:
-            return x in first_item(self._signals.values())
+        if self._labels:
+            return np.all(
+                np.where(
+                    np.logical_and(x >= np.min(self._domain),
+                                   x <= np.max(self._domain)),
+                    True,
+                    False,
+                ))
         else:
             raise RuntimeError('No underlying "Signal" defined!')
 
@@ -972,13 +1143,13 @@ or dict_like
 
         if isinstance(other, MultiSignals):
             if all([
-                    np.array_equal(self.domain, other.domain),
+                    np.array_equal(self._domain, other.domain),
                     np.array_equal(
-                        self.range,
-                        other.range), self.interpolator is other.interpolator,
-                    self.interpolator_kwargs == other.interpolator_kwargs,
-                    self.extrapolator is other.extrapolator,
-                    self.extrapolator_kwargs == other.extrapolator_kwargs,
+                        self._range,
+                        other.range), self._interpolator is other.interpolator,
+                    self._interpolator_kwargs == other.interpolator_kwargs,
+                    self._extrapolator is other.extrapolator,
+                    self._extrapolator_kwargs == other.extrapolator_kwargs,
                     self.labels == other.labels
             ]):
                 return True
@@ -1022,6 +1193,201 @@ or dict_like
 
         return not (self == other)
 
+    def _invalidate_function(self):
+        """
+        Invalidates the multi-continuous signals underlying function and cached
+        hash, the underlying function is lazily re-created upon next
+        evaluation. The :class:`colour.continuous.Signal` sub-class instances
+        views are updated accordingly.
+        """
+
+        self._function = None
+        self._hash = None
+
+        if self._signals is None:
+            return
+
+        if list(self._signals.keys()) != self._labels:
+            # The signals have been replaced, the views are detached.
+            for signal in self._signals.values():
+                signal._multi_signals = None
+
+            self._signals = None
+
+            return
+
+        # The views attributes are updated directly so that the modification
+        # is not written back.
+        for i, signal in enumerate(self._signals.values()):
+            signal._dtype = self._dtype
+            signal._domain = self._domain
+            signal._range = self._range[:, i]
+            signal._interpolator = self._interpolator
+            signal._interpolator_kwargs = self._interpolator_kwargs
+            signal._extrapolator = self._extrapolator
+            signal._extrapolator_kwargs = self._extrapolator_kwargs
+            signal._function = None
+            signal._hash = None
+
+    def _update_signal(self, signal):
+        """
+        Writes given modified :class:`colour.continuous.Signal` sub-class
+        instance view back into the multi-continuous signals.
+
+        Parameters
+        ----------
+        signal : Signal
+            Modified :class:`colour.continuous.Signal` sub-class instance view.
+        """
+
+        indexes = [
+            i for i, view in enumerate(self._signals.values())
+            if view is signal
+        ]
+
+        if not indexes:
+            return
+
+        index = indexes[0]
+
+        if np.array_equal(signal._domain, self._domain):
+            self._range[:, index] = signal._range
+        else:
+            # The other signals are evaluated on the new domain.
+            range_ = as_array(self.function(signal._domain), self._dtype)
+            range_[:, index] = signal._range
+
+            self._domain = as_array(signal._domain, self._dtype)
+            self._range = range_
+
+        self._interpolator = signal._interpolator
+        self._interpolator_kwargs = signal._interpolator_kwargs
+        self._extrapolator = signal._extrapolator
+        self._extrapolator_kwargs = signal._extrapolator_kwargs
+
+        self._invalidate_function()
+
+    def __getstate__(self):
+        """
+        Returns the multi-continuous signals state for copying and pickling,
+        the :class:`colour.continuous.Signal` sub-class instances views are
+        not part of it.
+
+        Returns
+        -------
+        dict
+            Multi-continuous signals state.
+        """
+
+        state = self.__dict__.copy()
+        state['_signals'] = None
+
+        return state
+
+    def _create_function(self):
+        """
+        Creates the multi-continuous signals underlying function.
+        """
+
+        if self._labels and self._domain is not None:
+            self._function = self._extrapolator(
+                self._instantiate_interpolator(
+                    self._interpolator, self.domain, self.range,
+                    **self._interpolator_kwargs), **self._extrapolator_kwargs)
+        else:
+
+            def _undefined_function(*args, **kwargs):
+                """
+                Raises a :class:`RuntimeError` exception.
+
+                Other Parameters
+                ----------------
+                \\*args : list, optional
+                    Arguments.
+                \\**kwargs : dict, optional
+                    Keywords arguments.
+
+                Raises
+                ------
+                RuntimeError
+                """
+
+                raise RuntimeError(
+                    'Underlying signals interpolator function does not '
+                    'exists, please ensure you defined both '
+                    '"domain" and "range" variables!')
+
+            self._function = _undefined_function
+
+    def _create_signal(self, index):
+        """
+        Creates a :class:`colour.continuous.Signal` sub-class instance from
+        given multi-continuous signals range :math:`y` variable column index.
+
+        Parameters
+        ----------
+        index : int
+            Range :math:`y` variable column index.
+
+        Returns
+        -------
+        Signal
+            :class:`colour.continuous.Signal` sub-class instance.
+        """
+
+        signal = self._signal_type(
+            self._range[:, index],
+            self._domain,
+            dtype=self._dtype,
+            interpolator=self._interpolator,
+            interpolator_kwargs=self._interpolator_kwargs,
+            extrapolator=self._extrapolator,
+            extrapolator_kwargs=self._extrapolator_kwargs)
+        signal.name = str(self._labels[index])
+
+        return signal
+
+    @staticmethod
+    def _instantiate_interpolator(interpolator, x, y, **kwargs):
+        """
+        Instantiates given interpolator class with given independent :math:`x`
+        variable and 2-dimensional dependent :math:`y` variable.
+
+        Parameters
+        ----------
+        interpolator : type
+            Interpolator class type.
+        x : ndarray
+            Independent :math:`x` variable.
+        y : ndarray
+            Dependent :math:`y` variable of shape
+            :math:`(n_{domain}, n_{labels})`.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments passed to the interpolator class.
+
+        Returns
+        -------
+        object
+            Interpolator class instance evaluating all the :math:`y` variable
+            columns at once.
+
+        Notes
+        -----
+        -   Interpolator classes that do not support a 2-dimensional dependent
+            :math:`y` variable, i.e. that are not sub-classes of the
+            :attr:`_MULTI_COLUMNS_INTERPOLATORS` attribute classes, are
+            instantiated for each column.
+        """
+
+        if (isinstance(interpolator, type) and
+                issubclass(interpolator, _MULTI_COLUMNS_INTERPOLATORS)):
+            return interpolator(x, y, **kwargs)
+        else:
+            return _ColumnsInterpolator(interpolator, x, y, **kwargs)
+
     def arithmetical_operation(self, a, operation, in_place=False):
         """
         Performs given arithmetical operation with :math:`a` operand, the
@@ -1130,36 +1496,44 @@ or dict_like
          [   9.  347.  378.  409.]]
         """
 
-        multi_signals = self if in_place else self.copy()
+        operation, ioperator = {
+            '+': (add, iadd),
+            '-': (sub, isub),
+            '*': (mul, imul),
+            '/': (truediv, itruediv),
+            '**': (pow, ipow)
+        }[operation]
 
-        if isinstance(a, MultiSignals):
-            assert len(self.signals) == len(a.signals), (
-                '"MultiSignals" operands must have same count than '
-                'underlying "Signal" components!')
+        if in_place:
+            if isinstance(a, MultiSignals):
+                assert len(self._labels) == len(a.labels), (
+                    '"MultiSignals" operands must have same count than '
+                    'underlying "Signal" components!')
 
-            for signal_a, signal_b in zip(multi_signals.signals.values(),
-                                          a.signals.values()):
-                signal_a.arithmetical_operation(signal_b, operation, True)
-        else:
-            a = as_float_array(a)
+                self[self._domain] = operation(self._range, a[self._domain])
+                exclusive_or = np.setxor1d(self._domain, a.domain)
+                self[exclusive_or] = np.nan
+            else:
+                a = as_float_array(a)
 
-            assert a.ndim in range(3), (
-                'Operand "a" variable must be a numeric or a 1-dimensional or '
-                '2-dimensional array!')
+                assert a.ndim in range(3), (
+                    'Operand "a" variable must be a numeric or a '
+                    '1-dimensional or 2-dimensional array!')
 
-            if a.ndim in (0, 1):
-                for signal in multi_signals.signals.values():
-                    signal.arithmetical_operation(a, operation, True)
-            else:
-                assert a.shape[-1] == len(multi_signals.signals), (
-                    'Operand "a" variable columns must have same count than '
-                    'underlying "Signal" components!')
+                if a.ndim == 1:
+                    a = a[:, np.newaxis]
+                elif a.ndim == 2:
+                    assert a.shape[-1] == len(self._labels), (
+                        'Operand "a" variable columns must have same count '
+                        'than underlying "Signal" components!')
 
-                for signal, y in zip(multi_signals.signals.values(),
-                                     tsplit(a)):
-                    signal.arithmetical_operation(y, operation, True)
+                self.range = ioperator(self.range, a)
+
+            return self
+        else:
+            copy = ioperator(self.copy(), a)
 
-        return multi_signals
+            return copy
 
     @staticmethod
     def multi_signals_unpack_data(data=None,
@@ -1373,38 +1747,92 @@ dict_like, optional
             'strict_name': None,
         })
 
-        # domain_u, range_u, signals = None, None, None
+        domain, range_, labels = MultiSignals._multi_signals_unpack_data(
+            data, domain, labels, dtype)
 
         signals = OrderedDict()
+        for i, label in enumerate(labels):
+            signals[label] = signal_type(range_[:, i], domain, **settings)
+            signals[label].name = str(label)
+
+        return signals
+
+    @staticmethod
+    def _multi_signals_unpack_data(data=None,
+                                   domain=None,
+                                   labels=None,
+                                   dtype=None):
+        """
+        Unpack given data for multi-continuous signals instantiation into an
+        independent domain :math:`x` variable, a corresponding range :math:`y`
+        variable and labels.
+
+        Parameters
+        ----------
+        data : Series or Dataframe or Signal or MultiSignals or array_like or \
+dict_like, optional
+            Data to unpack for multi-continuous signals instantiation.
+        domain : array_like, optional
+            Values to use as independent domain :math:`x` variable. If both
+            ``data`` and ``domain`` arguments are defined, the latter will be
+            used as independent domain :math:`x` variable.
+        labels : array_like, optional
+            Names to use for the signals.
+        dtype : type, optional
+            **{np.float16, np.float32, np.float64, np.float128}**,
+            Floating point data type.
+
+        Returns
+        -------
+        tuple
+            Independent domain :math:`x` variable, corresponding range
+            :math:`y` variable of shape :math:`(n_{domain}, n_{labels})` and
+            labels.
+
+        Examples
+        --------
+        >>> range_ = tstack([np.linspace(10, 100, 10)] * 3)
+        >>> domain, range_, labels = (
+        ...     MultiSignals._multi_signals_unpack_data(range_))
+        >>> domain
+        array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
+        >>> range_.shape
+        (10, 3)
+        >>> labels
+        [0, 1, 2]
+        """
+
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
+        domain_u, range_u, labels_u, signals = None, None, [], None
 
         domain = list(domain) if isinstance(domain, KeysView) else domain
 
         # TODO: Implement support for Signal class passing.
         if isinstance(data, MultiSignals):
-            signals = data.signals
+            if data.labels:
+                domain_u, range_u, labels_u = (data.domain, data.range,
+                                               data.labels)
         elif (issubclass(type(data), Sequence) or
               isinstance(data,
                          (tuple, list, np.ndarray, Iterator, ValuesView))):
+            data = list(data) if isinstance(data,
+                                            (Iterator, ValuesView)) else data
 
-            is_signal = all(
-                [True if isinstance(i, Signal) else False for i in data])
+            is_signal = (not isinstance(data, np.ndarray) and
+                         len(data) != 0 and
+                         all([isinstance(i, Signal) for i in data]))
 
             if is_signal:
-                for signal in data:
-                    signals[signal.name] = signal_type(
-                        signal.range, signal.domain, **settings)
-            else:
-                data = tsplit(
-                    list(data) if isinstance(data, (Iterator,
-                                                    ValuesView)) else data)
-                assert data.ndim in (1, 2), (
+                signals = OrderedDict(
+                    [(signal.name, signal) for signal in data])
+            elif len(data) != 0:
+                range_u = as_float_array(data, dtype)
+                assert range_u.ndim in (1, 2), (
                     'User "data" must be 1-dimensional or 2-dimensional!')
 
-                if data.ndim == 1:
-                    data = data[np.newaxis, :]
-
-                for i, range_u in enumerate(data):
-                    signals[i] = signal_type(range_u, domain, **settings)
+                domain_u = np.arange(0, range_u.shape[0], dtype=dtype)
         elif (issubclass(type(data), Mapping) or
               isinstance(data, (dict, OrderedDict))):
 
@@ -1414,47 +1842,56 @@ dict_like, optional
             ])
 
             if is_signal:
-                for label, signal in data.items():
-                    signals[label] = signal_type(signal.range, signal.domain,
-                                                 **settings)
+                signals = OrderedDict(data.items())
             else:
                 domain_u, range_u = zip(*sorted(data.items()))
-                for i, range_u in enumerate(tsplit(range_u)):
-                    signals[i] = signal_type(range_u, domain_u, **settings)
+                range_u = as_float_array(range_u, dtype)
         elif is_pandas_installed():
             from pandas import DataFrame, Series
 
             if isinstance(data, Series):
-                signals[0] = signal_type(data, **settings)
+                domain_u, range_u = data.index.values, data.values
             elif isinstance(data, DataFrame):
-                domain_u = data.index.values
-                signals = OrderedDict([(label,
-                                        signal_type(data[label], domain_u,
-                                                    **settings))
-                                       for label in data])
+                domain_u, range_u = data.index.values, data.values
+                labels_u = [label for label in data]
 
-                for label in data:
-                    signals[label].name = label
+        if signals:
+            domain_u = next(iter(signals.values())).domain
 
-        if domain is not None and signals is not None:
-            for signal in signals.values():
-                assert len(domain) == len(signal.domain), (
-                    'User "domain" is not compatible with unpacked signals!')
+            if domain is None:
+                for signal in signals.values():
+                    assert np.array_equal(signal.domain, domain_u), (
+                        'Unpacked signals must have the same "domain" '
+                        'variable!')
 
-                signal.domain = domain
+            range_u = tstack([signal.range for signal in signals.values()])
+            labels_u = list(signals.keys())
 
-        if labels is not None and signals is not None:
-            assert len(labels) == len(signals), (
-                'User "labels" is not compatible with unpacked signals!')
+        if range_u is not None:
+            range_u = np.array(range_u, dtype=dtype)
 
-            signals = OrderedDict(
-                [(labels[i], signal)
-                 for i, (_key, signal) in enumerate(signals.items())])
+            if range_u.ndim == 1:
+                range_u = range_u[:, np.newaxis]
 
-        for label in signals:
-            signals[label].name = str(label)
+            if not labels_u:
+                labels_u = list(range(range_u.shape[-1]))
 
-        return signals
+        if domain is not None and range_u is not None:
+            assert len(domain) == range_u.shape[0], (
+                'User "domain" is not compatible with unpacked signals!')
+
+            domain_u = domain
+
+        if domain_u is not None:
+            domain_u = np.array(domain_u, dtype=dtype)
+
+        if labels is not None:
+            assert len(labels) == len(labels_u), (
+                'User "labels" is not compatible with unpacked signals!')
+
+            labels_u = list(labels)
+
+        return domain_u, range_u, labels_u
 
     def fill_nan(self, method='Interpolation', default=0):
         """
@@ -1518,8 +1955,12 @@ dict_like, optional
 
         method = validate_method(method, ['Interpolation', 'Constant'])
 
-        for signal in self._signals.values():
-            signal.fill_nan(method, default)
+        self._domain = fill_nan(self._domain, method, default)
+
+        for i in np.where(np.any(np.isnan(self._range), axis=0))[0]:
+            self._range[:, i] = fill_nan(self._range[:, i], method, default)
+
+        self._invalidate_function()
 
         return self
 
@@ -1559,3 +2000,86 @@ dict_like, optional
 
         return DataFrame(
             data=self.range, index=self.domain, columns=self.labels)
+
+
+class _ColumnsInterpolator:
+    """
+    Wraps given interpolator class not supporting a 2-dimensional dependent
+    :math:`y` variable by instantiating it for each column.
+
+    Parameters
+    ----------
+    interpolator : type
+        Interpolator class type.
+    x : ndarray
+        Independent :math:`x` variable.
+    y : ndarray
+        Dependent :math:`y` variable of shape :math:`(n, m)`.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the interpolator class.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.continuous.multi_signals._ColumnsInterpolator.x`
+    -   :attr:`~colour.continuous.multi_signals._ColumnsInterpolator.y`
+
+    Methods
+    -------
+    -   :meth:`~colour.continuous.multi_signals._ColumnsInterpolator.__init__`
+    -   :meth:`~colour.continuous.multi_signals._ColumnsInterpolator.__call__`
+    """
+
+    def __init__(self, interpolator, x, y, **kwargs):
+        self._x = x
+        self._y = y
+        self._interpolators = [
+            interpolator(x, y_c, **kwargs) for y_c in tsplit(y)
+        ]
+
+    @property
+    def x(self):
+        """
+        Getter property for the independent :math:`x` variable.
+
+        Returns
+        -------
+        ndarray
+            Independent :math:`x` variable.
+        """
+
+        return self._x
+
+    @property
+    def y(self):
+        """
+        Getter property for the dependent :math:`y` variable.
+
+        Returns
+        -------
+        ndarray
+            Dependent :math:`y` variable.
+        """
+
+        return self._y
+
+    def __call__(self, x):
+        """
+        Evaluates the interpolators at given point(s).
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolators at.
+
+        Returns
+        -------
+        ndarray
+            Interpolated value(s) with an extra last dimension of :math:`m`
+            size.
+        """
+
+        return tstack(
+            [interpolator(x) for interpolator in self._interpolators])
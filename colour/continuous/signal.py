@@ -196,6 +196,11 @@ class Signal(AbstractContinuousFunction):
     def __init__(self, data=None, domain=None, **kwargs):
         super(Signal, self).__init__(kwargs.get('name'))
 
+        self._hash = None
+        self._function = None
+        # Multi-continuous signals the continuous signal is a view of, the
+        # modifications are written back into them.
+        self._multi_signals = None
         self._dtype = None
         self._domain = None
         self._range = None
@@ -217,8 +222,6 @@ class Signal(AbstractContinuousFunction):
         self.extrapolator = kwargs.get('extrapolator')
         self.extrapolator_kwargs = kwargs.get('extrapolator_kwargs')
 
-        self._create_function()
-
     @property
     def dtype(self):
         """
@@ -252,7 +255,8 @@ class Signal(AbstractContinuousFunction):
             self._dtype = value
 
             # The following self-assignments are written as intended and
-            # triggers the rebuild of the underlying function.
+            # triggers the conversion to the new dtype and the invalidation
+            # of the underlying function.
             self.domain = self.domain
             self.range = self.range
 
@@ -302,7 +306,7 @@ class Signal(AbstractContinuousFunction):
                         self._range = np.resize(self._range, value.shape)
 
                 self._domain = value
-                self._create_function()
+                self._invalidate_function()
 
     @property
     def range(self):
@@ -345,7 +349,7 @@ class Signal(AbstractContinuousFunction):
                         '"domain" and "range" variables must have same size!')
 
                 self._range = value
-                self._create_function()
+                self._invalidate_function()
 
     @property
     def interpolator(self):
@@ -375,7 +379,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def interpolator_kwargs(self):
@@ -410,7 +414,7 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_kwargs', value)
 
             self._interpolator_kwargs = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def extrapolator(self):
@@ -440,7 +444,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def extrapolator_kwargs(self):
@@ -475,7 +479,7 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_kwargs', value))
 
             self._extrapolator_kwargs = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def function(self):
@@ -486,8 +490,16 @@ class Signal(AbstractContinuousFunction):
         -------
         callable
             Continuous signal callable.
+
+        Notes
+        -----
+        -   The callable is lazily created upon first access after the
+            continuous signal has been modified.
         """
 
+        if self._function is None:
+            self._create_function()
+
         return self._function
 
     def __str__(self):
@@ -580,16 +592,37 @@ class Signal(AbstractContinuousFunction):
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is computed once and cached until the continuous signal
+            is modified, i.e. by the property setters, the
+            :meth:`colour.continuous.Signal.__setitem__` method or in-place
+            arithmetical operations.
+
+        Examples
+        --------
+        >>> range_ = np.linspace(10, 100, 10)
+        >>> signal_1 = Signal(range_)
+        >>> signal_2 = Signal(range_)
+        >>> hash(signal_1) == hash(signal_2)
+        True
+        >>> signal_2[0] = 20
+        >>> hash(signal_1) == hash(signal_2)
+        False
         """
 
-        return hash((
-            self.domain.tobytes(),
-            self.range.tobytes(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._domain.tobytes(),
+                self._range.tobytes(),
+                self._interpolator.__name__,
+                repr(self._interpolator_kwargs),
+                self._extrapolator.__name__,
+                repr(self._extrapolator_kwargs),
+            ))
+
+        return self._hash
 
     def __getitem__(self, x):
         """
@@ -635,7 +668,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -725,7 +758,7 @@ class Signal(AbstractContinuousFunction):
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
 
-        self._create_function()
+        self._invalidate_function()
 
     def __contains__(self, x):
         """
@@ -844,6 +877,37 @@ class Signal(AbstractContinuousFunction):
 
         return not (self == other)
 
+    def _invalidate_function(self):
+        """
+        Invalidates the continuous signal underlying function and cached hash,
+        the underlying function is lazily re-created upon next evaluation. The
+        modification is written back into the multi-continuous signals the
+        continuous signal is a view of, if any.
+        """
+
+        self._function = None
+        self._hash = None
+
+        if self._multi_signals is not None:
+            self._multi_signals._update_signal(self)
+
+    def __getstate__(self):
+        """
+        Returns the continuous signal state for copying and pickling, a copy of
+        a :class:`colour.continuous.MultiSignals` class instance signal is
+        independent from it.
+
+        Returns
+        -------
+        dict
+            Continuous signal state.
+        """
+
+        state = self.__dict__.copy()
+        state['_multi_signals'] = None
+
+        return state
+
     def _create_function(self):
         """
         Creates the continuous signal underlying function.
@@ -900,7 +964,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._invalidate_function()
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -923,7 +987,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._invalidate_function()
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
@@ -252,6 +252,15 @@ extrapolator_kwargs` property.
 
         assert hasattr(self._multi_signals.function, '__call__')
 
+        np.testing.assert_almost_equal(
+            self._multi_signals.function(np.array([0.5, 1.5])),
+            np.array([
+                self._multi_signals.signals[label].function(
+                    np.array([0.5, 1.5]))
+                for label in self._multi_signals.labels
+            ]).T,
+            decimal=7)
+
     def test_raise_exception_function(self):
         """
         Tests :func:`colour.continuous.signal.multi_signals.MultiSignals`
@@ -274,6 +283,39 @@ extrapolator_kwargs` property.
         np.testing.assert_array_equal(multi_signals.range,
                                       self._range_1[:, np.newaxis])
 
+        signals = self._multi_signals.signals
+        self.assertListEqual(list(signals.keys()), [0, 1, 2])
+        np.testing.assert_array_equal(signals[2].range, self._range_1 + 20)
+        self.assertEqual(signals[2].name, '2')
+
+        multi_signals = self._multi_signals.copy()
+        signals = multi_signals.signals
+        self.assertIs(multi_signals.signals[2], signals[2])
+
+        signals[2][0] = 0
+        self.assertEqual(multi_signals.range[0, 2], 0)
+        self.assertAlmostEqual(multi_signals[0][2], 0, places=7)
+
+        signals[1].range = self._range_1
+        np.testing.assert_array_equal(multi_signals.range[:, 1], self._range_1)
+
+        multi_signals.range = self._range_2
+        np.testing.assert_array_equal(signals[2].range, self._range_2[:, 2])
+
+        signals[0][10] = 110
+        np.testing.assert_array_equal(multi_signals.domain,
+                                      np.hstack([self._domain_1, 10]))
+        self.assertAlmostEqual(multi_signals[10][0], 110, places=7)
+
+        signal = signals[0].copy()
+        signal[0] = 1000
+        self.assertNotEqual(multi_signals[0][0], 1000)
+
+        multi_signals_c = multi_signals.copy()
+        multi_signals_c.signals[0][0] = 1000
+        self.assertNotEqual(multi_signals[0][0], 1000)
+        self.assertAlmostEqual(multi_signals_c[0][0], 1000, places=7)
+
     def test_labels(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.labels`
@@ -361,6 +403,23 @@ extrapolator_kwargs` property.
 
         self.assertIsInstance(hash(self._multi_signals), int)
 
+        multi_signals_1 = MultiSignals(self._range_2)
+        multi_signals_2 = MultiSignals(self._range_2)
+        self.assertEqual(hash(multi_signals_1), hash(multi_signals_2))
+
+        multi_signals_2[0] = 20
+        self.assertNotEqual(hash(multi_signals_1), hash(multi_signals_2))
+
+        multi_signals_2.range = self._range_2
+        self.assertEqual(hash(multi_signals_1), hash(multi_signals_2))
+
+        multi_signals_2 *= 2
+        self.assertNotEqual(hash(multi_signals_1), hash(multi_signals_2))
+
+        multi_signals_2.range = self._range_2
+        multi_signals_2.signals[1].range = self._range_1
+        self.assertNotEqual(hash(multi_signals_1), hash(multi_signals_2))
+
     def test__str__(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.__str__`
@@ -624,6 +683,20 @@ extrapolator_kwargs` property.
             ]),
             decimal=7)
 
+        multi_signals = self._multi_signals.copy()
+        multi_signals[np.array([0.5, 1.5]), 0:1] = 0
+        np.testing.assert_almost_equal(
+            multi_signals.domain,
+            np.array(
+                [0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            multi_signals.range[[1, 3], 0], np.array([0.0, 0.0]), decimal=7)
+        np.testing.assert_almost_equal(
+            multi_signals.range[[1, 3], 1:],
+            self._multi_signals[np.array([0.5, 1.5])][:, 1:],
+            decimal=7)
+
     def test__contains__(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.__contains__`
@@ -208,6 +208,20 @@ class TestSignal(unittest.TestCase):
 
         assert hasattr(self._signal.function, '__call__')
 
+        signal = Signal(self._range)
+        function = signal.function
+        self.assertIs(signal.function, function)
+
+        signal[0] = 20
+        self.assertIsNot(signal.function, function)
+        self.assertEqual(signal.function(0), 20)
+
+        function = signal.function
+        signal.interpolator = CubicSplineInterpolator
+        self.assertIsNot(signal.function, function)
+        self.assertIsInstance(signal.function.interpolator,
+                              CubicSplineInterpolator)
+
     def test_raise_exception_function(self):
         """
         Tests :func:`colour.continuous.signal.Signal.function` property raised
@@ -251,6 +265,31 @@ class TestSignal(unittest.TestCase):
 
         self.assertIsInstance(hash(self._signal), int)
 
+        signal_1 = Signal(self._range)
+        signal_2 = Signal(self._range)
+        self.assertEqual(hash(signal_1), hash(signal_2))
+
+        signal_2[0] = 20
+        self.assertNotEqual(hash(signal_1), hash(signal_2))
+
+        signal_2[0] = 10
+        self.assertEqual(hash(signal_1), hash(signal_2))
+
+        signal_2 += 1
+        self.assertNotEqual(hash(signal_1), hash(signal_2))
+
+        signal_2.range = self._range
+        self.assertEqual(hash(signal_1), hash(signal_2))
+
+        signal_2.domain = self._domain
+        self.assertNotEqual(hash(signal_1), hash(signal_2))
+
+        signal_2.domain = np.arange(0, 10, 1)
+        self.assertEqual(hash(signal_1), hash(signal_2))
+
+        signal_2.interpolator = CubicSplineInterpolator
+        self.assertNotEqual(hash(signal_1), hash(signal_2))
+
     def test__str__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__str__` method.
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from .conversion import (CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS,
-                         describe_conversion_path, convert)
+                         conversion_graph, describe_conversion_path,
+                         ConversionPlan, conversion_plan, convert,
+                         convert_many)
 
 __all__ = [
-    'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS', 'conversion_graph',
+    'describe_conversion_path', 'ConversionPlan', 'conversion_plan', 'convert',
+    'convert_many'
 ]
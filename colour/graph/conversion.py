@@ -5,17 +5,29 @@ Automatic Colour Conversion Graph
 
 Defines the automatic colour conversion graph objects:
 
+-   :func:`colour.graph.conversion_graph`
 -   :func:`colour.describe_conversion_path`
+-   :class:`colour.graph.ConversionPlan`
+-   :func:`colour.conversion_plan`
 -   :func:`colour.convert`
+-   :func:`colour.convert_many`
 """
 
+import csv
+import hashlib
 import inspect
+import numpy as np
+import os
 import textwrap
 from collections import namedtuple
+from collections.abc import Mapping
 from copy import copy
 from functools import partial
+from itertools import groupby
+from numbers import Number
 from pprint import pformat
 
+from colour.algebra import matrix_dot, vector_dot
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
                                 TVS_ILLUMINANTS_HUNTERLAB)
 from colour.colorimetry import (colorimetric_purity, complementary_wavelength,
@@ -55,9 +67,9 @@ from colour.appearance import (
     XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
 from colour.appearance.ciecam02 import CAM_KWARGS_CIECAM02_sRGB
 from colour.temperature import CCT_to_uv, uv_to_CCT
-from colour.utilities import (domain_range_scale, filter_kwargs, message_box,
-                              required, tsplit, tstack, usage_warning,
-                              validate_method)
+from colour.utilities import (LRUCache, domain_range_scale, filter_kwargs,
+                              message_box, required, tsplit, tstack,
+                              usage_warning, validate_method)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -71,14 +83,22 @@ __all__ = [
     'JMh_CIECAM02_to_CIECAM02', 'CAM16_to_JMh_CAM16', 'JMh_CAM16_to_CAM16',
     'XYZ_to_luminance', 'RGB_luminance_to_RGB',
     'CONVERSION_SPECIFICATIONS_DATA', 'CONVERSION_GRAPH_NODE_LABELS',
-    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH',
-    'describe_conversion_path', 'convert'
+    'PATH_CONVERSION_WEIGHTS', 'PATH_CONVERSION_NEXT_HOPS',
+    'CONVERSION_SPECIFICATIONS', 'CONVERSION_LINEAR_FUNCTIONS',
+    'CONVERSION_GRAPH', 'conversion_graph', 'describe_conversion_path',
+    'ConversionPlan', 'conversion_plan', 'convert', 'convert_many'
 ]
 
+_CACHE_CONVERSION_STEPS = LRUCache(
+    'colour.graph.conversion._CACHE_CONVERSION_STEPS', maximum_size=1024)
+_CACHE_CONVERSION_PLANS = LRUCache(
+    'colour.graph.conversion._CACHE_CONVERSION_PLANS', maximum_size=256)
+
 
 class Conversion_Specification(
-        namedtuple('Conversion_Specification',
-                   ('source', 'target', 'conversion_function'))):
+        namedtuple(
+            'Conversion_Specification',
+            ('source', 'target', 'conversion_function', 'cost', 'error'))):
     """
     Conversion specification for *Colour* graph for automatic colour
     conversion describing two nodes and the edge in the graph.
@@ -91,11 +111,23 @@ class Conversion_Specification(
         Target node in the graph.
     conversion_function : callable
         Callable converting from the ``source`` node to the ``target`` node.
+    cost : numeric, optional
+        Measured cost of the conversion, i.e. its execution time per element
+        in nanoseconds, used to weight the edge in the graph.
+    error : numeric, optional
+        Measured precision loss of the conversion, i.e. its maximum relative
+        round-trip error.
     """
 
-    def __new__(cls, source=None, target=None, conversion_function=None):
+    def __new__(cls,
+                source=None,
+                target=None,
+                conversion_function=None,
+                cost=None,
+                error=None):
         return super(Conversion_Specification, cls).__new__(
-            cls, source.lower(), target.lower(), conversion_function)
+            cls, source.lower(), target.lower(), conversion_function, cost,
+            error)
 
 
 def CIECAM02_to_JMh_CIECAM02(CAM_Specification_CIECAM02):
@@ -529,9 +561,92 @@ the edge in the graph.
 CONVERSION_SPECIFICATIONS_DATA : list
 """
 
+PATH_CONVERSION_WEIGHTS = os.path.join(
+    os.path.dirname(__file__), 'resources', 'conversion_weights.csv')
+"""
+Automatic colour conversion graph weights file path, the weights are
+regenerated on the host machine with the
+*utilities/benchmark_conversion_graph.py* command.
+
+PATH_CONVERSION_WEIGHTS : unicode
+"""
+
+PATH_CONVERSION_NEXT_HOPS = os.path.join(
+    os.path.dirname(__file__), 'resources', 'conversion_next_hops.csv')
+"""
+Automatic colour conversion graph next hops table file path, the table is
+regenerated along the weights with the
+*utilities/benchmark_conversion_graph.py* command.
+
+PATH_CONVERSION_NEXT_HOPS : unicode
+"""
+
+
+def _read_conversion_weights(path=PATH_CONVERSION_WEIGHTS):
+    """
+    Reads the automatic colour conversion graph weights from given path.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Conversion graph weights file path.
+
+    Returns
+    -------
+    dict
+        Conversion cost and error by source and target nodes, missing
+        measurements are given as *None*.
+    """
+
+    weights = {}
+
+    if not os.path.exists(path):
+        return weights
+
+    with open(path, newline='') as csv_file:
+        for row in csv.DictReader(csv_file):
+            weights[(row['source'].lower(), row['target'].lower())] = tuple(
+                float(row[field]) if row[field] else None
+                for field in ('cost', 'error'))
+
+    return weights
+
+
+_CONVERSION_WEIGHTS = _read_conversion_weights()
+"""
+Automatic colour conversion graph weights.
+
+_CONVERSION_WEIGHTS : dict
+"""
+
+_CONVERSION_ERROR_TOLERANCE = 1e-2
+"""
+Automatic colour conversion graph precision loss tolerance: the edges whose
+precision loss exceeds it, e.g. *CIE XYZ* to *CIE xy* discarding the
+luminance, are penalised so that they are avoided whenever a lossless path
+exists. The numerical inaccuracy of the iterative conversions, e.g. *CIE xyY*
+to *Munsell Colour*, is below the tolerance.
+
+_CONVERSION_ERROR_TOLERANCE : numeric
+"""
+
+_CONVERSION_EDGE_OVERHEAD = 10000
+"""
+Automatic colour conversion graph fixed edge overhead, i.e. the approximate
+cost in nanoseconds of a conversion function call irrespective of the
+elements count. It exceeds the measured cost of most conversions so that the
+paths with the fewest edges are favoured and the measurement noise cannot
+replace a direct edge with a longer path.
+
+_CONVERSION_EDGE_OVERHEAD : numeric
+"""
+
 CONVERSION_SPECIFICATIONS = [
-    Conversion_Specification(*specification)
-    for specification in CONVERSION_SPECIFICATIONS_DATA
+    Conversion_Specification(
+        *specification,
+        *_CONVERSION_WEIGHTS.get(
+            (specification[0].lower(), specification[1].lower()),
+            (None, None))) for specification in CONVERSION_SPECIFICATIONS_DATA
 ]
 """
 Automatic colour conversion graph specifications describing two nodes and
@@ -555,12 +670,106 @@ CONVERSION_GRAPH_NODE_LABELS.update({
     for specification in CONVERSION_SPECIFICATIONS_DATA
 })
 
+CONVERSION_LINEAR_FUNCTIONS = {
+    RGB_to_XYZ: ('cctf_decoding', ),
+    XYZ_to_RGB: ('cctf_encoding', ),
+    RGB_to_RGB: ('apply_cctf_decoding', 'apply_cctf_encoding'),
+    XYZ_to_UCS: (),
+    UCS_to_XYZ: (),
+    RGB_to_YCoCg: (),
+    YCoCg_to_RGB: (),
+}
+"""
+Automatic colour conversion graph linear conversion functions, i.e. the
+conversion functions reducing to a :math:`3 \\times 3` matrix product, and
+the names of their keyword arguments making them non-linear when set.
+
+CONVERSION_LINEAR_FUNCTIONS : dict
+"""
+
+
+def _conversion_weights(specifications=None):
+    """
+    Returns the automatic colour conversion graph edges weights.
+
+    Parameters
+    ----------
+    specifications : list, optional
+        Automatic colour conversion graph specifications, default to
+        :attr:`colour.graph.conversion.CONVERSION_SPECIFICATIONS` attribute.
+
+    Returns
+    -------
+    dict
+        Edge weight by source and target nodes.
+    """
+
+    if specifications is None:
+        specifications = CONVERSION_SPECIFICATIONS
+
+    # The edges whose cost has not been measured are weighted with the
+    # highest measured cost so that the measured edges are favoured.
+    costs = [
+        specification.cost for specification in specifications
+        if specification.cost is not None
+    ]
+    default_cost = max(costs) if costs else 1
+
+    # The lossy edges are penalised with the total weight of the graph so
+    # that the paths with the fewest lossy edges are favoured irrespective of
+    # their cost.
+    penalty = (sum(costs) + default_cost * (len(specifications) - len(costs)) +
+               _CONVERSION_EDGE_OVERHEAD * len(specifications))
+
+    weights = {}
+    for specification in specifications:
+        cost = (default_cost
+                if specification.cost is None else specification.cost)
+        lossy = (specification.error is not None and
+                 specification.error > _CONVERSION_ERROR_TOLERANCE)
+
+        weight = _CONVERSION_EDGE_OVERHEAD + cost
+        weights[(specification.source,
+                 specification.target)] = (weight + penalty
+                                           if lossy else weight)
+
+    return weights
+
+
+def _conversion_weights_digest(specifications=None):
+    """
+    Returns the digest of the automatic colour conversion graph edges weights,
+    it is stored in the next hops table header to detect whether the table
+    matches the weights.
+
+    Parameters
+    ----------
+    specifications : list, optional
+        Automatic colour conversion graph specifications, default to
+        :attr:`colour.graph.conversion.CONVERSION_SPECIFICATIONS` attribute.
+
+    Returns
+    -------
+    unicode
+        Edges weights digest.
+    """
+
+    weights = sorted(_conversion_weights(specifications).items())
+
+    return hashlib.sha256(repr(weights).encode('utf-8')).hexdigest()
+
 
 @required('NetworkX')
-def _build_graph():
+def _build_graph(specifications=None):
     """
     Builds the automatic colour conversion graph.
 
+    Parameters
+    ----------
+    specifications : list, optional
+        Automatic colour conversion graph specifications, default to
+        :attr:`colour.graph.conversion.CONVERSION_SPECIFICATIONS` attribute.
+
     Returns
     -------
     DiGraph
@@ -569,30 +778,231 @@ def _build_graph():
 
     import networkx as nx
 
+    if specifications is None:
+        specifications = CONVERSION_SPECIFICATIONS
+
+    weights = _conversion_weights(specifications)
+
     graph = nx.DiGraph()
 
-    for specification in CONVERSION_SPECIFICATIONS:
+    for specification in specifications:
         graph.add_edge(
             specification.source,
             specification.target,
-            conversion_function=specification.conversion_function)
+            conversion_function=specification.conversion_function,
+            cost=specification.cost,
+            error=specification.error,
+            weight=weights[(specification.source, specification.target)])
 
     return graph
 
 
 CONVERSION_GRAPH = None
 """
-Automatic colour conversion graph.
+Automatic colour conversion graph, built on demand, e.g. for plotting or to
+regenerate the next hops table.
 
 CONVERSION_GRAPH : DiGraph
 """
 
 
 @required('NetworkX')
+def conversion_graph():
+    """
+    Returns the automatic colour conversion graph, building it if required.
+
+    Returns
+    -------
+    DiGraph
+         Automatic colour conversion graph.
+
+    Notes
+    -----
+    -   The conversion paths are resolved with a precomputed next hops table,
+        the graph is only required for inspection purposes, e.g. plotting,
+        or to rebuild the table.
+
+    Examples
+    --------
+    >>> graph = conversion_graph()
+    >>> graph.has_edge('cie xyz', 'cie lab')
+    True
+    """
+
+    import colour
+
+    global CONVERSION_GRAPH
+
+    if CONVERSION_GRAPH is None:
+        # Updating the :attr:`CONVERSION_GRAPH` attributes.
+        colour.graph.CONVERSION_GRAPH = CONVERSION_GRAPH = _build_graph()
+
+    return CONVERSION_GRAPH
+
+
+@required('NetworkX')
+def _build_conversion_next_hops(graph=None):
+    """
+    Builds the all-pairs next hops table of given automatic colour conversion
+    graph, i.e. the node following the source node on the shortest path from
+    the source node to the target node.
+
+    Parameters
+    ----------
+    graph : DiGraph, optional
+        Automatic colour conversion graph, default to
+        :attr:`colour.graph.CONVERSION_GRAPH` attribute.
+
+    Returns
+    -------
+    dict
+        Next node by source and target nodes.
+
+    Examples
+    --------
+    >>> next_hops = _build_conversion_next_hops()
+    >>> next_hops[('cie lab', 'cct')]
+    'cie xyz'
+    """
+
+    import networkx as nx
+
+    if graph is None:
+        graph = conversion_graph()
+
+    # The shortest paths to a target form a tree, finding them on the reversed
+    # graph guarantees that the next hops of all the sources agree with each
+    # other.
+    reversed_graph = graph.reverse(copy=False)
+
+    next_hops = {}
+    for target in sorted(graph.nodes):
+        paths = nx.single_source_dijkstra_path(
+            reversed_graph, target, weight='weight')
+        for source, path in paths.items():
+            if source != target:
+                next_hops[(source, target)] = path[-2]
+
+    return next_hops
+
+
+def _write_conversion_next_hops(next_hops,
+                                path=PATH_CONVERSION_NEXT_HOPS,
+                                digest=''):
+    """
+    Writes given automatic colour conversion graph next hops table to given
+    path.
+
+    Parameters
+    ----------
+    next_hops : dict
+        Next node by source and target nodes.
+    path : unicode, optional
+        Conversion graph next hops table file path.
+    digest : unicode, optional
+        Digest of the edges weights the table has been built with.
+
+    Notes
+    -----
+    -   The table is written as a matrix whose rows are the source nodes and
+        columns the target nodes, the unreachable target nodes are left
+        empty. The edges weights digest is written in the header first cell.
+    """
+
+    nodes = sorted(set(node for pair in next_hops for node in pair))
+
+    with open(path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file, lineterminator='\n')
+        writer.writerow([digest] + nodes)
+        for source in nodes:
+            writer.writerow(
+                [source] +
+                [next_hops.get((source, target), '') for target in nodes])
+
+
+def _read_conversion_next_hops(path=PATH_CONVERSION_NEXT_HOPS):
+    """
+    Reads the automatic colour conversion graph next hops table from given
+    path.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Conversion graph next hops table file path.
+
+    Returns
+    -------
+    tuple
+        Next node by source and target nodes and digest of the edges weights
+        the table has been built with.
+    """
+
+    next_hops = {}
+
+    if not os.path.exists(path):
+        return next_hops, ''
+
+    with open(path, newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader)
+        digest, targets = header[0], header[1:]
+        for row in reader:
+            for target, next_hop in zip(targets, row[1:]):
+                if next_hop:
+                    next_hops[(row[0], target)] = next_hop
+
+    return next_hops, digest
+
+
+_CONVERSION_FUNCTIONS = {(specification.source, specification.target):
+                         specification.conversion_function
+                         for specification in CONVERSION_SPECIFICATIONS}
+"""
+Automatic colour conversion graph conversion functions by source and target
+nodes.
+
+_CONVERSION_FUNCTIONS : dict
+"""
+
+_CONVERSION_NEXT_HOPS = None
+"""
+Automatic colour conversion graph next hops table.
+
+_CONVERSION_NEXT_HOPS : dict
+"""
+
+
+def _conversion_next_hops():
+    """
+    Returns the automatic colour conversion graph next hops table, reading it
+    from :attr:`colour.graph.conversion.PATH_CONVERSION_NEXT_HOPS` attribute
+    path or building it with `NetworkX <https://networkx.github.io/>`__ if it
+    is missing or has not been built with the current edges weights.
+
+    Returns
+    -------
+    dict
+        Next node by source and target nodes.
+    """
+
+    global _CONVERSION_NEXT_HOPS
+
+    if _CONVERSION_NEXT_HOPS is None:
+        next_hops, digest = _read_conversion_next_hops()
+
+        if digest != _conversion_weights_digest():
+            next_hops = _build_conversion_next_hops()
+
+        _CONVERSION_NEXT_HOPS = next_hops
+
+    return _CONVERSION_NEXT_HOPS
+
+
 def _conversion_path(source, target):
     """
     Returns the conversion path from the source node to the target node in the
-    automatic colour conversion graph.
+    automatic colour conversion graph, i.e. the path with the lowest
+    accumulated conversion cost weighted by the precision loss.
 
     Parameters
     ----------
@@ -607,6 +1017,12 @@ def _conversion_path(source, target):
         Conversion path from the source node to the target node, i.e. a list of
         conversion function callables.
 
+    Raises
+    ------
+    ValueError
+        If the target node is not reachable from the source node or the next
+        hops table does not lead to it.
+
     Examples
     --------
     >>> _conversion_path('cie lab', 'cct')
@@ -615,21 +1031,29 @@ def _conversion_path(source, target):
 <function UCS_to_uv at 0x...>, <function uv_to_CCT at 0x...>]
     """
 
-    import colour
-    import networkx as nx
+    next_hops = _conversion_next_hops()
 
-    global CONVERSION_GRAPH
+    path = []
+    node = source
+    while node != target:
+        next_hop = next_hops.get((node, target))
 
-    if CONVERSION_GRAPH is None:
-        # Updating the :attr:`CONVERSION_GRAPH` attributes.
-        colour.graph.CONVERSION_GRAPH = CONVERSION_GRAPH = _build_graph()
+        if next_hop is None:
+            raise ValueError(
+                '"{0}" is not reachable from "{1}" in the automatic colour '
+                'conversion graph!'.format(target, source))
 
-    path = nx.shortest_path(CONVERSION_GRAPH, source, target)
+        # A path cannot have more edges than the graph has nodes, a longer
+        # walk means that the next hops table has a cycle.
+        if len(path) == len(CONVERSION_GRAPH_NODE_LABELS):
+            raise ValueError(
+                'The automatic colour conversion graph next hops table does '
+                'not lead from "{0}" to "{1}"!'.format(source, target))
 
-    return [
-        CONVERSION_GRAPH.get_edge_data(a, b)['conversion_function']
-        for a, b in zip(path[:-1], path[1:])
-    ]
+        path.append(_CONVERSION_FUNCTIONS[(node, next_hop)])
+        node = next_hop
+
+    return path
 
 
 def _lower_order_function(callable_):
@@ -652,6 +1076,28 @@ def _lower_order_function(callable_):
     return callable_.func if isinstance(callable_, partial) else callable_
 
 
+def _usage_warning_conversion_graph(definition):
+    """
+    Issues the automatic colour conversion graph beta feature usage warning.
+
+    Parameters
+    ----------
+    definition : unicode
+        Name of the definition issuing the warning.
+    """
+
+    # TODO: Remove the following warning whenever the automatic colour
+    # conversion graph implementation is considered stable.
+    usage_warning(
+        'The "Automatic Colour Conversion Graph" is a beta feature, be '
+        'mindful of this when using it. Please report any unexpected '
+        'behaviour and do not hesitate to ask any questions should they arise.'
+        '\nThis warning can be disabled with the '
+        '"colour.utilities.suppress_warnings" context manager as follows:\n'
+        'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
+        '\n    {0}(*args, **kwargs)'.format(definition))
+
+
 def describe_conversion_path(source,
                              target,
                              mode='Short',
@@ -762,14 +1208,497 @@ def describe_conversion_path(source,
             message_box(message, width, padding, print_callable)
 
 
+def _conversion_steps(source, target, names):
+    """
+    Returns the conversion steps from the source node to the target node in
+    the automatic colour conversion graph for given keyword arguments names.
+
+    The steps are memoised so that the shortest path search and the
+    conversion functions signature inspection happen only once per source,
+    target and keyword arguments names.
+
+    Parameters
+    ----------
+    source : unicode
+        Source node.
+    target : unicode
+        Target node.
+    names : tuple
+        Sorted keyword arguments names.
+
+    Returns
+    -------
+    tuple
+        Conversion steps, i.e. a tuple of conversion function callable,
+        conversion function name and names of the keyword arguments directly
+        passed to it.
+
+    Examples
+    --------
+    >>> _conversion_steps('cie lab', 'cie xyy', ('illuminant', 'method'))
+    ... # doctest: +ELLIPSIS
+    ((<function Lab_to_XYZ at 0x...>, 'Lab_to_XYZ', ('illuminant',)), \
+(<function XYZ_to_xyY at 0x...>, 'XYZ_to_xyY', ('illuminant',)))
+    """
+
+    key = (source, target, names)
+
+    steps = _CACHE_CONVERSION_STEPS.get(key)
+    if steps is not None:
+        return steps
+
+    kwargs = dict.fromkeys(names)
+    steps = [(conversion_function,
+              _lower_order_function(conversion_function).__name__,
+              tuple(filter_kwargs(conversion_function, **kwargs)))
+             for conversion_function in _conversion_path(source, target)]
+
+    return _CACHE_CONVERSION_STEPS.set(key, steps)
+
+
+def _is_linear_conversion(conversion_function, filtered_kwargs):
+    """
+    Returns whether given conversion function reduces to a
+    :math:`3 \\times 3` matrix product with given filtered keyword arguments.
+
+    Parameters
+    ----------
+    conversion_function : callable
+        Conversion function.
+    filtered_kwargs : dict
+        Keyword arguments the conversion function is called with.
+
+    Returns
+    -------
+    bool
+        Whether the conversion function is linear.
+
+    Examples
+    --------
+    >>> _is_linear_conversion(XYZ_to_UCS, {})
+    True
+    >>> _is_linear_conversion(XYZ_to_RGB, {'cctf_encoding': cctf_encoding})
+    False
+    """
+
+    non_linear_names = CONVERSION_LINEAR_FUNCTIONS.get(
+        _lower_order_function(conversion_function))
+
+    if non_linear_names is None:
+        return False
+
+    kwargs = dict(getattr(conversion_function, 'keywords', {}))
+    kwargs.update(filtered_kwargs)
+
+    return not any(kwargs.get(name) for name in non_linear_names)
+
+
+def _conversion_matrix(conversion_function, filtered_kwargs):
+    """
+    Returns the :math:`3 \\times 3` matrix given conversion function reduces
+    to with given filtered keyword arguments if it is linear.
+
+    Parameters
+    ----------
+    conversion_function : callable
+        Conversion function.
+    filtered_kwargs : dict
+        Keyword arguments the conversion function is called with.
+
+    Returns
+    -------
+    ndarray or None
+        Conversion matrix or *None* if the conversion function is not linear.
+
+    Examples
+    --------
+    >>> _conversion_matrix(XYZ_to_UCS, {})
+    array([[ 0.66666667,  0.        ,  0.        ],
+           [ 0.        ,  1.        ,  0.        ],
+           [-0.5       ,  1.5       ,  0.5       ]])
+    >>> _conversion_matrix(XYZ_to_sRGB, {}) is None
+    True
+    """
+
+    if not _is_linear_conversion(conversion_function, filtered_kwargs):
+        return None
+
+    # The conversion function is evaluated on the basis vectors, yielding the
+    # matrix columns.
+    with domain_range_scale('1'):
+        return np.transpose(
+            conversion_function(np.identity(3), **filtered_kwargs))
+
+
+class ConversionPlan:
+    """
+    Defines a conversion plan from source colour representation to target
+    colour representation using the automatic colour conversion graph.
+
+    The conversion path is resolved and the keyword arguments are filtered
+    for each conversion function upon instantiation so that calling the plan
+    only performs the conversion. The consecutive linear conversion functions,
+    e.g. :func:`colour.RGB_to_XYZ` followed by :func:`colour.XYZ_to_UCS`, are
+    fused into a single :math:`3 \\times 3` matrix product.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.graph.ConversionPlan.source`
+    -   :attr:`~colour.graph.ConversionPlan.target`
+    -   :attr:`~colour.graph.ConversionPlan.conversion_path`
+    -   :attr:`~colour.graph.ConversionPlan.steps`
+    -   :attr:`~colour.graph.ConversionPlan.operations`
+    -   :attr:`~colour.graph.ConversionPlan.operations_indexes`
+
+    Methods
+    -------
+    -   :meth:`~colour.graph.ConversionPlan.__init__`
+    -   :meth:`~colour.graph.ConversionPlan.__repr__`
+    -   :meth:`~colour.graph.ConversionPlan.__call__`
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> plan = ConversionPlan('CIE XYZ', 'CIE xyY')
+    >>> plan
+    ConversionPlan('CIE XYZ', 'CIE xyY', ['XYZ_to_xyY'])
+    >>> plan(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.5436955...,  0.3210794...,  0.1219722...])
+    """
+
+    def __init__(self, source, target, **kwargs):
+        self._source = source
+        self._target = target
+
+        steps = []
+        for (conversion_function, conversion_function_name,
+             names) in _conversion_steps(source.lower(), target.lower(),
+                                         tuple(sorted(kwargs))):
+            # Filtering compatible keyword arguments passed directly and
+            # irrespective of any conversion function name.
+            filtered_kwargs = {name: kwargs[name] for name in names}
+
+            # Filtering keyword arguments passed as dictionary with the
+            # conversion function name.
+            filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+
+            steps.append((conversion_function, filtered_kwargs))
+
+        self._steps = tuple(steps)
+
+        # Fusing the consecutive linear conversion functions into a single
+        # matrix product, the matrices are only evaluated for the runs of at
+        # least two linear conversion functions.
+        # The index of the step following each operation is stored so that
+        # the operations can be matched with the steps they perform.
+        operations, indexes, index = [], [], 0
+        for is_linear, group in groupby(
+                self._steps, lambda step: _is_linear_conversion(*step)):
+            group = list(group)
+
+            if is_linear and len(group) > 1:
+                matrix = _conversion_matrix(*group[0])
+                for step in group[1:]:
+                    matrix = matrix_dot(_conversion_matrix(*step), matrix)
+
+                index += len(group)
+                operations.append((partial(vector_dot, matrix), {}))
+                indexes.append(index)
+            else:
+                for step in group:
+                    index += 1
+                    operations.append(step)
+                    indexes.append(index)
+
+        self._operations = tuple(operations)
+        self._operations_indexes = tuple(indexes)
+
+    @property
+    def source(self):
+        """
+        Getter property for the conversion plan source colour
+        representation.
+
+        Returns
+        -------
+        unicode
+            Source colour representation.
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """
+        Getter property for the conversion plan target colour
+        representation.
+
+        Returns
+        -------
+        unicode
+            Target colour representation.
+        """
+
+        return self._target
+
+    @property
+    def conversion_path(self):
+        """
+        Getter property for the conversion plan conversion path.
+
+        Returns
+        -------
+        list
+            Conversion path, i.e. a list of conversion function callables.
+        """
+
+        return [conversion_function for conversion_function, _ in self._steps]
+
+    @property
+    def steps(self):
+        """
+        Getter property for the conversion plan steps.
+
+        Returns
+        -------
+        tuple
+            Conversion steps, i.e. a tuple of conversion function callable and
+            filtered keyword arguments pairs.
+        """
+
+        return self._steps
+
+    @property
+    def operations(self):
+        """
+        Getter property for the conversion plan operations, i.e. the steps
+        with the consecutive linear conversion functions fused into a single
+        matrix product.
+
+        Returns
+        -------
+        tuple
+            Conversion operations, i.e. a tuple of callable and keyword
+            arguments pairs.
+        """
+
+        return self._operations
+
+    @property
+    def operations_indexes(self):
+        """
+        Getter property for the conversion plan operations indexes, i.e. the
+        index of the step following each operation: the operation :math:`i`
+        performs the steps from the index of the operation :math:`i - 1`, or
+        zero, up to its index.
+
+        Returns
+        -------
+        tuple
+            Conversion operations indexes.
+        """
+
+        return self._operations_indexes
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the conversion plan.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, {2!r}, {3!r})'.format(
+            self.__class__.__name__, self._source, self._target, [
+                _lower_order_function(conversion_function).__name__
+                for conversion_function in self.conversion_path
+            ])
+
+    def __call__(self, a):
+        """
+        Converts given object :math:`a` from the source colour representation
+        to the target colour representation.
+
+        Parameters
+        ----------
+        a : array_like or numeric or SpectralDistribution
+            Object :math:`a` to convert.
+
+        Returns
+        -------
+        ndarray or numeric or SpectralDistribution
+            Converted object :math:`a`.
+        """
+
+        with domain_range_scale('1'):
+            for operation, filtered_kwargs in self._operations:
+                a = operation(a, **filtered_kwargs)
+
+        return a
+
+
+def _freeze_kwargs(value):
+    """
+    Returns a hashable representation of given keyword arguments value whose
+    leaves are immutable, i.e. *unicode*, *numeric* or *None* values, nested
+    in *dict* and *tuple* instances.
+
+    Parameters
+    ----------
+    value : object
+        Keyword arguments value.
+
+    Returns
+    -------
+    tuple
+        Hashable representation of the keyword arguments value.
+
+    Raises
+    ------
+    TypeError
+        If the keyword arguments value has mutable leaves, e.g. *ndarray*
+        instances.
+    """
+
+    if isinstance(value, Mapping):
+        return Mapping, tuple(
+            sorted((name, _freeze_kwargs(value_i))
+                   for name, value_i in value.items()))
+    elif isinstance(value, tuple):
+        return tuple, tuple(_freeze_kwargs(value_i) for value_i in value)
+    elif value is None or isinstance(value, (str, Number)):
+        # The type distinguishes the equal values of distinct types, e.g.
+        # *True* and *1*.
+        return type(value), value
+    else:
+        raise TypeError('"{0}" is not immutable!'.format(value))
+
+
+def _conversion_plan(source, target, **kwargs):
+    """
+    Returns the conversion plan from source colour representation to target
+    colour representation, the plans are memoised when the keyword arguments
+    values are immutable.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation.
+    target : unicode
+        Target colour representation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ConversionPlan
+        Conversion plan.
+    """
+
+    try:
+        key = (source, target, _freeze_kwargs(kwargs))
+    except TypeError:
+        return ConversionPlan(source, target, **kwargs)
+
+    plan = _CACHE_CONVERSION_PLANS.get(key)
+    if plan is None:
+        plan = _CACHE_CONVERSION_PLANS.set(
+            key, ConversionPlan(source, target, **kwargs))
+
+    return plan
+
+
+def conversion_plan(source, target, **kwargs):
+    """
+    Returns the conversion plan from source colour representation to target
+    colour representation using the automatic colour conversion graph.
+
+    The plan performs the same conversion than the :func:`colour.convert`
+    definition but the conversion path is resolved and the keyword arguments
+    are filtered only once, it is thus suitable for repeated conversions, e.g.
+    in loops.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ConversionPlan
+        Conversion plan.
+
+    Notes
+    -----
+    -   The conversion steps are memoised per source, target and keyword
+        arguments names, the keyword arguments values are bound to the
+        returned plan.
+    -   The conversion plans are memoised when the keyword arguments values
+        are immutable, i.e. *unicode*, *numeric* or *None* values, nested in
+        *dict* and *tuple* instances. The memoised plans are shared and must
+        not be modified.
+    -   The conversion plan adopts the **'1'** domain-range scale.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> illuminant = CCS_ILLUMINANTS[
+    ...     'CIE 1931 2 Degree Standard Observer']['D50']
+    >>> plan = conversion_plan('CIE XYZ', 'CIE Lab', illuminant=illuminant)
+    >>> plan(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.4152787...,  0.5119354...,  0.1991843...])
+    """
+
+    _usage_warning_conversion_graph('conversion_plan')
+
+    return _conversion_plan(source, target, **kwargs)
+
+
 @domain_range_scale('1')
 def convert(a, source, target, **kwargs):
     """
     Converts given object :math:`a` from source colour representation to target
     colour representation using the automatic colour conversion graph.
 
-    The conversion is performed by finding the shortest path in a
-    `NetworkX <https://networkx.github.io/>`__ :class:`DiGraph` class instance.
+    The conversion is performed by following the shortest path in the
+    automatic colour conversion graph, i.e. the path with the fewest edges,
+    whose ties are broken with the measured cost and precision loss of the
+    conversion definitions. The shortest paths are resolved with a precomputed
+    next hops table so that `NetworkX <https://networkx.github.io/>`__ is only
+    required to rebuild it.
 
     The conversion path adopts the **'1'** domain-range scale and the object
     :math:`a` is expected to be *soft* normalised accordingly. For example,
@@ -953,34 +1882,20 @@ verbose={'mode': 'Long'})
     array([ 0.4567576...,  0.3098826...,  0.2486222...])
     """
 
-    # TODO: Remove the following warning whenever the automatic colour
-    # conversion graph implementation is considered stable.
-    usage_warning(
-        'The "Automatic Colour Conversion Graph" is a beta feature, be '
-        'mindful of this when using it. Please report any unexpected '
-        'behaviour and do not hesitate to ask any questions should they arise.'
-        '\nThis warning can be disabled with the '
-        '"colour.utilities.suppress_warnings" context manager as follows:\n'
-        'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
-        '\n    convert(*args, **kwargs)')
+    _usage_warning_conversion_graph('convert')
 
     source, target = source.lower(), target.lower()
 
-    conversion_path = _conversion_path(source, target)
+    plan = _conversion_plan(source, target, **kwargs)
+
+    if 'verbose' not in kwargs:
+        return plan(a)
 
     verbose_kwargs = copy(kwargs)
-    for conversion_function in conversion_path:
+    for conversion_function, filtered_kwargs in plan.steps:
         conversion_function_name = _lower_order_function(
             conversion_function).__name__
 
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
-
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
-
         a = conversion_function(a, **filtered_kwargs)
 
         if conversion_function_name in verbose_kwargs:
@@ -988,8 +1903,115 @@ verbose={'mode': 'Long'})
         else:
             verbose_kwargs[conversion_function_name] = {'return': a}
 
-    if 'verbose' in verbose_kwargs:
+    verbose_kwargs.update(verbose_kwargs.pop('verbose'))
+    describe_conversion_path(source, target, **verbose_kwargs)
+
+    return a
+
+
+@domain_range_scale('1')
+def convert_many(a, source, targets, **kwargs):
+    """
+    Converts given object :math:`a` from source colour representation to many
+    target colour representations using the automatic colour conversion
+    graph.
+
+    The conversion paths to the target colour representations form a tree
+    rooted at the source colour representation whose shared nodes, e.g. the
+    *CIE XYZ* tristimulus values computed from a spectral distribution, are
+    evaluated only once.
+
+    Parameters
+    ----------
+    a : array_like or numeric or SpectralDistribution
+        Object :math:`a` to convert.
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    targets : array_like
+        Target colour representations, i.e. the target nodes in the automatic
+        colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    dict
+        Converted object :math:`a` by target colour representation.
+
+    Notes
+    -----
+    -   The converted objects are the same than those of the
+        :func:`colour.convert` definition called for each target colour
+        representation. Likewise, the converted object for a target colour
+        representation equal to the source colour representation is the
+        object :math:`a` itself, not a copy.
+    -   The conversion plans are memoised as with the
+        :func:`colour.conversion_plan` definition.
+    -   With the ``verbose`` keyword argument, the conversion path to each
+        target colour representation is described as with the
+        :func:`colour.convert` definition and the consecutive linear
+        conversion functions are not fused.
+
+    Examples
+    --------
+    >>> from colour import SDS_COLOURCHECKERS
+    >>> sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+    >>> converted = convert_many(
+    ...     sd, 'Spectral Distribution', ['CIE Lab', 'CIE LCHab', 'sRGB'])
+    >>> converted['CIE Lab']  # doctest: +ELLIPSIS
+    array([ 0.3730363...,  0.1369094...,  0.1556622...])
+    >>> converted['CIE LCHab']  # doctest: +ELLIPSIS
+    array([ 0.3730363...,  0.2073039...,  0.1351873...])
+    >>> converted['sRGB']  # doctest: +ELLIPSIS
+    array([ 0.4567579...,  0.3098698...,  0.2486192...])
+    """
+
+    _usage_warning_conversion_graph('convert_many')
+
+    # The converted objects are memoised by the conversion functions leading
+    # to them: the conversion functions are shared by the paths going through
+    # the same edges.
+    converted = {(): a}
+
+    results = {}
+    for target in targets:
+        plan = _conversion_plan(source.lower(), target.lower(), **kwargs)
+        conversion_path = tuple(plan.conversion_path)
+
+        if 'verbose' in kwargs:
+            # The steps are not fused so that the object returned by each
+            # conversion function can be described.
+            operations = zip(plan.steps, range(1, len(plan.steps) + 1))
+        else:
+            operations = zip(plan.operations, plan.operations_indexes)
+
+        key = ()
+        for (operation, filtered_kwargs), index in operations:
+            a_i = converted[key]
+            key = conversion_path[:index]
+            if key not in converted:
+                converted[key] = operation(a_i, **filtered_kwargs)
+
+        results[target] = converted[key]
+
+        if 'verbose' not in kwargs:
+            continue
+
+        verbose_kwargs = copy(kwargs)
+        for index, conversion_function in enumerate(conversion_path, 1):
+            conversion_function_name = _lower_order_function(
+                conversion_function).__name__
+
+            verbose_kwargs[conversion_function_name] = dict(
+                verbose_kwargs.get(conversion_function_name, {}),
+                **{'return': converted[conversion_path[:index]]})
+
         verbose_kwargs.update(verbose_kwargs.pop('verbose'))
         describe_conversion_path(source, target, **verbose_kwargs)
 
-    return a
+    return results
@@ -4,12 +4,27 @@ Defines unit tests for :mod:`colour.graph.conversion` module.
 """
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import CCS_ILLUMINANTS, SDS_ILLUMINANTS
-from colour.models import COLOURSPACE_MODELS, RGB_COLOURSPACE_ACES2065_1
-from colour.graph import describe_conversion_path, convert
+from colour.models import (COLOURSPACE_MODELS, RGB_COLOURSPACE_ACES2065_1,
+                           RGB_COLOURSPACE_ACESCG, eotf_inverse_sRGB)
+from colour.graph import (conversion_graph, describe_conversion_path,
+                          ConversionPlan, conversion_plan, convert,
+                          convert_many)
+import colour.graph.conversion
+from colour.graph.conversion import (
+    CONVERSION_SPECIFICATIONS, _CACHE_CONVERSION_PLANS,
+    _CACHE_CONVERSION_STEPS, _build_conversion_next_hops, _conversion_path,
+    _conversion_weights_digest, _lower_order_function,
+    _read_conversion_next_hops, _read_conversion_weights,
+    _write_conversion_next_hops)
+from colour.utilities import caching_enable
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -18,7 +33,227 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDescribeConversionPath', 'TestConvert']
+__all__ = [
+    'TestReadConversionWeights', 'TestConversionNextHops',
+    'TestConversionPath', 'TestDescribeConversionPath', 'TestConversionPlan',
+    'TestConvert', 'TestConvertMany'
+]
+
+
+class TestReadConversionWeights(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion._read_conversion_weights`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_conversion_weights(self):
+        """
+        Tests :func:`colour.graph.conversion._read_conversion_weights`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'weights.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('source,target,cost,error\n'
+                           'CIE XYZ,CIE Lab,350.5,3.490e-16\n'
+                           'CIE XYZ,Whiteness,553.5,\n')
+
+        self.assertDictEqual(
+            _read_conversion_weights(path), {
+                ('cie xyz', 'cie lab'): (350.5, 3.490e-16),
+                ('cie xyz', 'whiteness'): (553.5, None),
+            })
+
+        self.assertDictEqual(
+            _read_conversion_weights(
+                os.path.join(self._temporary_directory, 'None.csv')), {})
+
+    def test_conversion_specifications_weights(self):
+        """
+        Tests whether the conversion specifications are weighted with the
+        measured conversion costs.
+        """
+
+        specifications = {(specification.source, specification.target):
+                          specification
+                          for specification in CONVERSION_SPECIFICATIONS}
+
+        for specification in specifications.values():
+            self.assertTrue(specification.cost is None or
+                            specification.cost > 0)
+
+        # The iterative "CIE UCS uv" to "CCT" conversion must be much more
+        # costly than the analytical "CIE XYZ" to "CIE Lab" conversion.
+        self.assertGreater(specifications[('cie ucs uv', 'cct')].cost,
+                           specifications[('cie xyz', 'cie lab')].cost * 100)
+
+    def test_conversion_path_precision_loss(self):
+        """
+        Tests whether the conversion paths avoid the conversions discarding
+        information when a lossless path exists.
+        """
+
+        # "CIE Luv" to "CIE Luv uv" and "CIE xy" discard the luminance.
+        self.assertListEqual([
+            function.__name__ for function in ConversionPlan(
+                'CIE Luv', 'CIE xyY').conversion_path
+        ], ['Luv_to_XYZ', 'XYZ_to_xyY'])
+
+
+class TestConversionNextHops(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion._write_conversion_next_hops` and
+    :func:`colour.graph.conversion._read_conversion_next_hops` definitions
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_read_conversion_next_hops(self):
+        """
+        Tests :func:`colour.graph.conversion._write_conversion_next_hops` and
+        :func:`colour.graph.conversion._read_conversion_next_hops`
+        definitions.
+        """
+
+        next_hops = {
+            ('cie lab', 'cie xyy'): 'cie xyz',
+            ('cie xyz', 'cie xyy'): 'cie xyy',
+            ('cie xyy', 'cie lab'): 'cie xyz',
+        }
+
+        path = os.path.join(self._temporary_directory, 'next_hops.csv')
+        _write_conversion_next_hops(next_hops, path, 'digest')
+
+        self.assertTupleEqual(
+            _read_conversion_next_hops(path), (next_hops, 'digest'))
+
+        self.assertTupleEqual(
+            _read_conversion_next_hops(
+                os.path.join(self._temporary_directory, 'missing.csv')),
+            ({}, ''))
+
+    def test_conversion_next_hops(self):
+        """
+        Tests whether the shipped next hops table matches the automatic colour
+        conversion graph.
+        """
+
+        next_hops, digest = _read_conversion_next_hops()
+        self.assertDictEqual(next_hops, _build_conversion_next_hops())
+        self.assertEqual(digest, _conversion_weights_digest())
+
+    def test_conversion_weights_digest(self):
+        """
+        Tests :func:`colour.graph.conversion._conversion_weights_digest`
+        definition.
+        """
+
+        specifications = list(CONVERSION_SPECIFICATIONS)
+        digest = _conversion_weights_digest(specifications)
+        self.assertEqual(digest, _conversion_weights_digest())
+
+        specifications[0] = specifications[0]._replace(
+            cost=specifications[0].cost * 2)
+        self.assertNotEqual(_conversion_weights_digest(specifications), digest)
+
+    def test_conversion_graph(self):
+        """
+        Tests :func:`colour.graph.conversion.conversion_graph` definition.
+        """
+
+        graph = conversion_graph()
+        self.assertIs(conversion_graph(), graph)
+        self.assertIs(colour.graph.CONVERSION_GRAPH, graph)
+        self.assertEqual(graph.number_of_edges(),
+                         len(CONVERSION_SPECIFICATIONS))
+
+
+class TestConversionPath(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion._conversion_path` definition unit
+    tests methods.
+    """
+
+    def test_conversion_path(self):
+        """
+        Tests :func:`colour.graph.conversion._conversion_path` definition.
+        """
+
+        self.assertListEqual(_conversion_path('cie xyz', 'cie xyz'), [])
+
+        self.assertListEqual([
+            function.__name__
+            for function in _conversion_path('cie lab', 'cie xyy')
+        ], ['Lab_to_XYZ', 'XYZ_to_xyY'])
+
+        for source, target, path in (
+            ('cie xyz', 'cie xy', ['XYZ_to_xy']),
+            ('cie xyz', 'cie ucs', ['XYZ_to_UCS']),
+            ('cie xyz', 'cie lchab', ['XYZ_to_Lab', 'Lab_to_LCHab']),
+            ('spectral distribution', 'srgb', ['sd_to_XYZ', 'XYZ_to_sRGB']),
+            ('cie lab', 'cct',
+             ['Lab_to_XYZ', 'XYZ_to_UCS', 'UCS_to_uv', 'uv_to_CCT']),
+        ):
+            self.assertListEqual([
+                _lower_order_function(function).__name__
+                for function in _conversion_path(source, target)
+            ], path)
+
+        # The direct edges are never replaced by longer paths.
+        for specification in CONVERSION_SPECIFICATIONS:
+            self.assertListEqual(
+                _conversion_path(specification.source.lower(),
+                                 specification.target.lower()),
+                [specification.conversion_function])
+
+    def test_raise_exception_conversion_path(self):
+        """
+        Tests :func:`colour.graph.conversion._conversion_path` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, _conversion_path, 'cie xyz',
+                          'wavelength')
+
+        self.assertRaises(ValueError, _conversion_path, 'cie xyz', 'undefined')
+
+        next_hops = colour.graph.conversion._CONVERSION_NEXT_HOPS
+        try:
+            colour.graph.conversion._CONVERSION_NEXT_HOPS = {
+                ('cie lab', 'cie xyy'): 'cie xyz',
+                ('cie xyz', 'cie xyy'): 'cie lab',
+            }
+            self.assertRaises(ValueError, _conversion_path, 'cie lab',
+                              'cie xyy')
+        finally:
+            colour.graph.conversion._CONVERSION_NEXT_HOPS = next_hops
 
 
 class TestDescribeConversionPath(unittest.TestCase):
@@ -47,6 +282,215 @@ class TestDescribeConversionPath(unittest.TestCase):
             })
 
 
+class TestConversionPlan(unittest.TestCase):
+    """
+    Defines :class:`colour.graph.conversion.ConversionPlan` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('source', 'target', 'conversion_path', 'steps',
+                               'operations', 'operations_indexes')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ConversionPlan))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__repr__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ConversionPlan))
+
+    def test_conversion_plan(self):
+        """
+        Tests :func:`colour.graph.conversion.conversion_plan` definition.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+
+        plan = conversion_plan('CIE XYZ', 'CAM16UCS')
+        self.assertEqual(plan.source, 'CIE XYZ')
+        self.assertEqual(plan.target, 'CAM16UCS')
+        self.assertEqual(len(plan.conversion_path), 3)
+        self.assertEqual(
+            repr(plan), "ConversionPlan('CIE XYZ', 'CAM16UCS', "
+            "['XYZ_to_CAM16', 'CAM16_to_JMh_CAM16', "
+            "'JMh_CAM16_to_UCS_Li2017'])")
+        np.testing.assert_almost_equal(
+            plan(a), convert(a, 'CIE XYZ', 'CAM16UCS'), decimal=7)
+
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+        for kwargs in ({
+                'illuminant': illuminant
+        }, {
+                'XYZ_to_xyY': {
+                    'illuminant': illuminant
+                }
+        }):
+            plan = conversion_plan('CIE Lab', 'CIE xyY', **kwargs)
+            np.testing.assert_almost_equal(
+                plan(a), convert(a, 'CIE Lab', 'CIE xyY', **kwargs), decimal=7)
+
+        plan = conversion_plan('CIE Lab', 'CIE xyY', illuminant=illuminant)
+        self.assertDictEqual(plan.steps[0][1], {'illuminant': illuminant})
+        self.assertDictEqual(plan.steps[1][1], {'illuminant': illuminant})
+
+        plan = conversion_plan(
+            'CIE Lab',
+            'CIE xyY',
+            illuminant=illuminant,
+            XYZ_to_xyY={'illuminant': np.array([0.3, 0.3])})
+        np.testing.assert_equal(plan.steps[1][1]['illuminant'], [0.3, 0.3])
+
+        self.assertEqual(
+            repr(conversion_plan('CIE XYZ', 'CIE xyY')),
+            "ConversionPlan('CIE XYZ', 'CIE xyY', ['XYZ_to_xyY'])")
+
+    def test_conversion_plan_linear_fusion(self):
+        """
+        Tests :class:`colour.graph.conversion.ConversionPlan` class linear
+        conversion functions fusion.
+        """
+
+        RGB = np.reshape(np.linspace(0, 1, 4 * 6 * 3), (4, 6, 3))
+
+        def convert_steps(a, plan):
+            """
+            Converts given array using the non-fused plan steps.
+            """
+
+            for conversion_function, filtered_kwargs in plan.steps:
+                a = conversion_function(a, **filtered_kwargs)
+
+            return a
+
+        plan = ConversionPlan('Scene-Referred RGB', 'CIE UCS')
+        self.assertEqual(len(plan.steps), 3)
+        self.assertEqual(len(plan.operations), 1)
+        self.assertTupleEqual(plan.operations_indexes, (3, ))
+        np.testing.assert_almost_equal(
+            plan(RGB), convert_steps(RGB, plan), decimal=7)
+
+        plan = ConversionPlan(
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACESCG})
+        self.assertEqual(len(plan.operations), 1)
+        np.testing.assert_almost_equal(
+            plan(RGB), convert_steps(RGB, plan), decimal=7)
+
+        plan = ConversionPlan('CIE XYZ', 'Output-Referred RGB')
+        self.assertEqual(len(plan.operations), 2)
+
+        plan = ConversionPlan(
+            'Scene-Referred RGB', 'CIE UCS', apply_cctf_encoding=True)
+        self.assertEqual(len(plan.operations), 2)
+        self.assertTupleEqual(plan.operations_indexes, (1, 3))
+        np.testing.assert_almost_equal(
+            plan(RGB), convert_steps(RGB, plan), decimal=7)
+
+        plan = ConversionPlan(
+            'CIE UCS', 'RGB', XYZ_to_RGB={'cctf_encoding': eotf_inverse_sRGB})
+        self.assertEqual(len(plan.operations), 2)
+        np.testing.assert_almost_equal(
+            plan(RGB), convert_steps(RGB, plan), decimal=7)
+
+        with mock.patch(
+                'colour.graph.conversion._conversion_matrix',
+                wraps=colour.graph.conversion._conversion_matrix
+        ) as conversion_matrix:
+            plan = ConversionPlan('CIE XYZ', 'RGB')
+            self.assertEqual(len(plan.operations), 1)
+            self.assertEqual(conversion_matrix.call_count, 0)
+
+            ConversionPlan('CIE XYZ', 'Output-Referred RGB')
+            self.assertEqual(conversion_matrix.call_count, 0)
+
+            ConversionPlan('Scene-Referred RGB', 'CIE UCS')
+            self.assertEqual(conversion_matrix.call_count, 3)
+
+    def test_conversion_plan_memoisation(self):
+        """
+        Tests :func:`colour.graph.conversion.conversion_plan` definition
+        conversion steps memoisation.
+        """
+
+        with caching_enable(True):
+            _CACHE_CONVERSION_STEPS.clear()
+
+            conversion_plan('CIE XYZ', 'CIE Lab')
+            conversion_plan('cie xyz', 'cie lab')
+            self.assertEqual(len(_CACHE_CONVERSION_STEPS), 1)
+            self.assertEqual(_CACHE_CONVERSION_STEPS.hits, 1)
+
+            conversion_plan('CIE XYZ', 'CIE Lab', illuminant=None)
+            self.assertEqual(len(_CACHE_CONVERSION_STEPS), 2)
+
+            illuminant = CCS_ILLUMINANTS[
+                'CIE 1931 2 Degree Standard Observer']['D50']
+            a = np.array([0.20654008, 0.12197225, 0.05136952])
+            np.testing.assert_almost_equal(
+                conversion_plan('CIE XYZ', 'CIE Lab',
+                                illuminant=illuminant)(a),
+                convert(a, 'CIE XYZ', 'CIE Lab', illuminant=illuminant),
+                decimal=7)
+            self.assertEqual(len(_CACHE_CONVERSION_STEPS), 2)
+
+    def test_conversion_plan_plans_memoisation(self):
+        """
+        Tests :func:`colour.graph.conversion.conversion_plan` definition
+        conversion plans memoisation.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+
+        with caching_enable(True):
+            _CACHE_CONVERSION_PLANS.clear()
+
+            plan = conversion_plan('CIE XYZ', 'CIE Lab')
+            self.assertIs(conversion_plan('CIE XYZ', 'CIE Lab'), plan)
+            convert(a, 'CIE XYZ', 'Output-Referred RGB')
+            convert(a, 'CIE XYZ', 'Output-Referred RGB')
+            self.assertEqual(len(_CACHE_CONVERSION_PLANS), 2)
+            self.assertEqual(_CACHE_CONVERSION_PLANS.hits, 2)
+
+            kwargs = {'XYZ_to_sRGB': {'apply_cctf_encoding': False}}
+            self.assertIs(
+                conversion_plan('CIE XYZ', 'sRGB', **kwargs),
+                conversion_plan('CIE XYZ', 'sRGB', **kwargs))
+            self.assertIsNot(
+                conversion_plan(
+                    'CIE XYZ',
+                    'sRGB',
+                    XYZ_to_sRGB={'apply_cctf_encoding': True}),
+                conversion_plan('CIE XYZ', 'sRGB', **kwargs))
+            self.assertIsNot(
+                conversion_plan(
+                    'CIE XYZ', 'sRGB', XYZ_to_sRGB={'apply_cctf_encoding': 0}),
+                conversion_plan('CIE XYZ', 'sRGB', **kwargs))
+
+            illuminant = CCS_ILLUMINANTS[
+                'CIE 1931 2 Degree Standard Observer']['D50']
+            self.assertIsNot(
+                conversion_plan('CIE XYZ', 'CIE Lab', illuminant=illuminant),
+                conversion_plan('CIE XYZ', 'CIE Lab', illuminant=illuminant))
+            self.assertEqual(len(_CACHE_CONVERSION_PLANS), 5)
+
+        with caching_enable(False):
+            self.assertIsNot(
+                conversion_plan('CIE XYZ', 'CIE Lab'),
+                conversion_plan('CIE XYZ', 'CIE Lab'))
+
+
 class TestConvert(unittest.TestCase):
     """
     Defines :func:`colour.graph.conversion.convert` definition unit tests
@@ -58,6 +502,11 @@ class TestConvert(unittest.TestCase):
         Tests :func:`colour.graph.conversion.convert` definition.
         """
 
+        np.testing.assert_almost_equal(
+            convert(np.array([0, 0, 0]), 'CIE XYZ', 'CIE xy'),
+            np.array([0.31270000, 0.32900000]),
+            decimal=7)
+
         RGB_a = convert(SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin'],
                         'Spectral Distribution', 'sRGB')
         np.testing.assert_almost_equal(
@@ -133,5 +582,93 @@ class TestConvert(unittest.TestCase):
             illuminant=tuple(illuminant)))
 
 
+class TestConvertMany(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.convert_many` definition unit tests
+    methods.
+    """
+
+    def test_convert_many(self):
+        """
+        Tests :func:`colour.graph.conversion.convert_many` definition.
+        """
+
+        sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+        targets = [
+            'CIE XYZ', 'CIE Lab', 'CIE LCHab', 'CAM16', 'CAM16UCS', 'CAM16LCD',
+            'sRGB', 'CIE UCS', 'CIE UVW'
+        ]
+        illuminant = SDS_ILLUMINANTS['FL2']
+
+        converted = convert_many(
+            sd,
+            'Spectral Distribution',
+            targets,
+            sd_to_XYZ={'illuminant': illuminant})
+        self.assertListEqual(list(converted.keys()), targets)
+
+        for target in targets:
+            np.testing.assert_equal(
+                np.asarray(converted[target]),
+                np.asarray(
+                    convert(
+                        sd,
+                        'Spectral Distribution',
+                        target,
+                        sd_to_XYZ={'illuminant': illuminant})))
+
+        # "SpectralDistribution" class instances cannot be converted to
+        # "ndarray" as they extrapolate any index, they are compared directly.
+        # The source object is returned as is, as with "convert" definition.
+        self.assertIs(
+            convert_many(sd, 'Spectral Distribution',
+                         ['Spectral Distribution'])['Spectral Distribution'],
+            sd)
+
+        # The linear "RGB" to "CIE XYZ" and "CIE XYZ" to "CIE UCS" conversion
+        # functions are fused.
+        RGB = np.array([0.45675795, 0.30986982, 0.24861924])
+        targets = ['CIE XYZ', 'CIE UCS', 'CIE Lab']
+
+        converted = convert_many(RGB, 'RGB', targets)
+        for target in targets:
+            np.testing.assert_equal(converted[target],
+                                    convert(RGB, 'RGB', target))
+
+        self.assertDictEqual(convert_many(RGB, 'RGB', []), {})
+
+        with caching_enable(True):
+            _CACHE_CONVERSION_PLANS.clear()
+            convert_many(RGB, 'RGB', targets)
+            convert_many(RGB, 'RGB', targets)
+            self.assertEqual(_CACHE_CONVERSION_PLANS.hits, len(targets))
+
+    def test_verbose_convert_many(self):
+        """
+        Tests :func:`colour.graph.conversion.convert_many` definition verbose
+        support.
+        """
+
+        RGB = np.array([0.45675795, 0.30986982, 0.24861924])
+        targets = ['CIE XYZ', 'CIE UCS', 'CIE Lab']
+
+        messages = []
+        converted = convert_many(
+            RGB,
+            'RGB',
+            targets,
+            verbose={
+                'mode': 'Extended',
+                'print_callable': messages.append
+            })
+        for target in targets:
+            np.testing.assert_almost_equal(
+                converted[target], convert(RGB, 'RGB', target), decimal=7)
+
+        messages = '\n'.join(messages)
+        self.assertEqual(messages.count('[ Conversion Path ]'), len(targets))
+        self.assertIn('"RGB_to_XYZ" --> "XYZ_to_UCS"', messages)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -95,6 +95,22 @@ else:  # pragma: no cover
             'float128', np.float128, None, 1, False)
 
 
+def _divide(a, b, dtype):
+    """
+    Divides given integer array by given scalar and returns the result with
+    given floating-point type.
+
+    The division is performed with at least *float32* precision instead of
+    the *float64* precision that the implicit promotion of integer arrays
+    would use, so that no intermediate *float64* array is allocated when
+    converting to *float16* or *float32*.
+    """
+
+    return np.true_divide(
+        a, b, dtype=np.promote_types(dtype, np.float32)).astype(
+            dtype, copy=False)
+
+
 def convert_bit_depth(a, bit_depth='float32'):
     """
     Converts given array to given bit depth, the current bit depth of the array
@@ -148,14 +164,14 @@ def convert_bit_depth(a, bit_depth='float32'):
         elif bit_depth == 'uint16':
             return (a * 257).astype(target_dtype)
         elif bit_depth in ('float16', 'float32', 'float64', 'float128'):
-            return (a / 255).astype(target_dtype)
+            return _divide(a, 255, target_dtype)
     elif source_dtype == 'uint16':
         if bit_depth == 'uint8':
             return (a / 257).astype(target_dtype)
         elif bit_depth == 'uint16':
             return a
         elif bit_depth in ('float16', 'float32', 'float64', 'float128'):
-            return (a / 65535).astype(target_dtype)
+            return _divide(a, 65535, target_dtype)
     elif source_dtype in ('float16', 'float32', 'float64', 'float128'):
         if bit_depth == 'uint8':
             return np.around(a * 255).astype(target_dtype)
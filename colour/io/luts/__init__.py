@@ -14,42 +14,46 @@ References
 
 import os
 
-from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
+from colour.utilities import (CaseInsensitiveMapping, LRUCache, filter_kwargs,
                               validate_method)
 
 from .lut import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
-                  LUTSequence, LUT_to_LUT)
+                  LUTSequence, LUT_to_LUT, apply_LUT_chunked)
 from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
 from .resolve_cube import read_LUT_ResolveCube, write_LUT_ResolveCube
 from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
 from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
 from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+from .colour_binary import read_LUT_ColourBinary, write_LUT_ColourBinary
 
 __all__ = [
     'AbstractLUTSequenceOperator', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence',
-    'LUT_to_LUT'
+    'LUT_to_LUT', 'apply_LUT_chunked'
 ]
 __all__ += ['read_LUT_IridasCube', 'write_LUT_IridasCube']
 __all__ += ['read_LUT_ResolveCube', 'write_LUT_ResolveCube']
 __all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
 __all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
 __all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+__all__ += ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
 
 EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
     '.cube': 'Iridas Cube',
     '.spi1d': 'Sony SPI1D',
     '.spi3d': 'Sony SPI3D',
-    '.csp': 'Cinespace'
+    '.csp': 'Cinespace',
+    '.clutb': 'Colour Binary'
 })
 """
 Extension to *LUT* format.
 
 EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
-    **{'.cube', '.spi1d'}**
+    **{'.cube', '.spi1d', '.spi3d', '.csp', '.clutb'}**
 """
 
 LUT_READ_METHODS = CaseInsensitiveMapping({
     'Cinespace': read_LUT_Cinespace,
+    'Colour Binary': read_LUT_ColourBinary,
     'Iridas Cube': read_LUT_IridasCube,
     'Resolve Cube': read_LUT_ResolveCube,
     'Sony SPI1D': read_LUT_SonySPI1D,
@@ -63,12 +67,47 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_READ_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
+_CACHE_LUTS = LRUCache('colour.io.luts._CACHE_LUTS', maximum_nbytes=2 ** 28)
+"""
+Cache for the *LUTs* read with the :func:`colour.read_LUT` definition, bounded
+to 256 MiB of tables by default.
+
+_CACHE_LUTS : LRUCache
+"""
+
+
+def _LUT_to_cache_value(LUT):
+    """
+    Converts given *LUT* to a value for the :attr:`_CACHE_LUTS` attribute
+    cache, i.e. a *tuple* of its class and attributes.
+    """
+
+    if isinstance(LUT, LUTSequence):
+        return LUTSequence, tuple(_LUT_to_cache_value(LUT_i) for LUT_i in LUT)
+    else:
+        return LUT.__class__, LUT.table, LUT.domain, LUT.name, LUT.comments
 
-def read_LUT(path, method=None, **kwargs):
+
+def _LUT_from_cache_value(value):
+    """
+    Builds a *LUT* from given :attr:`_CACHE_LUTS` attribute cache value, the
+    tables and domains are shared with the cache value.
+    """
+
+    if value[0] is LUTSequence:
+        return LUTSequence(
+            *[_LUT_from_cache_value(value_i) for value_i in value[1]])
+    else:
+        LUT_class, table, domain, name, comments = value
+
+        return LUT_class(table, name, domain, comments=list(comments))
+
+
+def read_LUT(path, method=None, cache=False, **kwargs):
     """
     Reads given *LUT* file using given method.
 
@@ -77,14 +116,39 @@ def read_LUT(path, method=None, **kwargs):
     path : unicode
         *LUT* path.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Reading method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+        'Sony SPI1D', 'Sony SPI3D'}**, Reading method, if *None*, the method
+        will be auto-detected according to extension.
+    cache : bool, optional
+        Whether to use the process-wide *LUTs* cache keyed by the *LUT* path,
+        modification time, size, reading method and keyword arguments.
+
+    Other Parameters
+    ----------------
+    mmap_mode : unicode, optional
+        {:func:`colour.io.read_LUT_ColourBinary`},
+        :class:`numpy.memmap` class mode the tables are memory-mapped with.
 
     Returns
     -------
-    LUT1D or LUT3x1D or LUT3D
-        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance.
+    LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT3x1D`, :class:`LUT3D` or
+        :class:`LUTSequence` class instance.
+
+    Notes
+    -----
+    -   With ``cache`` set to *True*, the returned *LUTs* are new instances
+        sharing read-only tables and domains with the cache: modifying them
+        requires assigning new tables or domains, e.g.
+        ``LUT.table = LUT.table * 2`` or ``LUT.table = np.copy(LUT.table)``.
+    -   The cache is bounded to 256 MiB of tables by default, the budget can
+        be changed with the
+        ``CACHE_REGISTRY['colour.io.luts._CACHE_LUTS'].maximum_nbytes``
+        attribute.
+    -   The *Colour* binary *.clutb* *LUTs* tables are memory-mapped
+        read-only by default, i.e. ``mmap_mode`` is *r*: arithmetical
+        operations, e.g. ``LUT += 1``, assign new tables, modifying the tables
+        in-place requires the *c* copy-on-write mode.
 
     References
     ----------
@@ -143,6 +207,18 @@ def read_LUT(path, method=None, **kwargs):
 
     method = validate_method(method, LUT_READ_METHODS)
 
+    if cache:
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, method,
+               tuple(sorted(kwargs.items())))
+
+        value = _CACHE_LUTS.get(key)
+        if value is None:
+            value = _CACHE_LUTS.set(
+                key, _LUT_to_cache_value(read_LUT(path, method, **kwargs)))
+
+        return _LUT_from_cache_value(value)
+
     function = LUT_READ_METHODS[method]
 
     try:
@@ -163,6 +239,7 @@ LUT_WRITE_METHODS = CaseInsensitiveMapping({
     'Sony SPI1D': write_LUT_SonySPI1D,
     'Sony SPI3D': write_LUT_SonySPI3D,
     'Cinespace': write_LUT_Cinespace,
+    'Colour Binary': write_LUT_ColourBinary,
 })
 LUT_WRITE_METHODS.__doc__ = """
 Supported *LUT* reading methods.
@@ -172,8 +249,8 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_WRITE_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
@@ -191,9 +268,15 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
     decimals : int, optional
         Formatting decimals.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Writing method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+        'Sony SPI1D', 'Sony SPI3D'}**, Writing method, if *None*, the method
+        will be auto-detected according to extension.
+
+    Other Parameters
+    ----------------
+    dtype : object, optional
+        {:func:`colour.io.write_LUT_ColourBinary`},
+        Type the tables are stored with.
 
     Returns
     -------
@@ -249,7 +332,8 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
 
     function = LUT_WRITE_METHODS[method]
 
-    return function(LUT, path, decimals, **filter_kwargs(function, **kwargs))
+    return function(LUT, path,
+                    **filter_kwargs(function, decimals=decimals, **kwargs))
 
 
 __all__ += ['LUT_READ_METHODS', 'read_LUT', 'LUT_WRITE_METHODS', 'write_LUT']
@@ -19,6 +19,7 @@ References
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.io.luts.common import format_array, parse_array
 from colour.utilities import tsplit, tstack, as_float_array, as_int_array
 
 __author__ = 'Colour Developers'
@@ -126,9 +127,24 @@ def read_LUT_Cinespace(path):
         return size, table
 
     with open(path) as csp_file:
-        lines = csp_file.readlines()
+        # The lines are read up to the table size line so that the table can
+        # be parsed in bulk.
+        lines = []
+        end_metadata = None
+        for line in iter(csp_file.readline, ''):
+            line = line.strip()
+            if not line:
+                continue
+
+            lines.append(line)
+
+            if line == 'END METADATA':
+                end_metadata = len(lines) - 1
+            elif (end_metadata is not None and
+                  len(lines) == end_metadata + 11):
+                break
+
         assert len(lines) > 0, 'LUT file empty!'
-        lines = [line.strip() for line in lines if line.strip()]
 
         header = lines[0]
         assert header == 'CSPLUTV100', 'Invalid header!'
@@ -159,7 +175,13 @@ def read_LUT_Cinespace(path):
         pre_LUT = _parse_domain_section(lines[seek:seek + 9])
 
         seek += 9
-        size, table = _parse_table_section(lines[seek:])
+        size = as_int_array(lines[seek].split())
+        text = csp_file.read()
+        table = parse_array(text, (np.product(size), 3))
+        if table is None:
+            lines.extend(
+                [line.strip() for line in text.splitlines() if line.strip()])
+            size, table = _parse_table_section(lines[seek:])
 
         assert np.product(size) == len(table), 'Invalid table size!'
 
@@ -362,26 +384,20 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
 
                     csp_file.write('{0}\n'.format(size))
 
-                    for j in range(size):
-                        if LUT[0].is_domain_explicit():
-                            entry = LUT[0].domain[j][i]
-                        else:
-                            entry = (
-                                LUT[0].domain[0][i] + j *
-                                (LUT[0].domain[1][i] - LUT[0].domain[0][i]) /
-                                (LUT[0].size - 1))
-                        csp_file.write('{0:.{1}f} '.format(entry, decimals))
-
-                    csp_file.write('\n')
-
-                    for j in range(size):
-                        entry = LUT[0].table[j][i]
-                        if non_uniform:
-                            entry -= table_min
-                            entry /= (table_max - table_min)
-                        csp_file.write('{0:.{1}f} '.format(entry, decimals))
-
-                    csp_file.write('\n')
+                    if LUT[0].is_domain_explicit():
+                        entries = LUT[0].domain[:size, i]
+                    else:
+                        entries = (
+                            LUT[0].domain[0][i] + np.arange(size) *
+                            (LUT[0].domain[1][i] - LUT[0].domain[0][i]) /
+                            (LUT[0].size - 1))
+                    csp_file.write(format_array(entries, decimals))
+
+                    entries = LUT[0].table[:size, i]
+                    if non_uniform:
+                        entries = (
+                            (entries - table_min) / (table_max - table_min))
+                    csp_file.write(format_array(entries, decimals))
             else:
                 for i in range(3):
                     csp_file.write('2\n')
@@ -401,9 +417,7 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
                     LUT[1].table.shape[0], LUT[1].table.shape[1],
                     LUT[1].table.shape[2]))
                 table = LUT[1].table.reshape([-1, 3], order='F')
-
-                for row in table:
-                    csp_file.write('{0}\n'.format(_format_array(row)))
+                csp_file.write(format_array(table, decimals))
 
         else:
             for i in range(3):
@@ -412,9 +426,6 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
                     _format_tuple([LUT[0].domain[0][i], LUT[0].domain[1][i]])))
                 csp_file.write('0.0 1.0\n')
             csp_file.write('\n{0}\n'.format(LUT[0].size))
-            table = LUT[0].table
-
-            for row in table:
-                csp_file.write('{0}\n'.format(_format_array(row)))
+            csp_file.write(format_array(LUT[0].table, decimals))
 
     return True
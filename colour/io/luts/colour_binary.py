@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Binary .clutb LUT Format Input / Output Utilities
+========================================================
+
+Defines *Colour* binary *.clutb* *LUT* Format related input / output
+utilities objects.
+
+-   :func:`colour.io.read_LUT_ColourBinary`
+-   :func:`colour.io.write_LUT_ColourBinary`
+
+The *Colour* binary *.clutb* *LUT* format stores the *LUTs* tables as raw
+little-endian arrays so that they can be memory-mapped without parsing:
+
+-   A 6 bytes magic string: ``b'\\x93CLUTB'``.
+-   The format major and minor versions as 2 unsigned bytes.
+-   The header length as a little-endian 4 bytes unsigned integer.
+-   A *JSON* header encoded in *UTF-8* describing the *LUTs*: class, name,
+    domain, comments and the type, shape and offset of their table. It is
+    padded with spaces so that the tables start on a 64 bytes boundary.
+-   The *C-contiguous* *LUTs* tables, each starting on a 64 bytes boundary.
+"""
+
+import json
+import numpy as np
+import struct
+
+from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.io.luts.lut import AbstractLUT
+from colour.utilities import as_float_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'MAGIC_COLOUR_BINARY', 'VERSION_COLOUR_BINARY', 'ALIGNMENT_COLOUR_BINARY',
+    'read_LUT_ColourBinary', 'write_LUT_ColourBinary'
+]
+
+MAGIC_COLOUR_BINARY = b'\x93CLUTB'
+"""
+*Colour* binary *.clutb* *LUT* format magic string.
+
+MAGIC_COLOUR_BINARY : bytes
+"""
+
+VERSION_COLOUR_BINARY = (1, 0)
+"""
+*Colour* binary *.clutb* *LUT* format major and minor versions.
+
+VERSION_COLOUR_BINARY : tuple
+"""
+
+ALIGNMENT_COLOUR_BINARY = 64
+"""
+*Colour* binary *.clutb* *LUT* format tables alignment in bytes.
+
+ALIGNMENT_COLOUR_BINARY : int
+"""
+
+_PREAMBLE_FORMAT = '<{0}sBBI'.format(len(MAGIC_COLOUR_BINARY))
+"""
+*Colour* binary *.clutb* *LUT* format preamble :mod:`struct` format.
+
+_PREAMBLE_FORMAT : unicode
+"""
+
+_LUT_CLASSES = {'LUT1D': LUT1D, 'LUT3x1D': LUT3x1D, 'LUT3D': LUT3D}
+"""
+*LUT* classes supported by the *Colour* binary *.clutb* *LUT* format.
+
+_LUT_CLASSES : dict
+"""
+
+
+def _align(offset):
+    """
+    Aligns given offset on the next :attr:`ALIGNMENT_COLOUR_BINARY` bytes
+    boundary.
+    """
+
+    return -(-offset // ALIGNMENT_COLOUR_BINARY) * ALIGNMENT_COLOUR_BINARY
+
+
+def read_LUT_ColourBinary(path, mmap_mode='r'):
+    """
+    Reads given *Colour* binary *.clutb* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    mmap_mode : unicode, optional
+        **{'r', 'r+', 'c', None}**,
+        :class:`numpy.memmap` class mode the tables are memory-mapped with, if
+        *None*, the tables are read into memory.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D` or :class:`LUT3x1D` or :class:`LUT3D` or
+        :class:`LUTSequence` class instance.
+
+    Notes
+    -----
+    -   The tables are not converted and keep their stored *float16*,
+        *float32* or *float64* type.
+    -   With the default *r* mode, the tables are read-only, the *c* mode
+        gives writable copy-on-write tables.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'LUT.clutb')
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT_ColourBinary(LUT, path)
+    True
+    >>> print(read_LUT_ColourBinary(path))
+    LUT3D - My LUT
+    --------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.  0.  0.]
+                  [ 1.  1.  1.]]
+    Size       : (16, 16, 16, 3)
+    >>> read_LUT_ColourBinary(path).table.dtype
+    dtype('float32')
+    """
+
+    with open(path, 'rb') as clutb_file:
+        preamble = clutb_file.read(struct.calcsize(_PREAMBLE_FORMAT))
+        magic, major, _minor, header_length = struct.unpack(
+            _PREAMBLE_FORMAT, preamble)
+
+        assert magic == MAGIC_COLOUR_BINARY, 'Invalid magic string!'
+        assert major == VERSION_COLOUR_BINARY[0], (
+            'Unsupported format version {0}!'.format(major))
+
+        header = json.loads(clutb_file.read(header_length).decode('utf-8'))
+
+        data_offset = _align(len(preamble) + header_length)
+
+        LUTs = []
+        for entry in header['LUTs']:
+            dtype = np.dtype(entry['dtype'])
+            shape = tuple(entry['shape'])
+            offset = data_offset + entry['offset']
+
+            if mmap_mode is None:
+                clutb_file.seek(offset)
+                table = np.fromfile(clutb_file, dtype,
+                                    int(np.prod(shape))).reshape(shape)
+            else:
+                table = np.memmap(path, dtype, mmap_mode, offset, shape)
+
+            LUTs.append(_LUT_CLASSES[entry['class']](
+                table,
+                entry['name'],
+                as_float_array(entry['domain']),
+                comments=entry['comments']))
+
+    if header['sequence']:
+        return LUTSequence(*LUTs)
+    else:
+        return LUTs[0]
+
+
+def write_LUT_ColourBinary(LUT, path, dtype=np.float32):
+    """
+    Writes given *LUT* to given *Colour* binary *.clutb* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` or
+        :class:`LUTSequence` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    dtype : object, optional
+        **{np.float16, np.float32, np.float64}**,
+        Type the tables are stored with.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> LUT = LUTSequence(
+    ...     LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My Shaper'),
+    ...     LUT3D(LUT3D.linear_table(16), 'My LUT'))
+    >>> write_LUT_ColourBinary(LUT, 'My_LUT.clutb')  # doctest: +SKIP
+    """
+
+    dtype = np.dtype(dtype).newbyteorder('<')
+
+    assert dtype.kind == 'f', '"dtype" must be a floating-point type!'
+
+    is_sequence = isinstance(LUT, LUTSequence)
+    LUTs = list(LUT) if is_sequence else [LUT]
+
+    for LUT_i in LUTs:
+        assert isinstance(LUT_i, AbstractLUT), (
+            '"LUT" must be a 1D, 3x1D, 3D "LUT" or a "LUTSequence" of them!')
+
+    entries = []
+    offset = 0
+    for LUT_i in LUTs:
+        entries.append({
+            'class': LUT_i.__class__.__name__,
+            'name': LUT_i.name,
+            'domain': LUT_i.domain.tolist(),
+            'comments': list(LUT_i.comments),
+            'dtype': dtype.str,
+            'shape': list(LUT_i.table.shape),
+            'offset': offset,
+        })
+        offset = _align(offset + LUT_i.table.size * dtype.itemsize)
+
+    header = json.dumps({
+        'sequence': is_sequence,
+        'LUTs': entries
+    }).encode('utf-8')
+    preamble_length = struct.calcsize(_PREAMBLE_FORMAT)
+    header += b' ' * (
+        _align(preamble_length + len(header)) - preamble_length - len(header))
+
+    with open(path, 'wb') as clutb_file:
+        clutb_file.write(
+            struct.pack(_PREAMBLE_FORMAT, MAGIC_COLOUR_BINARY,
+                        VERSION_COLOUR_BINARY[0], VERSION_COLOUR_BINARY[1],
+                        len(header)))
+        clutb_file.write(header)
+
+        data_offset = preamble_length + len(header)
+        for entry, LUT_i in zip(entries, LUTs):
+            clutb_file.seek(data_offset + entry['offset'])
+            np.ascontiguousarray(LUT_i.table, dtype).tofile(clutb_file)
+
+    return True
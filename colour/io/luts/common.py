@@ -7,8 +7,12 @@ Defines LUT Processing common utilities objects that don't fall in any specific
 category.
 """
 
+import numpy as np
 import os
 import re
+import warnings
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -17,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['path_to_title']
+__all__ = ['path_to_title', 'parse_array', 'format_array']
 
 
 def path_to_title(path):
@@ -43,3 +47,81 @@ def path_to_title(path):
     """
 
     return re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
+
+
+def parse_array(text, shape):
+    """
+    Parses given text of whitespace delimited numbers into an array of given
+    shape using a bulk tokenizer.
+
+    Parameters
+    ----------
+    text : unicode
+        Text to parse.
+    shape : array_like
+        Shape of the parsed array.
+
+    Returns
+    -------
+    ndarray or None
+        Parsed array or *None* if the text does not contain only numbers or
+        their count does not match given shape, in which case the caller is
+        expected to fall back to a line by line parser.
+
+    Examples
+    --------
+    >>> parse_array('0 0.5 1\\n1 0.5 0\\n', (2, 3))
+    array([[ 0. ,  0.5,  1. ],
+           [ 1. ,  0.5,  0. ]])
+    >>> parse_array('0 0.5 1\\n# Comment\\n1 0.5 0\\n', (2, 3)) is None
+    True
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+
+        try:
+            array = np.fromstring(text, DEFAULT_FLOAT_DTYPE, sep=' ')
+        except (DeprecationWarning, ValueError):
+            return None
+
+    if array.size != np.prod(shape):
+        return None
+
+    return np.reshape(array, shape)
+
+
+def format_array(array, decimals=7, formats=None):
+    """
+    Formats given array as whitespace delimited rows of numbers in bulk.
+
+    Parameters
+    ----------
+    array : array_like
+        Array to format, a 1-dimensional array is formatted as a single row.
+    decimals : int, optional
+        Formatting decimals.
+    formats : array_like, optional
+        *printf-style* format of each column, defaults to ``decimals``
+        fixed-point notation.
+
+    Returns
+    -------
+    unicode
+        Formatted array.
+
+    Examples
+    --------
+    >>> print(format_array(np.array([[0, 0.5, 1], [1, 0.5, 0]]), 3))
+    0.000 0.500 1.000
+    1.000 0.500 0.000
+    <BLANKLINE>
+    """
+
+    array = np.atleast_2d(array)
+
+    if formats is None:
+        formats = ['%.{0}f'.format(decimals)] * array.shape[-1]
+
+    return ((' '.join(formats) + '\n') * array.shape[0]) % tuple(
+        np.ravel(array).tolist())
@@ -14,11 +14,12 @@ References
     https://drive.google.com/open?id=143Eh08ZYncCAMwJ1q4gWxVOqR_OSWYvs
 """
 
+import io
 import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import format_array, parse_array, path_to_title
 from colour.utilities import as_float_array, usage_warning
 
 __author__ = 'Colour Developers'
@@ -104,32 +105,46 @@ def read_LUT_IridasCube(path):
     comments = []
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
-        for line in lines:
-            line = line.strip()
-
-            if len(line) == 0:
-                continue
-
-            if line.startswith('#'):
-                comments.append(line[1:].strip())
-                continue
-
-            tokens = line.split()
-            if tokens[0] == 'TITLE':
-                title = ' '.join(tokens[1:])[1:-1]
-            elif tokens[0] == 'DOMAIN_MIN':
-                domain_min = as_float_array(tokens[1:])
-            elif tokens[0] == 'DOMAIN_MAX':
-                domain_max = as_float_array(tokens[1:])
-            elif tokens[0] == 'LUT_1D_SIZE':
-                dimensions = 2
-                size = DEFAULT_INT_DTYPE(tokens[1])
-            elif tokens[0] == 'LUT_3D_SIZE':
-                dimensions = 3
-                size = DEFAULT_INT_DTYPE(tokens[1])
-            else:
-                table.append(tokens)
+        text = cube_file.read()
+
+    offset = 0
+    for line in io.StringIO(text):
+        line_offset, offset = offset, offset + len(line)
+        line = line.strip()
+
+        if len(line) == 0:
+            continue
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        tokens = line.split()
+        if tokens[0] == 'TITLE':
+            title = ' '.join(tokens[1:])[1:-1]
+        elif tokens[0] == 'DOMAIN_MIN':
+            domain_min = as_float_array(tokens[1:])
+        elif tokens[0] == 'DOMAIN_MAX':
+            domain_max = as_float_array(tokens[1:])
+        elif tokens[0] == 'LUT_1D_SIZE':
+            dimensions = 2
+            size = DEFAULT_INT_DTYPE(tokens[1])
+        elif tokens[0] == 'LUT_3D_SIZE':
+            dimensions = 3
+            size = DEFAULT_INT_DTYPE(tokens[1])
+        else:
+            # Parsing the table in bulk, falling back to the line by line
+            # parser if it is interleaved with comments or keywords.
+            if len(table) == 0:
+                table = parse_array(text[line_offset:],
+                                    (size
+                                     if dimensions == 2 else size ** 3, 3))
+                if table is not None:
+                    break
+
+                table = []
+
+            table.append(tokens)
 
     table = as_float_array(table)
     if dimensions == 2:
@@ -254,7 +269,6 @@ def write_LUT_IridasCube(LUT, path, decimals=7):
         else:
             table = LUT.table
 
-        for row in table:
-            cube_file.write('{0}\n'.format(_format_array(row)))
+        cube_file.write(format_array(table, decimals))
 
     return True
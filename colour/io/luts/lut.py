@@ -10,8 +10,12 @@ Defines the classes and definitions handling *LUT* processing:
 -   :class:`colour.LUT3D`
 -   :class:`colour.LUTSequence`
 -   :class:`colour.io.LUT_to_LUT`
+-   :func:`colour.io.apply_LUT_chunked`
 """
 
+import mmap
+import multiprocessing
+import multiprocessing.pool
 import numpy as np
 import re
 from abc import ABC, abstractmethod
@@ -19,13 +23,26 @@ from collections.abc import MutableSequence
 from copy import deepcopy
 from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
                       itruediv)
+from scipy.spatial import cKDTree
 
-from colour.algebra import (LinearInterpolator, linear_conversion,
+from colour.algebra import (LinearInterpolator, TABLE_INTERPOLATION_METHODS,
+                            linear_conversion, random_triplet_generator,
                             table_interpolation_trilinear)
-from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (as_float_array, is_numeric, is_iterable,
-                              is_string, full, runtime_warning, tsplit, tstack,
-                              usage_warning)
+from colour.algebra import interpolation
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.utilities import (
+    as_float, as_float_array, batch, filter_kwargs, is_numeric, is_iterable,
+    is_string, is_tqdm_installed, full, multiprocessing_pool, runtime_warning,
+    tsplit, tstack, usage_warning, validate_method)
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+if is_tqdm_installed():
+    from tqdm import tqdm
+else:
+    tqdm = mock.MagicMock()
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -36,10 +53,33 @@ __status__ = 'Production'
 
 __all__ = [
     'AbstractLUT', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUT_to_LUT',
-    'AbstractLUTSequenceOperator', 'LUTSequence'
+    'AbstractLUTSequenceOperator', 'LUTSequence', 'apply_LUT_chunked'
 ]
 
 
+def _as_table_array(table):
+    """
+    Converts given table to a floating-point :class:`ndarray` instance, the
+    type of floating-point arrays, e.g. memory-mapped *float16* or *float32*
+    tables, is preserved so that they are not copied.
+
+    Parameters
+    ----------
+    table : array_like
+        Table to convert.
+
+    Returns
+    -------
+    ndarray
+        Converted table.
+    """
+
+    if isinstance(table, np.ndarray) and table.dtype in np.sctypes['float']:
+        return np.asarray(table)
+
+    return as_float_array(table)
+
+
 class AbstractLUT(ABC):
     """
     Defines the base class for *LUT*.
@@ -580,7 +620,12 @@ class AbstractLUT(ABC):
             else:
                 operand = as_float_array(a)
 
-            self.table = ioperator(self.table, operand)
+            if self.table.flags.writeable:
+                self.table = ioperator(self.table, operand)
+            else:
+                # Read-only tables, e.g. memory-mapped or cached, are replaced
+                # instead of being modified.
+                self.table = operation(self.table, operand)
 
             return self
         else:
@@ -753,6 +798,83 @@ class AbstractLUT(ABC):
         pass
 
 
+def _apply_uniform_table(LUT, RGB):
+    """
+    Applies given 1D or 3x1D *LUT* with an implicit domain to given *RGB*
+    colourspace array using index arithmetic, processing the values in tiles
+    of :attr:`colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE`
+    values.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D
+        *LUT* to apply.
+    RGB : array_like
+        *RGB* colourspace array to apply the *LUT* onto.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If the *RGB* colourspace array values are outside the *LUT* domain.
+    """
+
+    RGB = np.asarray(RGB)
+
+    dtype = np.float32 if RGB.dtype == np.float32 else DEFAULT_FLOAT_DTYPE
+
+    # NOTE: The slopes are computed on each call as the table can be
+    # modified in-place.
+    table = LUT.table.astype(dtype, copy=False)
+    slopes = np.diff(table, axis=0)
+    channels = 1 if table.ndim == 1 else table.shape[-1]
+    size = table.shape[0]
+
+    domain_min, domain_max = LUT.domain.astype(dtype)
+    scale = (size - 1) / (domain_max - domain_min)
+    offset = np.arange(channels)
+
+    table = np.reshape(table, -1)
+    slopes = np.reshape(slopes, -1)
+
+    RGB_f = np.reshape(RGB, (-1, channels))
+    output = np.empty(RGB_f.shape, dtype)
+
+    for i in range(0, RGB_f.shape[0],
+                   interpolation.TABLE_INTERPOLATION_TILE_SIZE):
+        tile = slice(i, i + interpolation.TABLE_INTERPOLATION_TILE_SIZE)
+
+        RGB_t = RGB_f[tile].astype(dtype, copy=False)
+
+        if np.any(RGB_t < domain_min):
+            raise ValueError(
+                '"{0}" is below interpolation range.'.format(RGB_t))
+
+        if np.any(RGB_t > domain_max):
+            raise ValueError(
+                '"{0}" is above interpolation range.'.format(RGB_t))
+
+        RGB_r = (RGB_t - domain_min) * scale
+
+        # "NaN" values are assigned to the first sample and propagate through
+        # the relative values.
+        i_f = np.minimum(
+            np.nan_to_num(RGB_r).astype(DEFAULT_INT_DTYPE), size - 2)
+        RGB_r -= i_f
+        i_f *= channels
+        i_f += offset
+
+        RGB_r *= np.take(slopes, i_f)
+        RGB_r += np.take(table, i_f)
+        output[tile] = RGB_r
+
+    return np.reshape(output, RGB.shape)
+
+
 class LUT1D(AbstractLUT):
     """
     Defines the base class for a 1D *LUT*.
@@ -777,6 +899,7 @@ class LUT1D(AbstractLUT):
     -   :meth:`~colour.LUT1D.is_domain_explicit`
     -   :meth:`~colour.LUT1D.linear_table`
     -   :meth:`~colour.LUT1D.apply`
+    -   :meth:`~colour.LUT1D.invert`
     -   :meth:`~colour.LUT1D.as_LUT`
 
     Examples
@@ -847,7 +970,7 @@ class LUT1D(AbstractLUT):
             Validated table as a :class:`ndarray` instance.
         """
 
-        table = as_float_array(table)
+        table = _as_table_array(table)
 
         assert len(table.shape) == 1, 'The table must be a 1D array!'
 
@@ -939,7 +1062,7 @@ class LUT1D(AbstractLUT):
         else:
             assert is_numeric(size), 'Linear table size must be a numeric!'
 
-            return np.linspace(domain[0], domain[1], size)
+            return np.linspace(domain[0], domain[1], size, dtype=domain.dtype)
 
     def apply(self,
               RGB,
@@ -962,6 +1085,14 @@ class LUT1D(AbstractLUT):
         ndarray
             Interpolated *RGB* colourspace array.
 
+        Notes
+        -----
+        -   With an implicit domain and the default interpolator, the *LUT* is
+            applied with index arithmetic using the table slopes computed on
+            each call, thus in-place table modifications are honoured.
+            *float32* *RGB* colourspace arrays are then processed and returned
+            as *float32*.
+
         Examples
         --------
         >>> LUT = LUT1D(LUT1D.linear_table() ** (1 / 2.2))
@@ -970,6 +1101,12 @@ class LUT1D(AbstractLUT):
         array([ 0.4529220...,  0.4529220...,  0.4529220...])
         """
 
+        if (interpolator is LinearInterpolator and not interpolator_kwargs and
+                not self.is_domain_explicit() and self.size > 1):
+            RGB_o = _apply_uniform_table(self, RGB)
+
+            return as_float(RGB_o) if RGB_o.size == 1 else RGB_o
+
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
@@ -985,6 +1122,59 @@ class LUT1D(AbstractLUT):
 
         return RGB_interpolator(RGB)
 
+    def invert(self, size=None):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, defaults to the *LUT* size.
+
+        Returns
+        -------
+        LUT1D
+            Inverse *LUT* class instance with an implicit domain spanning the
+            *LUT* table range.
+
+        Notes
+        -----
+        -   The *LUT* table must be strictly monotonic, the inverse table is
+            linearly interpolated at once for all its samples.
+
+        Examples
+        --------
+        >>> LUT = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My LUT')
+        >>> LUT_i = LUT.invert()
+        >>> print(LUT_i)
+        LUT1D - My LUT - Inverse
+        ------------------------
+        <BLANKLINE>
+        Dimensions : 1
+        Domain     : [ 0.  1.]
+        Size       : (16,)
+        >>> LUT_i.apply(LUT.apply(0.5))  # doctest: +ELLIPSIS
+        0.5002755...
+        """
+
+        if size is None:
+            size = self.size
+
+        samples = self.linear_table(self.size, self.domain)
+        table = self._table
+
+        if table[0] > table[-1]:
+            samples, table = samples[::-1], table[::-1]
+
+        assert np.all(np.diff(table) > 0), (
+            'The table must be strictly monotonic!')
+
+        domain = np.array([table[0], table[-1]])
+
+        return LUT1D(
+            np.interp(self.linear_table(size, domain), table, samples),
+            '{0} - Inverse'.format(self.name), domain)
+
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
         Converts the *LUT* to given ``cls`` class instance.
@@ -1076,6 +1266,7 @@ class LUT3x1D(AbstractLUT):
     -   :meth:`~colour.LUT3x1D.is_domain_explicit`
     -   :meth:`~colour.LUT3x1D.linear_table`
     -   :meth:`~colour.LUT3x1D.apply`
+    -   :meth:`~colour.LUT3x1D.invert`
     -   :meth:`~colour.LUT3x1D.as_LUT`
 
     Examples
@@ -1150,7 +1341,7 @@ class LUT3x1D(AbstractLUT):
             Validated table as a :class:`ndarray` instance.
         """
 
-        table = as_float_array(table)
+        table = _as_table_array(table)
 
         assert len(table.shape) == 2, 'The table must be a 2D array!'
 
@@ -1286,7 +1477,7 @@ class LUT3x1D(AbstractLUT):
             R, G, B = tsplit(domain)
 
             samples = [
-                np.linspace(a[0], a[1], size[i])
+                np.linspace(a[0], a[1], size[i], dtype=domain.dtype)
                 for i, a in enumerate([R, G, B])
             ]
 
@@ -1324,6 +1515,14 @@ class LUT3x1D(AbstractLUT):
         ndarray
             Interpolated *RGB* colourspace array.
 
+        Notes
+        -----
+        -   With an implicit domain and the default interpolator, the *LUT* is
+            applied with index arithmetic using the table slopes computed on
+            each call, thus in-place table modifications are honoured.
+            *float32* *RGB* colourspace arrays are then processed and returned
+            as *float32*.
+
         Examples
         --------
         >>> LUT = LUT3x1D(LUT3x1D.linear_table() ** (1 / 2.2))
@@ -1349,6 +1548,10 @@ class LUT3x1D(AbstractLUT):
         array([ 0.2996370..., -0.0901332..., -0.3949770...])
         """
 
+        if (interpolator is LinearInterpolator and not interpolator_kwargs and
+                not self.is_domain_explicit() and self.size > 1):
+            return _apply_uniform_table(self, RGB)
+
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
@@ -1382,6 +1585,77 @@ class LUT3x1D(AbstractLUT):
 
         return tstack(RGB_i)
 
+    def invert(self, size=None):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, defaults to the *LUT* size.
+
+        Returns
+        -------
+        LUT3x1D
+            Inverse *LUT* class instance with an implicit domain spanning the
+            *LUT* table range.
+
+        Notes
+        -----
+        -   The *LUT* table columns must be strictly monotonic, the inverse
+            table columns are linearly interpolated at once for all their
+            samples.
+
+        Examples
+        --------
+        >>> LUT = LUT3x1D(LUT3x1D.linear_table(16) ** (1 / 2.2), 'My LUT')
+        >>> LUT_i = LUT.invert()
+        >>> print(LUT_i)
+        LUT3x1D - My LUT - Inverse
+        --------------------------
+        <BLANKLINE>
+        Dimensions : 2
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (16, 3)
+        >>> LUT_i.apply(LUT.apply(np.array([0.5, 0.5, 0.5])))
+        ... # doctest: +ELLIPSIS
+        array([ 0.5002755...,  0.5002755...,  0.5002755...])
+        """
+
+        if size is None:
+            size = self.size
+
+        if self.is_domain_explicit():
+            samples = [
+                axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
+                for axes in np.transpose(self.domain)
+            ]
+            table = [
+                axes[:len(samples[i])]
+                for i, axes in enumerate(np.transpose(self._table))
+            ]
+        else:
+            samples = list(tsplit(self.linear_table(self.size, self.domain)))
+            table = list(tsplit(self._table))
+
+        for i in range(3):
+            if table[i][0] > table[i][-1]:
+                samples[i], table[i] = samples[i][::-1], table[i][::-1]
+
+            assert np.all(np.diff(table[i]) > 0), (
+                'The table columns must be strictly monotonic!')
+
+        domain = np.array([[axes[0] for axes in table],
+                           [axes[-1] for axes in table]])
+
+        samples_i = tsplit(self.linear_table(size, domain))
+
+        return LUT3x1D(
+            tstack([
+                np.interp(samples_i[i], table[i], samples[i]) for i in range(3)
+            ]), '{0} - Inverse'.format(self.name), domain)
+
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
         Converts the *LUT* to given ``cls`` class instance.
@@ -1473,6 +1747,7 @@ class LUT3D(AbstractLUT):
     -   :meth:`~colour.LUT3D.is_domain_explicit`
     -   :meth:`~colour.LUT3D.linear_table`
     -   :meth:`~colour.LUT3D.apply`
+    -   :meth:`~colour.LUT3D.invert`
     -   :meth:`~colour.LUT3D.as_LUT`
 
     Examples
@@ -1546,7 +1821,7 @@ class LUT3D(AbstractLUT):
             Validated table as a :class:`ndarray` instance.
         """
 
-        table = as_float_array(table)
+        table = _as_table_array(table)
 
         assert len(table.shape) == 4, 'The table must be a 4D array!'
 
@@ -1762,7 +2037,7 @@ class LUT3D(AbstractLUT):
 
             size = np.flip(size, -1)
             samples = [
-                np.linspace(a[0], a[1], size[i])
+                np.linspace(a[0], a[1], size[i], dtype=domain.dtype)
                 for i, a in enumerate([B, G, R])
             ]
 
@@ -1838,6 +2113,110 @@ class LUT3D(AbstractLUT):
 
         return interpolator(tstack(RGB_l), self._table, **interpolator_kwargs)
 
+    def invert(self,
+               size=None,
+               method='Trilinear',
+               iterations=16,
+               tolerance=1e-7,
+               workers=1):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        The inverse table samples are seeded with the *LUT* samples whose
+        table values are their nearest neighbours, found with a *KD-tree*,
+        and iteratively refined with damped *Gauss-Newton* steps using finite
+        differences of the *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, defaults to the *LUT* size.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Table interpolation method the *LUT* is inverted for.
+        iterations : int, optional
+            Maximum refinement iterations count.
+        tolerance : numeric, optional
+            Absolute tolerance under which the refinement of an inverse table
+            sample is stopped.
+        workers : int, optional
+            Number of processes the inverse table samples are refined on.
+
+        Returns
+        -------
+        LUT3D
+            Inverse *LUT* class instance with a domain spanning the *LUT*
+            table range.
+
+        Notes
+        -----
+        -   The inverse table samples lying outside the *LUT* gamut, i.e.
+            whose values are not reached by the *LUT*, are set to the samples
+            minimising the squared distance to their values in the *LUT*
+            domain.
+        -   The refinement runs sequentially when multiprocessing is disabled
+            with the :class:`colour.utilities.disable_multiprocessing` context
+            manager.
+
+        Examples
+        --------
+        >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2), 'My LUT')
+        >>> LUT_i = LUT.invert()
+        >>> print(LUT_i)
+        LUT3D - My LUT - Inverse
+        ------------------------
+        <BLANKLINE>
+        Dimensions : 3
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (33, 33, 33, 3)
+        >>> LUT_i.apply(LUT.apply(np.array([0.18, 0.18, 0.18])))
+        ... # doctest: +ELLIPSIS
+        array([ 0.1800807...,  0.1800807...,  0.1800807...])
+        """
+
+        method = validate_method(method, TABLE_INTERPOLATION_METHODS)
+
+        if size is None:
+            size = self.size
+
+        if self.is_domain_explicit():
+            domain = np.vstack([
+                self.domain[0, ...],
+                [
+                    axes[:(~np.isnan(axes)).cumsum().argmax() + 1][-1]
+                    for axes in np.transpose(self.domain)
+                ],
+            ])
+        else:
+            domain = self.domain
+
+        samples = self.linear_table(self._table.shape[:3], domain)
+        samples = np.reshape(samples, [-1, 3])
+        table = np.reshape(self._table, [-1, 3])
+
+        domain_i = np.vstack([np.min(table, 0), np.max(table, 0)])
+        RGB_t = np.reshape(self.linear_table(size, domain_i), [-1, 3])
+
+        RGB_s = samples[cKDTree(table).query(RGB_t)[1]]
+
+        LUT = LUT3D(self._table, domain=domain)
+        arguments = [
+            (LUT, RGB_t_c, RGB_s_c, method, iterations, tolerance)
+            for RGB_t_c, RGB_s_c in zip(
+                np.array_split(RGB_t, workers), np.array_split(RGB_s, workers))
+        ]
+
+        if workers == 1:
+            RGB_i = [_refine_LUT3D_inverse(arguments[0])]
+        else:
+            with multiprocessing_pool(workers) as pool:
+                RGB_i = pool.map(_refine_LUT3D_inverse, arguments)
+
+        return LUT3D(
+            np.reshape(np.vstack(RGB_i), [size, size, size, 3]),
+            '{0} - Inverse'.format(self.name), domain_i)
+
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
         Converts the *LUT* to given ``cls`` class instance.
@@ -1905,6 +2284,82 @@ class LUT3D(AbstractLUT):
         return LUT_to_LUT(self, cls, force_conversion, **kwargs)
 
 
+def _refine_LUT3D_inverse(arguments):
+    """
+    Refines given 3D *LUT* inverse table samples with damped *Gauss-Newton*
+    steps, this definition is used by the :meth:`colour.LUT3D.invert` method
+    workers.
+
+    Parameters
+    ----------
+    arguments : tuple
+        3D *LUT* with an implicit domain, target values, i.e. inverse table
+        domain samples, seed inverse table samples, table interpolation
+        method, maximum iterations count and absolute tolerance.
+
+    Returns
+    -------
+    ndarray
+        Refined inverse table samples.
+    """
+
+    LUT, RGB_t, RGB_i, method, iterations, tolerance = arguments
+
+    interpolator = TABLE_INTERPOLATION_METHODS[method]
+    domain_min, domain_max = LUT.domain
+    step = (
+        (domain_max - domain_min) / (np.array(LUT.table.shape[:3]) - 1) * 1e-3)
+
+    RGB_i = np.copy(RGB_i)
+    RGB_f = LUT.apply(RGB_i, interpolator=interpolator)
+    error = np.sum((RGB_t - RGB_f) ** 2, -1)
+    damping = np.full(error.shape, 1e-3)
+
+    for _ in range(iterations):
+        active = np.where(
+            np.logical_and(
+                np.max(np.abs(RGB_t - RGB_f), -1) > tolerance,
+                damping < 1e6))[0]
+
+        if active.size == 0:
+            break
+
+        RGB_a, RGB_f_a = RGB_i[active], RGB_f[active]
+        residual = RGB_t[active] - RGB_f_a
+
+        jacobian = np.empty(RGB_a.shape + (3, ))
+        for i in range(3):
+            step_i = np.where(RGB_a[..., i] + step[i] > domain_max[i],
+                              -step[i], step[i])
+            RGB_d = np.copy(RGB_a)
+            RGB_d[..., i] += step_i
+            jacobian[..., i] = (LUT.apply(RGB_d, interpolator=interpolator) -
+                                RGB_f_a) / step_i[..., np.newaxis]
+
+        jacobian_T = np.swapaxes(jacobian, -1, -2)
+        A = np.matmul(jacobian_T, jacobian)
+        A += ((damping[active] *
+               (np.diagonal(A, axis1=-2, axis2=-1).sum(-1) + 1e-12)
+               )[..., np.newaxis, np.newaxis] * np.identity(3))
+        delta = np.linalg.solve(
+            A, np.matmul(jacobian_T, residual[..., np.newaxis]))
+
+        RGB_n = np.clip(RGB_a + delta[..., 0], domain_min, domain_max)
+        RGB_f_n = LUT.apply(RGB_n, interpolator=interpolator)
+        error_n = np.sum((RGB_t[active] - RGB_f_n) ** 2, -1)
+
+        improved = error_n < error[active]
+        accepted = active[improved]
+
+        RGB_i[accepted] = RGB_n[improved]
+        RGB_f[accepted] = RGB_f_n[improved]
+        error[accepted] = error_n[improved]
+        damping[active] = np.where(improved, damping[active] / 10,
+                                   damping[active] * 10)
+
+    return RGB_i
+
+
 def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
     """
     Converts given *LUT* to given ``cls`` class instance.
@@ -2092,6 +2547,8 @@ class LUTSequence(MutableSequence):
     -   :meth:`~colour.LUTSequence.__ne__`
     -   :meth:`~colour.LUTSequence.insert`
     -   :meth:`~colour.LUTSequence.apply`
+    -   :meth:`~colour.LUTSequence.bake`
+    -   :meth:`~colour.LUTSequence.invert`
     -   :meth:`~colour.LUTSequence.copy`
 
     Examples
@@ -2398,6 +2855,206 @@ class LUTSequence(MutableSequence):
 
         return RGB
 
+    def bake(self,
+             size=33,
+             method='Trilinear',
+             shaper=None,
+             domain=None,
+             probe=None,
+             additional_data=False,
+             **kwargs):
+        """
+        Bakes the *LUT* sequence into a single :class:`colour.LUT3D` class
+        instance, optionally preceded by given shaper *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Baked :class:`colour.LUT3D` class instance size.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Table interpolation method the baked :class:`colour.LUT3D` class
+            instance is intended to be applied with, used to compute the bake
+            error.
+        shaper : LUT1D or LUT3x1D, optional
+            Shaper *LUT* with a strictly increasing table, the baked
+            :class:`colour.LUT3D` class instance is sampled uniformly in the
+            shaper *LUT* output range.
+        domain : array_like, optional
+            Domain of the baked :class:`colour.LUT3D` class instance if no
+            shaper *LUT* is given, defaults to the domain of the first *LUT*
+            of the *LUT* sequence or to *[0, 1]*.
+        probe : array_like, optional
+            *RGB* colourspace array the bake error is computed on, defaults to
+            4096 random samples in the baked domain.
+        additional_data : bool, optional
+            If *True*, ``error`` will be returned alongside ``LUT``.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments for the :meth:`colour.LUTSequence.apply`
+            method.
+
+        Returns
+        -------
+        LUT : LUT3D or LUTSequence
+            Baked :class:`colour.LUT3D` class instance or
+            :class:`colour.LUTSequence` class instance of the shaper *LUT*
+            and baked :class:`colour.LUT3D` class instance.
+        error : numeric
+            Maximum absolute difference between the baked *LUT* and the *LUT*
+            sequence on the probe *RGB* colourspace array.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
+        >>> LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2))
+        >>> LUT_3 = LUT3x1D(LUT3x1D.linear_table(16) * 0.750)
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3)
+        >>> LUT, error = LUT_sequence.bake(additional_data=True)
+        >>> print(LUT)
+        LUT3D - Baked LUT Sequence
+        --------------------------
+        <BLANKLINE>
+        Dimensions : 3
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (33, 33, 33, 3)
+        Comment 01 : Baked from: LUT1D ---> LUT3D ---> LUT3x1D
+        >>> error  # doctest: +ELLIPSIS
+        0.0018666...
+        """
+
+        method = validate_method(method, TABLE_INTERPOLATION_METHODS)
+
+        if shaper is not None:
+            if isinstance(shaper, LUT1D):
+                shaper = LUT_to_LUT(shaper, LUT3x1D)
+
+            samples = shaper.linear_table(shaper.size, shaper.domain)
+            table = shaper.table
+
+            assert np.all(np.diff(table, axis=0) > 0), (
+                '"shaper" table must be strictly increasing!')
+
+            domain = np.vstack([samples[0], samples[-1]])
+            domain_LUT = np.vstack([table[0], table[-1]])
+
+            table_LUT = LUT3D.linear_table(size, domain_LUT)
+            RGB = tstack([
+                np.interp(table_LUT[..., i], table[..., i], samples[..., i])
+                for i in range(3)
+            ])
+        else:
+            if domain is None:
+                domain = np.array([[0, 0, 0], [1, 1, 1]])
+                if len(self) and isinstance(self[0], AbstractLUT):
+                    domain = self[0].domain
+                    if isinstance(self[0], LUT1D):
+                        domain = tstack([domain, domain, domain])
+
+            domain = as_float_array(domain)
+            domain = domain_LUT = np.vstack(
+                [np.nanmin(domain, axis=0),
+                 np.nanmax(domain, axis=0)])
+
+            RGB = LUT3D.linear_table(size, domain_LUT)
+
+        comments = [
+            'Baked from: {0}'.format(' ---> '.join(
+                [a.__class__.__name__ for a in self._sequence]))
+        ]
+
+        LUT = LUT3D(
+            self.apply(RGB, **kwargs),
+            'Baked LUT Sequence',
+            domain_LUT,
+            comments=comments)
+
+        sequence = LUTSequence(LUT)
+        if shaper is not None:
+            LUT = sequence = LUTSequence(shaper, LUT)
+
+        if not additional_data:
+            return LUT
+
+        if probe is None:
+            probe = random_triplet_generator(
+                4096,
+                np.transpose(domain),
+                random_state=np.random.RandomState(4))
+
+        # The bake method only applies to the baked *LUT*, the reference is
+        # evaluated with the caller's settings.
+        kwargs_baked = dict(kwargs)
+        kwargs_baked['interpolator_3D'] = TABLE_INTERPOLATION_METHODS[method]
+        kwargs_baked['interpolator_3D_kwargs'] = None
+
+        error = np.max(
+            np.abs(
+                sequence.apply(probe, **kwargs_baked) -
+                self.apply(probe, **kwargs)))
+
+        return LUT, error
+
+    def invert(self, **kwargs):
+        """
+        Computes and returns an inverse copy of the *LUT* sequence, i.e. the
+        inverses of its *LUTs* in reverse order.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            {:meth:`colour.LUT1D.invert`, :meth:`colour.LUT3x1D.invert`,
+            :meth:`colour.LUT3D.invert`},
+            Keywords arguments for the *LUTs* ``invert`` methods.
+
+        Returns
+        -------
+        LUTSequence
+            Inverse *LUT* sequence.
+
+        Examples
+        --------
+        >>> LUT_sequence = LUTSequence(
+        ...     LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My Shaper'),
+        ...     LUT3D(LUT3D.linear_table(17) * 0.5, 'My LUT'))
+        >>> print(LUT_sequence.invert())
+        LUT Sequence
+        ------------
+        <BLANKLINE>
+        Overview
+        <BLANKLINE>
+            LUT3D ---> LUT1D
+        <BLANKLINE>
+        Operations
+        <BLANKLINE>
+            LUT3D - My LUT - Inverse
+            ------------------------
+        <BLANKLINE>
+            Dimensions : 3
+            Domain     : [[ 0.   0.   0. ]
+                          [ 0.5  0.5  0.5]]
+            Size       : (17, 17, 17, 3)
+        <BLANKLINE>
+            LUT1D - My Shaper - Inverse
+            ---------------------------
+        <BLANKLINE>
+            Dimensions : 1
+            Domain     : [ 0.  1.]
+            Size       : (16,)
+        """
+
+        for LUT in self._sequence:
+            assert isinstance(LUT, AbstractLUT), (
+                '"{0}" is not a "LUT" and cannot be inverted!'.format(LUT))
+
+        return LUTSequence(*[
+            LUT.invert(**filter_kwargs(LUT.invert, **kwargs))
+            for LUT in reversed(self._sequence)
+        ])
+
     def copy(self):
         """
         Returns a copy of the *LUT* sequence.
@@ -2409,3 +3066,210 @@ class LUTSequence(MutableSequence):
         """
 
         return deepcopy(self)
+
+
+_APPLY_LUT_CHUNK_WORKER = {}
+"""
+*LUT* and keywords arguments for the *LUT* ``apply`` method of the
+:func:`colour.io.apply_LUT_chunked` definition process pool workers.
+
+_APPLY_LUT_CHUNK_WORKER : dict
+"""
+
+
+def _initializer_apply_LUT_chunk(LUT, kwargs):
+    """
+    Initializer for the :func:`colour.io.apply_LUT_chunked` definition process
+    pool workers, the *LUT* is sent once per worker rather than once per
+    chunk.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D or LUTSequence
+        *LUT* or *LUT* sequence to apply.
+    kwargs : dict
+        Keywords arguments for the *LUT* ``apply`` method.
+    """
+
+    _APPLY_LUT_CHUNK_WORKER['LUT'] = LUT
+    _APPLY_LUT_CHUNK_WORKER['kwargs'] = kwargs
+
+
+def _apply_LUT_chunk(arguments):
+    """
+    Applies given *LUT* to given *RGB* colourspace array chunk, this definition
+    is used by the :func:`colour.io.apply_LUT_chunked` definition workers.
+
+    Parameters
+    ----------
+    arguments : tuple
+        *LUT* or *None*, *RGB* colourspace array chunk, chunk slice, output
+        array, output memory-mapped file specification or *None* and keywords
+        arguments for the *LUT* ``apply`` method or *None*. The *LUT* and
+        keywords arguments set by the worker initializer are used when *None*.
+
+    Returns
+    -------
+    ndarray or None
+        Processed *RGB* colourspace array chunk if it is not written into the
+        output array by the worker.
+    """
+
+    LUT, RGB, chunk, output, kwargs = arguments
+
+    if LUT is None:
+        LUT = _APPLY_LUT_CHUNK_WORKER['LUT']
+        kwargs = _APPLY_LUT_CHUNK_WORKER['kwargs']
+
+    RGB = LUT.apply(RGB, **kwargs)
+
+    if output is None:
+        return RGB
+
+    if isinstance(output, tuple):
+        filename, dtype, shape, offset = output
+        output = np.memmap(filename, dtype, 'r+', offset, shape)
+        output[chunk] = RGB
+        output.flush()
+    else:
+        output[chunk] = RGB
+
+
+def apply_LUT_chunked(LUT,
+                      RGB,
+                      chunk_size=64,
+                      method='Thread',
+                      workers=None,
+                      output=None,
+                      progress=False,
+                      **kwargs):
+    """
+    Applies given *LUT* to given *RGB* colourspace array by splitting it into
+    chunks of rows processed on a thread or process pool.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D or LUTSequence
+        *LUT* or *LUT* sequence to apply.
+    RGB : array_like
+        *RGB* colourspace array to apply the *LUT* onto, it is split along its
+        first axis, e.g. rows for an image.
+    chunk_size : int, optional
+        Number of rows of each chunk.
+    method : unicode, optional
+        **{'Thread', 'Process'}**,
+        Pool type the chunks are processed on.
+    workers : int, optional
+        Number of workers of the pool, defaults to the number of *CPUs*.
+    output : array_like or unicode, optional
+        Preallocated output array, e.g. a :class:`numpy.memmap` class
+        instance, or path of a *.npy* file to create as a memory-mapped
+        output array. An array is allocated if not given.
+    progress : bool, optional
+        Whether to display a progress bar, requires *tqdm*.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the *LUT* ``apply`` method.
+
+    Returns
+    -------
+    ndarray
+        Processed *RGB* colourspace array.
+
+    Notes
+    -----
+    -   The output array allocated if not given, or created from the
+        ``output`` path, has the dtype of the *RGB* colourspace array if it is
+        floating point, :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` otherwise.
+    -   The chunks are submitted in batches so that only a bounded number of
+        them is in flight at once.
+    -   With the *Process* method, the *LUT* is sent once to each worker by
+        the pool initializer rather than with each chunk.
+    -   With the *Process* method, a memory-mapped output array created with
+        :func:`numpy.lib.format.open_memmap` definition or the ``output``
+        path is written into directly by the workers. Other output arrays are
+        written into by the main process.
+    -   The *Process* method runs sequentially when multiprocessing is
+        disabled with the :class:`colour.utilities.disable_multiprocessing`
+        context manager.
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+    >>> RGB = np.full([4, 2, 3], 0.18)
+    >>> apply_LUT_chunked(LUT, RGB, chunk_size=1)[..., 0]
+    ... # doctest: +ELLIPSIS
+    array([[ 0.4583277...,  0.4583277...],
+           [ 0.4583277...,  0.4583277...],
+           [ 0.4583277...,  0.4583277...],
+           [ 0.4583277...,  0.4583277...]])
+    """
+
+    method = validate_method(method, ['Thread', 'Process'])
+
+    if not isinstance(RGB, np.ndarray):
+        RGB = as_float_array(RGB)
+
+    dtype = (RGB.dtype
+             if np.issubdtype(RGB.dtype, np.floating) else DEFAULT_FLOAT_DTYPE)
+
+    if output is None:
+        output = np.empty(RGB.shape, dtype)
+    elif is_string(output):
+        output = np.lib.format.open_memmap(
+            output, mode='w+', dtype=dtype, shape=RGB.shape)
+
+    assert output.shape == RGB.shape, (
+        '"output" shape must be equal to "RGB" shape!')
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if RGB.ndim > 1:
+        chunks = [
+            slice(i, i + chunk_size)
+            for i in range(0, RGB.shape[0], chunk_size)
+        ]
+    else:
+        chunks = [Ellipsis]
+
+    if method == 'thread':
+        pool = multiprocessing.pool.ThreadPool(workers)
+        LUT_chunk, kwargs_chunk, target = LUT, kwargs, output
+    else:
+        pool = multiprocessing_pool(
+            workers,
+            initializer=_initializer_apply_LUT_chunk,
+            initargs=(LUT, kwargs))
+        LUT_chunk, kwargs_chunk, target = None, None, None
+        if (isinstance(output, np.memmap) and
+                isinstance(output.base, mmap.mmap)):
+            target = (output.filename, output.dtype, output.shape,
+                      output.offset)
+
+    try:
+        with pool as workers_pool, tqdm(
+                total=len(chunks), disable=not progress) as progress_bar:
+            for chunks_batch in batch(chunks, workers * 4):
+                results = workers_pool.map(
+                    _apply_LUT_chunk,
+                    [(LUT_chunk, RGB[chunk], chunk, target, kwargs_chunk)
+                     for chunk in chunks_batch])
+
+                for chunk, result in zip(chunks_batch, results):
+                    if result is not None:
+                        output[chunk] = result
+
+                progress_bar.update(len(chunks_batch))
+    finally:
+        # NOTE: The worker initializer runs in the current process when
+        # multiprocessing is disabled.
+        if method == 'process':
+            _APPLY_LUT_CHUNK_WORKER.clear()
+
+    if isinstance(output, np.memmap):
+        output.flush()
+
+    return output
@@ -16,10 +16,11 @@ References
     https://forum.blackmagicdesign.com/viewtopic.php?f=21&t=40284#p232952
 """
 
+import io
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import format_array, parse_array, path_to_title
 from colour.utilities import as_float_array, tstack
 
 __author__ = 'Colour Developers'
@@ -140,35 +141,49 @@ def read_LUT_ResolveCube(path):
     has_3x1D, has_3D = False, False
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
-        LUT = LUTSequence(LUT3x1D(), LUT3D())
-        for line in lines:
-            line = line.strip()
-
-            if len(line) == 0:
-                continue
-
-            if line.startswith('#'):
-                comments.append(line[1:].strip())
-                continue
-
-            tokens = line.split()
-            if tokens[0] == 'TITLE':
-                title = ' '.join(tokens[1:])[1:-1]
-            elif tokens[0] == 'LUT_1D_INPUT_RANGE':
-                domain = as_float_array(tokens[1:])
-                LUT[0].domain = tstack([domain, domain, domain])
-            elif tokens[0] == 'LUT_3D_INPUT_RANGE':
-                domain = as_float_array(tokens[1:])
-                LUT[1].domain = tstack([domain, domain, domain])
-            elif tokens[0] == 'LUT_1D_SIZE':
-                has_3x1D = True
-                size_3x1D = np.int_(tokens[1])
-            elif tokens[0] == 'LUT_3D_SIZE':
-                has_3D = True
-                size_3D = np.int_(tokens[1])
-            else:
-                table.append(tokens)
+        text = cube_file.read()
+
+    LUT = LUTSequence(LUT3x1D(), LUT3D())
+    offset = 0
+    for line in io.StringIO(text):
+        line_offset, offset = offset, offset + len(line)
+        line = line.strip()
+
+        if len(line) == 0:
+            continue
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        tokens = line.split()
+        if tokens[0] == 'TITLE':
+            title = ' '.join(tokens[1:])[1:-1]
+        elif tokens[0] == 'LUT_1D_INPUT_RANGE':
+            domain = as_float_array(tokens[1:])
+            LUT[0].domain = tstack([domain, domain, domain])
+        elif tokens[0] == 'LUT_3D_INPUT_RANGE':
+            domain = as_float_array(tokens[1:])
+            LUT[1].domain = tstack([domain, domain, domain])
+        elif tokens[0] == 'LUT_1D_SIZE':
+            has_3x1D = True
+            size_3x1D = np.int_(tokens[1])
+        elif tokens[0] == 'LUT_3D_SIZE':
+            has_3D = True
+            size_3D = np.int_(tokens[1])
+        else:
+            # Parsing the table in bulk, falling back to the line by line
+            # parser if it is interleaved with comments or keywords.
+            if len(table) == 0:
+                table = parse_array(
+                    text[line_offset:],
+                    (size_3x1D * has_3x1D + size_3D ** 3 * has_3D, 3))
+                if table is not None:
+                    break
+
+                table = []
+
+            table.append(tokens)
 
     table = as_float_array(table)
     if has_3x1D and has_3D:
@@ -311,13 +326,6 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
     if has_3D:
         assert 2 <= LUT[1].size <= 256, 'Cube size must be in domain [2, 256]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Resolve* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
     def _format_tuple(array):
         """
         Formats given array as 2 space separated values to *decimals*
@@ -354,14 +362,11 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
                     _format_tuple([LUT[1].domain[0][0], LUT[1].domain[1][0]])))
 
         if has_3x1D:
-            table = LUT[0].table
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.write(format_array(LUT[0].table, decimals))
             cube_file.write('\n')
 
         if has_3D:
             table = LUT[1].table.reshape([-1, 3], order='F')
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.write(format_array(table, decimals))
 
     return True
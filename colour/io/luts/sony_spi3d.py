@@ -9,11 +9,12 @@ Defines *Sony* *.spi3d* *LUT* Format related input / output utilities objects.
 -   :func:`colour.io.write_LUT_SonySPI3D`
 """
 
+import io
 import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import format_array, parse_array, path_to_title
 from colour.utilities import as_int_array, usage_warning, as_float_array
 
 __author__ = 'Colour Developers'
@@ -79,21 +80,54 @@ def read_LUT_SonySPI3D(path):
     comments = []
 
     with open(path) as spi3d_file:
-        lines = filter(None, (line.strip() for line in spi3d_file.readlines()))
-        for line in lines:
-            if line.startswith('#'):
-                comments.append(line[1:].strip())
-                continue
-
-            tokens = line.split()
-            if len(tokens) == 3:
-                assert len(set(tokens)) == 1, (
-                    'Non-uniform "LUT" shape is unsupported!')
-
-                size = DEFAULT_INT_DTYPE(tokens[0])
-            if len(tokens) == 6:
-                indexes.append(as_int_array(tokens[:3]))
-                table.append(as_float_array(tokens[3:]))
+        text = spi3d_file.read()
+
+    offset = 0
+    for line in io.StringIO(text):
+        line_offset, offset = offset, offset + len(line)
+        line = line.strip()
+
+        if len(line) == 0:
+            continue
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        tokens = line.split()
+        if len(tokens) == 3:
+            assert len(
+                set(tokens)) == 1, ('Non-uniform "LUT" shape is unsupported!')
+
+            size = DEFAULT_INT_DTYPE(tokens[0])
+        if len(tokens) == 6:
+            # Parsing the table in bulk up to the trailing comments, falling
+            # back to the line by line parser if it is interleaved with them.
+            if len(table) == 0:
+                comments_offset = text.find('#', line_offset)
+                if comments_offset == -1:
+                    comments_offset = len(text)
+
+                data = parse_array(text[line_offset:comments_offset],
+                                   (size ** 3, 6))
+                trailing_lines = [
+                    trailing_line.strip()
+                    for trailing_line in text[comments_offset:].splitlines()
+                    if trailing_line.strip()
+                ]
+
+                if data is not None and all(
+                        trailing_line.startswith('#')
+                        for trailing_line in trailing_lines):
+                    comments.extend([
+                        trailing_line[1:].strip()
+                        for trailing_line in trailing_lines
+                    ])
+                    indexes, table = data[:, :3], data[:, 3:]
+                    break
+
+            indexes.append(as_int_array(tokens[:3]))
+            table.append(as_float_array(tokens[3:]))
 
     indexes = as_int_array(indexes)
     sorting_indexes = np.lexsort((indexes[:, 2], indexes[:, 1], indexes[:, 0]))
@@ -162,14 +196,6 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
         [1, 1, 1],
     ])), '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Sony* *.spi3d* data row.
-        """
-
-        return '{1:d} {2:d} {3:d} {4:0.{0}f} {5:0.{0}f} {6:0.{0}f}'.format(
-            decimals, *array)
-
     with open(path, 'w') as spi3d_file:
         spi3d_file.write('SPILUT 1.0\n')
 
@@ -182,9 +208,10 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
                 [-1, 3])
         table = LUT.table.reshape([-1, 3])
 
-        for i, row in enumerate(indexes):
-            spi3d_file.write('{0}\n'.format(
-                _format_array(list(row) + list(table[i]))))
+        spi3d_file.write(
+            format_array(
+                np.hstack([indexes, table]), decimals,
+                ['%d'] * 3 + ['%.{0}f'.format(decimals)] * 3))
 
         if LUT.comments:
             for comment in LUT.comments:
@@ -10,6 +10,8 @@ import tempfile
 import unittest
 
 from colour.io import LUTSequence, read_LUT, write_LUT
+from colour.io.luts import _CACHE_LUTS
+from colour.utilities import caching_enable
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -79,6 +81,52 @@ class TestReadLUT(unittest.TestCase):
         )
         self.assertEqual(LUT_2[1].size, 4)
 
+    def test_read_LUT_cache(self):
+        """
+        Tests :func:`colour.io.luts.__init__.read_LUT` definition with cache.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'LogC_Video.cube')
+            shutil.copyfile(
+                os.path.join(LUTS_DIRECTORY, 'resolve_cube',
+                             'LogC_Video.cube'), path)
+
+            _CACHE_LUTS.clear()
+
+            LUT_1 = read_LUT(path, cache=True)
+            LUT_2 = read_LUT(path, cache=True)
+            self.assertEqual(_CACHE_LUTS.misses, 1)
+            self.assertEqual(_CACHE_LUTS.hits, 1)
+
+            self.assertEqual(LUT_1, read_LUT(path))
+            self.assertEqual(LUT_1, LUT_2)
+            self.assertIsNot(LUT_1, LUT_2)
+            self.assertIsNot(LUT_1[0], LUT_2[0])
+            self.assertIs(LUT_1[0].table, LUT_2[0].table)
+            self.assertFalse(LUT_1[1].table.flags.writeable)
+
+            LUT_1[0].name = 'Nemo'
+            LUT_1[1].table = LUT_1[1].table * 2
+            self.assertEqual(read_LUT(path, cache=True), LUT_2)
+
+            read_LUT(path, 'Resolve Cube', cache=True)
+            self.assertEqual(_CACHE_LUTS.misses, 2)
+
+            write_LUT(LUT_1, path)
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(read_LUT(path, cache=True), LUT_1)
+            self.assertEqual(_CACHE_LUTS.misses, 3)
+
+            _CACHE_LUTS.clear()
+            with caching_enable(False):
+                LUT_1 = read_LUT(path, cache=True)
+                self.assertTrue(LUT_1[1].table.flags.writeable)
+            self.assertEqual(len(_CACHE_LUTS), 0)
+        finally:
+            shutil.rmtree(temporary_directory)
+
     def test_raise_exception_read_LUT(self):
         """
         Tests :func:`colour.io.luts.__init__.read_LUT` definition raised
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.colour_binary` module.
+"""
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.algebra import spow
+from colour.io import (LUT1D, LUT3x1D, LUT3D, LUTSequence, read_LUT,
+                       read_LUT_ColourBinary, write_LUT,
+                       write_LUT_ColourBinary)
+from colour.io.luts.colour_binary import (ALIGNMENT_COLOUR_BINARY,
+                                          MAGIC_COLOUR_BINARY)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestReadLUTColourBinary', 'TestWriteLUTColourBinary']
+
+
+class TestReadLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        domain = np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]])
+        self._LUT_1 = LUT1D(
+            spow(LUT1D.linear_table(16), 1 / 2.2),
+            'Nemo 1D',
+            comments=['A first comment.', 'A second comment.'])
+        self._LUT_2 = LUT3x1D(
+            spow(LUT3x1D.linear_table(16, domain), 1 / 2.2), 'Nemo 3x1D',
+            domain)
+        self._LUT_3 = LUT3D(
+            spow(LUT3D.linear_table(16, domain), 1 / 2.2), 'Nemo 3D', domain)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clutb')
+
+        for LUT in (self._LUT_1, self._LUT_2, self._LUT_3):
+            write_LUT_ColourBinary(LUT, path, np.float64)
+
+            for mmap_mode in ('r', 'c', None):
+                LUT_t = read_LUT_ColourBinary(path, mmap_mode)
+
+                self.assertIsInstance(LUT_t, LUT.__class__)
+                self.assertEqual(LUT_t, LUT)
+                self.assertEqual(LUT_t.name, LUT.name)
+                self.assertListEqual(LUT_t.comments, LUT.comments)
+
+            LUT_t = read_LUT_ColourBinary(path)
+            self.assertFalse(LUT_t.table.flags.writeable)
+            self.assertIsInstance(LUT_t.table.base, np.memmap)
+
+            LUT_t += 1
+            np.testing.assert_almost_equal(
+                LUT_t.table, LUT.table + 1, decimal=7)
+            self.assertEqual(read_LUT_ColourBinary(path), LUT)
+
+            LUT_t = read_LUT_ColourBinary(path, 'c')
+            LUT_t.table[0] = 0
+            self.assertEqual(read_LUT_ColourBinary(path), LUT)
+
+        for dtype, decimal in ((np.float16, 2), (np.float32, 7)):
+            write_LUT_ColourBinary(self._LUT_3, path, dtype)
+            LUT_t = read_LUT_ColourBinary(path)
+
+            self.assertEqual(LUT_t.table.dtype, dtype)
+            np.testing.assert_almost_equal(
+                LUT_t.table, self._LUT_3.table, decimal=decimal)
+            np.testing.assert_almost_equal(
+                LUT_t.apply(np.array([0.18, 0.18, 0.18])),
+                self._LUT_3.apply(np.array([0.18, 0.18, 0.18])),
+                decimal=decimal - 1)
+
+    def test_read_LUT_ColourBinary_sequence(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition with a *LUT* sequence.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clutb')
+
+        LUT_sequence = LUTSequence(self._LUT_1, self._LUT_2, self._LUT_3)
+        write_LUT_ColourBinary(LUT_sequence, path, np.float64)
+        self.assertEqual(read_LUT_ColourBinary(path), LUT_sequence)
+
+        LUT_sequence = LUTSequence(self._LUT_3)
+        write_LUT_ColourBinary(LUT_sequence, path, np.float64)
+        self.assertEqual(read_LUT_ColourBinary(path), LUT_sequence)
+
+        write_LUT(self._LUT_1, path, method='Colour Binary', dtype=np.float64)
+        self.assertEqual(read_LUT(path), self._LUT_1)
+
+    def test_raise_exception_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clutb')
+
+        with open(path, 'wb') as clutb_file:
+            clutb_file.write(b'\x00' * 16)
+
+        self.assertRaises(AssertionError, read_LUT_ColourBinary, path)
+
+
+class TestWriteLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clutb')
+
+        LUT_sequence = LUTSequence(LUT1D(size=5), LUT3D(size=3))
+        self.assertTrue(write_LUT_ColourBinary(LUT_sequence, path))
+
+        with open(path, 'rb') as clutb_file:
+            data = clutb_file.read()
+
+        self.assertTrue(data.startswith(MAGIC_COLOUR_BINARY))
+
+        LUT_sequence_t = read_LUT_ColourBinary(path)
+        for LUT in LUT_sequence_t:
+            self.assertEqual(LUT.table.base.offset % ALIGNMENT_COLOUR_BINARY,
+                             0)
+
+        self.assertEqual(
+            len(data), LUT_sequence_t[1].table.base.offset + 3 ** 3 * 3 * 4)
+
+    def test_raise_exception_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clutb')
+
+        self.assertRaises(AssertionError, write_LUT_ColourBinary, LUT3D(),
+                          path, np.int32)
+
+        self.assertRaises(AssertionError, write_LUT_ColourBinary, object(),
+                          path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,10 @@
 Defines unit tests for :mod:`colour.io.luts.common` module.
 """
 
+import numpy as np
 import unittest
 
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import format_array, parse_array, path_to_title
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -14,7 +15,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestPathToTitle']
+__all__ = ['TestPathToTitle', 'TestParseArray', 'TestFormatArray']
 
 
 class TestPathToTitle(unittest.TestCase):
@@ -34,5 +35,51 @@ class TestPathToTitle(unittest.TestCase):
             'RGB 1 0 5 0 25')
 
 
+class TestParseArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_array` definition unit tests
+    methods.
+    """
+
+    def test_parse_array(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_array` definition.
+        """
+
+        np.testing.assert_equal(
+            parse_array('0 0.5 1\n\n-1e-3\t0.5 nan\r\n', (2, 3)),
+            np.array([[0, 0.5, 1], [-0.001, 0.5, np.nan]]))
+
+        self.assertIsNone(parse_array('0 0.5 1\n1 0.5\n', (2, 3)))
+
+        self.assertIsNone(parse_array('0 0.5 1\n# Comment\n1 0.5 0', (2, 3)))
+
+        self.assertIsNone(parse_array('0 0.5 1\nLUT_3D_SIZE 2\n', (1, 3)))
+
+
+class TestFormatArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.format_array` definition unit tests
+    methods.
+    """
+
+    def test_format_array(self):
+        """
+        Tests :func:`colour.io.luts.common.format_array` definition.
+        """
+
+        self.assertEqual(
+            format_array(np.array([[0, 0.5, 1], [1, 0.5, -0.25]]), 3),
+            '0.000 0.500 1.000\n1.000 0.500 -0.250\n')
+
+        self.assertEqual(
+            format_array(np.array([0, 0.5, 1]), 2), '0.00 0.50 1.00\n')
+
+        self.assertEqual(
+            format_array(
+                np.array([[0, 1, 0.5], [1, 0, 0.25]]),
+                formats=['%d', '%d', '%.1f']), '0 1 0.5\n1 0 0.2\n')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,15 +5,21 @@ Defines unit tests for :mod:`colour.io.luts.lut` module.
 
 import numpy as np
 import os
+import shutil
+import tempfile
 import textwrap
 import unittest
 
-from colour.algebra import random_triplet_generator, spow
+import colour.algebra.interpolation
+from colour.algebra import (LinearInterpolator, random_triplet_generator, spow,
+                            table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
 from colour.io.luts.lut import AbstractLUT
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
-                            LUTSequence, LUT_to_LUT)
+                            LUTSequence, LUT_to_LUT, apply_LUT_chunked)
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import gamma_function
-from colour.utilities import tsplit, tstack
+from colour.utilities import disable_multiprocessing, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -25,7 +31,7 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'TestAbstractLUT', 'TestLUT', 'TestLUT1D',
     'TestLUT3x1D', 'TestLUT3D', 'TestAbstractLUTSequenceOperator',
-    'TestLUTSequence'
+    'TestLUTSequence', 'TestLUT_to_LUT', 'TestApplyLUTChunked'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -110,7 +116,7 @@ class TestLUT(unittest.TestCase):
         """
 
         required_methods = ('__init__', 'is_domain_explicit', 'linear_table',
-                            'apply', 'as_LUT')
+                            'apply', 'invert', 'as_LUT')
 
         for class_ in (LUT1D, LUT3x1D, LUT3D):
             for method in required_methods:
@@ -489,6 +495,129 @@ class TestLUT(unittest.TestCase):
         np.testing.assert_almost_equal(
             LUT_3.apply(RANDOM_TRIPLETS), self._applied_3, decimal=7)
 
+    def test_apply_implicit_domain(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply` and
+        :class:`colour.io.luts.lut.LUT3x1D.apply` methods index arithmetic
+        with implicit domains.
+        """
+
+        if self._LUT_factory is None or self._dimensions == 3:
+            return
+
+        def interpolator(x, y):
+            """
+            Returns a :class:`colour.algebra.LinearInterpolator` class
+            instance, bypassing the index arithmetic.
+            """
+
+            return LinearInterpolator(x, y)
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(self._table_2, domain=self._domain_2)
+        RGB = LUT.linear_table(16, self._domain_2)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB),
+            LUT.apply(RGB, interpolator=interpolator),
+            decimal=7)
+
+        RGB_o = LUT.apply(RGB.astype(np.float32))
+        self.assertEqual(RGB_o.dtype, np.float32)
+        np.testing.assert_almost_equal(
+            RGB_o, LUT.apply(RGB, interpolator=interpolator), decimal=6)
+
+        LUT.table = LUT.table * 2
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB),
+            LUT.apply(RGB, interpolator=interpolator),
+            decimal=7)
+
+        LUT.table[-1, ...] = 0
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB),
+            LUT.apply(RGB, interpolator=interpolator),
+            decimal=7)
+
+        RGB[0, ...] = np.nan
+        RGB_o = LUT.apply(RGB)
+        self.assertTrue(np.all(np.isnan(RGB_o[0, ...])))
+        self.assertFalse(np.any(np.isnan(RGB_o[1:, ...])))
+
+        tile_size = colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE
+        try:
+            colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE = 5
+            np.testing.assert_almost_equal(LUT.apply(RGB), RGB_o, decimal=7)
+        finally:
+            colour.algebra.interpolation.TABLE_INTERPOLATION_TILE_SIZE = (
+                tile_size)
+
+        self.assertRaises(ValueError, LUT.apply, RGB + 2)
+        self.assertRaises(ValueError, LUT.apply, RGB - 2)
+
+    def test_invert(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.invert`,
+        :class:`colour.io.luts.lut.LUT3x1D.invert` and
+        :class:`colour.io.luts.lut.LUT3D.invert` methods.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        LUT_1 = self._LUT_factory(name='Nemo')
+        LUT_i = LUT_1.invert()
+
+        self.assertEqual(LUT_i.name, 'Nemo - Inverse')
+        self.assertIsInstance(LUT_i, self._LUT_factory)
+        np.testing.assert_almost_equal(LUT_i.table, LUT_1.table, decimal=7)
+        np.testing.assert_almost_equal(LUT_i.domain, LUT_1.domain, decimal=7)
+
+        # pylint: disable=E1102
+        LUT_2 = self._LUT_factory(self._table_2)
+        LUT_i = LUT_2.invert(16)
+
+        self.assertEqual(LUT_i.size, 16)
+        np.testing.assert_almost_equal(
+            LUT_i.apply(LUT_2.apply(RANDOM_TRIPLETS)),
+            RANDOM_TRIPLETS,
+            decimal=2)
+
+        # pylint: disable=E1102
+        LUT_3 = self._LUT_factory(self._table_3, domain=self._domain_3)
+        LUT_i = LUT_3.invert()
+
+        table = (np.reshape(self._table_3, [-1, 3])
+                 if self._dimensions > 1 else self._table_3)
+        np.testing.assert_almost_equal(
+            LUT_i.domain,
+            [np.nanmin(table, 0), np.nanmax(table, 0)],
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT_i.apply(LUT_3.apply(RANDOM_TRIPLETS)),
+            RANDOM_TRIPLETS,
+            decimal=1)
+
+        if self._dimensions == 3:
+            LUT_i = LUT_2.invert(16, method='Tetrahedral', workers=2)
+            np.testing.assert_almost_equal(
+                LUT_2.apply(
+                    LUT_i.table, interpolator=table_interpolation_tetrahedral),
+                LUT3D.linear_table(LUT_i.size, LUT_i.domain),
+                decimal=7)
+        else:
+            # pylint: disable=E1102
+            LUT_4 = self._LUT_factory(-self._table_2)
+            np.testing.assert_almost_equal(
+                LUT_4.invert().apply(LUT_4.apply(RANDOM_TRIPLETS)),
+                RANDOM_TRIPLETS,
+                decimal=2)
+
+            # pylint: disable=E1102
+            LUT_5 = self._LUT_factory(np.sin(self._table_1 * np.pi))
+            self.assertRaises(AssertionError, LUT_5.invert)
+
     def test_copy(self):
         """
         Tests :class:`colour.io.luts.lut.LUT1D.copy`,
@@ -811,6 +940,8 @@ class TestLUTSequence(unittest.TestCase):
 
         self._RGB = tstack([samples, samples, samples])
 
+        self._domain = np.array([[0.0, -0.1, -0.2], [1.0, 1.5, 3.0]])
+
     def test_required_attributes(self):
         """
         Tests presence of required attributes.
@@ -828,7 +959,8 @@ class TestLUTSequence(unittest.TestCase):
 
         required_methods = ('__init__', '__getitem__', '__setitem__',
                             '__delitem__', '__len__', '__str__', '__repr__',
-                            '__eq__', '__ne__', 'insert', 'apply', 'copy')
+                            '__eq__', '__ne__', 'insert', 'apply', 'bake',
+                            'invert', 'copy')
 
         for method in required_methods:
             self.assertIn(method, dir(LUTSequence))
@@ -1222,6 +1354,116 @@ class TestLUTSequence(unittest.TestCase):
                 [0.75000000, 0.75000000, 0.75000000],
             ]))
 
+    def test_bake(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method.
+        """
+
+        LUT = self._LUT_sequence.bake(16)
+
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertTupleEqual(LUT.table.shape, (16, 16, 16, 3))
+        np.testing.assert_almost_equal(LUT.domain,
+                                       np.array([[0, 0, 0], [1, 1, 1]]))
+        np.testing.assert_almost_equal(
+            LUT.table,
+            self._LUT_sequence.apply(LUT3D.linear_table(16)),
+            decimal=7)
+
+        for method in ('Trilinear', 'Tetrahedral'):
+            LUT, error = self._LUT_sequence.bake(
+                33, method, additional_data=True)
+
+            self.assertLess(error, 0.005)
+
+            LUT, error = self._LUT_sequence.bake(
+                33, method, probe=self._RGB, additional_data=True)
+
+            self.assertLess(error, 1e-7)
+
+        LUT, error = self._LUT_sequence.bake(
+            33,
+            'Trilinear',
+            probe=self._RGB,
+            additional_data=True,
+            interpolator_3D=table_interpolation_tetrahedral)
+        np.testing.assert_almost_equal(
+            error,
+            np.max(
+                np.abs(
+                    LUT.apply(
+                        self._RGB, interpolator=table_interpolation_trilinear)
+                    - self._LUT_sequence.apply(
+                        self._RGB,
+                        interpolator_3D=table_interpolation_tetrahedral))),
+            decimal=7)
+
+        LUT_1 = LUT3x1D(
+            LUT3x1D.linear_table(16, self._domain), domain=self._domain)
+        LUT = LUTSequence(LUT_1).bake(8)
+        np.testing.assert_almost_equal(LUT.domain, self._domain)
+
+        domain = np.array([[0.1, 0.2, 0.3], [0.9, 1.0, 2.0]])
+        LUT = LUTSequence(LUT_1).bake(8, domain=domain)
+        np.testing.assert_almost_equal(LUT.domain, domain)
+
+    def test_bake_shaper(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method with a
+        shaper *LUT*.
+        """
+
+        LUT_1 = LUT1D(LUT1D.linear_table(4096) ** (1 / 2.4))
+        LUT_sequence = LUTSequence(LUT_1)
+
+        _LUT, error = LUT_sequence.bake(17, additional_data=True)
+        self.assertGreater(error, 0.05)
+
+        LUT_sequence_s, error_s = LUT_sequence.bake(
+            17, shaper=LUT_1, additional_data=True)
+        self.assertIsInstance(LUT_sequence_s, LUTSequence)
+        self.assertIsInstance(LUT_sequence_s[0], LUT3x1D)
+        self.assertIsInstance(LUT_sequence_s[1], LUT3D)
+        self.assertLess(error_s, 1e-7)
+
+        self.assertRaises(
+            AssertionError,
+            lambda: LUT_sequence.bake(shaper=LUT1D(1 - LUT1D.linear_table())))
+
+    def test_invert(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.invert` method.
+        """
+
+        LUT_sequence = LUTSequence(
+            LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'Nemo 1D'),
+            LUT3D(LUT3D.linear_table(17) * 0.5, 'Nemo 3D'))
+        LUT_sequence_i = LUT_sequence.invert(size=33, workers=1)
+
+        self.assertListEqual([LUT.name for LUT in LUT_sequence_i],
+                             ['Nemo 3D - Inverse', 'Nemo 1D - Inverse'])
+        self.assertEqual(LUT_sequence_i[0].size, 33)
+        self.assertEqual(LUT_sequence_i[1].size, 33)
+
+        RGB = np.reshape(RANDOM_TRIPLETS, [-1, 3])
+        np.testing.assert_almost_equal(
+            LUT_sequence_i.apply(LUT_sequence.apply(RGB)), RGB, decimal=2)
+
+        class IdentityOperator(AbstractLUTSequenceOperator):
+            """
+            Identity operator for unit tests.
+            """
+
+            def apply(self, RGB, *args):
+                """
+                Applies the *LUT* sequence operator to given *RGB* array.
+                """
+
+                return RGB
+
+        LUT_sequence.append(IdentityOperator())
+        self.assertRaises(AssertionError, LUT_sequence.invert)
+
 
 class TestLUT_to_LUT(unittest.TestCase):
     """
@@ -1679,5 +1921,130 @@ class TestLUT_to_LUT(unittest.TestCase):
         self.assertEqual(LUT, self._LUT_3)
 
 
+class TestApplyLUTChunked(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.lut.apply_LUT_chunked` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._LUT_sequence = LUTSequence(
+            LUT1D(LUT1D.linear_table(16) + 0.125),
+            LUT3D(LUT3D.linear_table(16) ** (1 / 2.2)),
+            LUT3x1D(LUT3x1D.linear_table(16) * 0.750))
+
+        self._RGB = np.reshape(
+            random_triplet_generator(
+                8 * 5, random_state=np.random.RandomState(4)), (8, 5, 3))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_apply_LUT_chunked(self):
+        """
+        Tests :func:`colour.io.luts.lut.apply_LUT_chunked` definition.
+        """
+
+        for LUT in [*self._LUT_sequence, self._LUT_sequence]:
+            RGB_o = LUT.apply(self._RGB)
+
+            for method in ('Thread', 'Process'):
+                for chunk_size in (1, 3, 16):
+                    np.testing.assert_almost_equal(
+                        apply_LUT_chunked(
+                            LUT, self._RGB, chunk_size, method, workers=2),
+                        RGB_o,
+                        decimal=7)
+
+        LUT = self._LUT_sequence[1]
+        np.testing.assert_almost_equal(
+            apply_LUT_chunked(LUT, self._RGB[0, 0]),
+            LUT.apply(self._RGB[0, 0]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            apply_LUT_chunked(
+                LUT, self._RGB, interpolator=table_interpolation_tetrahedral),
+            LUT.apply(self._RGB, table_interpolation_tetrahedral),
+            decimal=7)
+
+    def test_output_apply_LUT_chunked(self):
+        """
+        Tests :func:`colour.io.luts.lut.apply_LUT_chunked` definition output
+        handling.
+        """
+
+        LUT = self._LUT_sequence[1]
+        RGB_o = LUT.apply(self._RGB)
+
+        output = np.zeros(self._RGB.shape)
+        self.assertIs(apply_LUT_chunked(LUT, self._RGB, output=output), output)
+        np.testing.assert_almost_equal(output, RGB_o, decimal=7)
+
+        for method in ('Thread', 'Process'):
+            path = os.path.join(self._temporary_directory,
+                                '{0}.npy'.format(method))
+            output = apply_LUT_chunked(
+                LUT, self._RGB, 3, method, workers=2, output=path)
+
+            self.assertIsInstance(output, np.memmap)
+            np.testing.assert_almost_equal(np.load(path), RGB_o, decimal=7)
+
+            output = np.lib.format.open_memmap(
+                path, mode='r+', shape=self._RGB.shape)
+            output[:] = 0
+            apply_LUT_chunked(
+                LUT, self._RGB, 3, method, workers=2, output=output)
+            np.testing.assert_almost_equal(np.load(path), RGB_o, decimal=7)
+
+        self.assertRaises(
+            AssertionError,
+            lambda: apply_LUT_chunked(LUT, self._RGB, output=np.zeros(3)))
+
+    def test_dtype_apply_LUT_chunked(self):
+        """
+        Tests :func:`colour.io.luts.lut.apply_LUT_chunked` definition output
+        dtype.
+        """
+
+        LUT = self._LUT_sequence[1]
+        RGB = self._RGB.astype(np.float32)
+
+        self.assertEqual(apply_LUT_chunked(LUT, RGB).dtype, np.float32)
+
+        path = os.path.join(self._temporary_directory, 'float32.npy')
+        apply_LUT_chunked(LUT, RGB, 3, 'Process', workers=2, output=path)
+        self.assertEqual(np.load(path).dtype, np.float32)
+        np.testing.assert_almost_equal(
+            np.load(path), LUT.apply(self._RGB), decimal=5)
+
+        self.assertEqual(
+            apply_LUT_chunked(LUT, np.zeros([2, 2, 3], np.uint8)).dtype,
+            DEFAULT_FLOAT_DTYPE)
+
+    def test_disable_multiprocessing_apply_LUT_chunked(self):
+        """
+        Tests :func:`colour.io.luts.lut.apply_LUT_chunked` definition with
+        multiprocessing disabled.
+        """
+
+        with disable_multiprocessing():
+            np.testing.assert_almost_equal(
+                apply_LUT_chunked(
+                    self._LUT_sequence, self._RGB, 3, 'Process', workers=2),
+                self._LUT_sequence.apply(self._RGB),
+                decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -87,9 +87,9 @@ def XYZ_to_Lab(XYZ,
     array([ 41.5278752...,  52.6385830...,  26.9231792...])
     """
 
-    X, Y, Z = tsplit(to_domain_1(XYZ))
+    X, Y, Z = tsplit(to_domain_1(XYZ), copy=False)
 
-    X_n, Y_n, Z_n = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    X_n, Y_n, Z_n = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)), copy=False)
 
     f_X_X_n = intermediate_lightness_function_CIE1976(X, X_n)
     f_Y_Y_n = intermediate_lightness_function_CIE1976(Y, Y_n)
@@ -157,9 +157,9 @@ def Lab_to_XYZ(Lab,
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    L, a, b = tsplit(to_domain_100(Lab))
+    L, a, b = tsplit(to_domain_100(Lab), copy=False)
 
-    X_n, Y_n, Z_n = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    X_n, Y_n, Z_n = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)), copy=False)
 
     f_Y_Y_n = (L + 16) / 116
     f_X_X_n = a / 500 + f_Y_Y_n
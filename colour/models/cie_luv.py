@@ -101,9 +101,9 @@ def XYZ_to_Luv(XYZ,
     array([ 41.5278752...,  96.8362605...,  17.7521014...])
     """
 
-    X, Y, Z = tsplit(to_domain_1(XYZ))
+    X, Y, Z = tsplit(to_domain_1(XYZ), copy=False)
 
-    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)), copy=False)
 
     with domain_range_scale('100'):
         L = lightness_CIE1976(Y, Y_r)
@@ -172,9 +172,9 @@ def Luv_to_XYZ(Luv,
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    L, u, v = tsplit(to_domain_100(Luv))
+    L, u, v = tsplit(to_domain_100(Luv), copy=False)
 
-    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)), copy=False)
 
     with domain_range_scale('100'):
         Y = luminance_CIE1976(L, Y_r)
@@ -243,7 +243,7 @@ def Luv_to_uv(Luv,
 
     Luv = to_domain_100(Luv)
 
-    X, Y, Z = tsplit(Luv_to_XYZ(Luv, illuminant))
+    X, Y, Z = tsplit(Luv_to_XYZ(Luv, illuminant), copy=False)
 
     X_Y_Z = X + 15 * Y + 3 * Z
 
@@ -305,7 +305,7 @@ def uv_to_Luv(uv,
     array([ 100.        ,  233.1837603...,   42.7474385...])
     """
 
-    u, v = tsplit(uv)
+    u, v = tsplit(uv, copy=False)
     Y = to_domain_1(Y)
 
     X = 9 * u / (4 * v)
@@ -342,7 +342,7 @@ def Luv_uv_to_xy(uv):
     array([ 0.5436955...,  0.3210794...])
     """
 
-    u, v = tsplit(uv)
+    u, v = tsplit(uv, copy=False)
 
     d = 6 * u - 16 * v + 12
     xy = tstack([9 * u / d, 4 * v / d])
@@ -377,7 +377,7 @@ def xy_to_Luv_uv(xy):
     array([ 0.3772021...,  0.5012026...])
     """
 
-    x, y = tsplit(xy)
+    x, y = tsplit(xy, copy=False)
 
     d = -2 * x + 12 * y + 3
     uv = tstack([4 * x / d, 9 * y / d])
@@ -77,7 +77,7 @@ def XYZ_to_UCS(XYZ):
     array([ 0.1376933...,  0.1219722...,  0.1053731...])
     """
 
-    X, Y, Z = tsplit(to_domain_1(XYZ))
+    X, Y, Z = tsplit(to_domain_1(XYZ), copy=False)
 
     UVW = tstack([2 / 3 * X, Y, 1 / 2 * (-X + 3 * Y + Z)])
 
@@ -125,7 +125,7 @@ def UCS_to_XYZ(UVW):
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    U, V, W = tsplit(to_domain_1(UVW))
+    U, V, W = tsplit(to_domain_1(UVW), copy=False)
 
     XYZ = tstack([3 / 2 * U, V, 3 / 2 * U - (3 * V) + (2 * W)])
 
@@ -168,7 +168,7 @@ def UCS_to_uv(UVW):
     array([ 0.3772021...,  0.3341350...])
     """
 
-    U, V, W = tsplit(to_domain_1(UVW))
+    U, V, W = tsplit(to_domain_1(UVW), copy=False)
 
     U_V_W = U + V + W
 
@@ -208,7 +208,7 @@ def uv_to_UCS(uv, V=1):
     array([ 1.1288911...,  1.        ,  0.8639104...])
     """
 
-    u, v = tsplit(uv)
+    u, v = tsplit(uv, copy=False)
     V = full(u.shape, V)
 
     U = V * u / v
@@ -246,7 +246,7 @@ def UCS_uv_to_xy(uv):
     array([ 0.5436955...,  0.3210794...])
     """
 
-    u, v = tsplit(uv)
+    u, v = tsplit(uv, copy=False)
 
     d = 2 * u - 8 * v + 4
     xy = tstack([3 * u / d, 2 * v / d])
@@ -281,7 +281,7 @@ def xy_to_UCS_uv(xy):
     array([ 0.3772021...,  0.3341350...])
     """
 
-    x, y = tsplit(xy)
+    x, y = tsplit(xy, copy=False)
 
     d = 12 * y - 2 * x + 3
     uv = tstack([4 * x / d, 6 * y / d])
@@ -26,7 +26,7 @@ import numpy as np
 
 from colour.colorimetry import CCS_ILLUMINANTS
 from colour.utilities import (as_float_array, from_range_1, full, to_domain_1,
-                              tsplit, tstack, zeros)
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -87,18 +87,15 @@ def XYZ_to_xyY(XYZ,
     """
 
     XYZ = to_domain_1(XYZ)
-    X, Y, Z = tsplit(XYZ)
+    X, Y, Z = tsplit(XYZ, copy=False)
     xy_w = as_float_array(illuminant)
 
-    XYZ_n = zeros(XYZ.shape)
-    XYZ_n[..., 0:2] = xy_w
+    X_Y_Z = X + Y + Z
+    xyY = tstack([X / X_Y_Z, Y / X_Y_Z, Y])
+    xyY[..., 2] = from_range_1(xyY[..., 2])
 
-    xyY = np.where(
-        np.all(XYZ == 0, axis=-1)[..., np.newaxis],
-        XYZ_n,
-        tstack([X / (X + Y + Z), Y / (X + Y + Z),
-                from_range_1(Y)]),
-    )
+    np.copyto(
+        xyY[..., 0:2], xy_w, where=np.all(XYZ == 0, axis=-1)[..., np.newaxis])
 
     return xyY
 
@@ -143,14 +140,11 @@ def xyY_to_XYZ(xyY):
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    x, y, Y = tsplit(xyY)
+    x, y, Y = tsplit(xyY, copy=False)
     Y = to_domain_1(Y)
 
-    XYZ = np.where(
-        (y == 0)[..., np.newaxis],
-        tstack([y, y, y]),
-        tstack([x * Y / y, Y, (1 - x - y) * Y / y]),
-    )
+    XYZ = tstack([x * Y / y, Y, (1 - x - y) * Y / y])
+    np.copyto(XYZ, y[..., np.newaxis], where=(y == 0)[..., np.newaxis])
 
     return from_range_1(XYZ)
 
@@ -276,7 +270,7 @@ def xy_to_xyY(xy, Y=1):
     if shape[-1] == 3:
         return xy
 
-    x, y = tsplit(xy)
+    x, y = tsplit(xy, copy=False)
 
     Y = full(x.shape, from_range_1(Y))
     xyY = tstack([x, y, Y])
@@ -92,9 +92,9 @@ def Jab_to_JCh(Jab):
     array([ 41.5278752...,  59.1242590...,  27.0884878...])
     """
 
-    L, a, b = tsplit(Jab)
+    L, a, b = tsplit(Jab, copy=False)
 
-    C, H = tsplit(cartesian_to_polar(tstack([a, b])))
+    C, H = tsplit(cartesian_to_polar(tstack([a, b])), copy=False)
 
     JCh = tstack([L, C, from_range_degrees(np.degrees(H) % 360)])
 
@@ -155,10 +155,11 @@ def JCh_to_Jab(JCh):
     array([ 41.5278752...,  52.6385830...,  26.9231792...])
     """
 
-    L, C, H = tsplit(JCh)
+    L, C, H = tsplit(JCh, copy=False)
 
     a, b = tsplit(
-        polar_to_cartesian(tstack([C, np.radians(to_domain_degrees(H))])))
+        polar_to_cartesian(tstack([C, np.radians(to_domain_degrees(H))])),
+        copy=False)
 
     Jab = tstack([L, a, b])
 
@@ -86,7 +86,7 @@ def Lab_to_DIN99(Lab, k_E=1, k_CH=1):
     array([ 53.2282198...,  28.4163465...,   3.8983955...])
     """
 
-    L, a, b = tsplit(to_domain_100(Lab))
+    L, a, b = tsplit(to_domain_100(Lab), copy=False)
 
     cos_16 = np.cos(np.radians(16))
     sin_16 = np.sin(np.radians(16))
@@ -163,7 +163,7 @@ def DIN99_to_Lab(Lab_99, k_E=1, k_CH=1):
     array([ 41.5278752...,  52.6385830...,  26.9231792...])
     """
 
-    L_99, a_99, b_99 = tsplit(to_domain_100(Lab_99))
+    L_99, a_99, b_99 = tsplit(to_domain_100(Lab_99), copy=False)
 
     cos_16 = np.cos(np.radians(16))
     sin_16 = np.sin(np.radians(16))
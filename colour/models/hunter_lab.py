@@ -64,7 +64,7 @@ def XYZ_to_K_ab_HunterLab1966(XYZ):
     array([ 185.2378721...,   38.4219142...])
     """
 
-    X, _Y, Z = tsplit(XYZ)
+    X, _Y, Z = tsplit(XYZ, copy=False)
 
     K_a = 175 * np.sqrt(X / 98.043)
     K_b = 70 * np.sqrt(Z / 118.115)
@@ -132,10 +132,10 @@ def XYZ_to_Hunter_Lab(XYZ,
     array([ 34.9245257...,  47.0618985...,  14.3861510...])
     """
 
-    X, Y, Z = tsplit(to_domain_100(XYZ))
-    X_n, Y_n, Z_n = tsplit(to_domain_100(XYZ_n))
-    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n))
-                if K_ab is None else tsplit(K_ab))
+    X, Y, Z = tsplit(to_domain_100(XYZ), copy=False)
+    X_n, Y_n, Z_n = tsplit(to_domain_100(XYZ_n), copy=False)
+    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n), copy=False)
+                if K_ab is None else tsplit(K_ab, copy=False))
 
     Y_Y_n = Y / Y_n
     sqrt_Y_Y_n = np.sqrt(Y_Y_n)
@@ -207,10 +207,10 @@ def Hunter_Lab_to_XYZ(Lab,
     array([ 20.654008,  12.197225,   5.136952])
     """
 
-    L, a, b = tsplit(to_domain_100(Lab))
-    X_n, Y_n, Z_n = tsplit(to_domain_100(XYZ_n))
-    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n))
-                if K_ab is None else tsplit(K_ab))
+    L, a, b = tsplit(to_domain_100(Lab), copy=False)
+    X_n, Y_n, Z_n = tsplit(to_domain_100(XYZ_n), copy=False)
+    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n), copy=False)
+                if K_ab is None else tsplit(K_ab, copy=False))
 
     L_100 = L / 100
     L_100_2 = L_100 ** 2
@@ -226,7 +226,7 @@ def IPT_hue_angle(IPT):
     48.2852074...
     """
 
-    _I, P, T = tsplit(to_domain_1(IPT))
+    _I, P, T = tsplit(to_domain_1(IPT), copy=False)
 
     hue = np.degrees(np.arctan2(T, P)) % 360
 
@@ -157,7 +157,7 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=CONSTANTS_JZAZBZ):
     array([ 0.0053504...,  0.0092430...,  0.0052600...])
     """
 
-    X_D65, Y_D65, Z_D65 = tsplit(to_domain_1(XYZ_D65))
+    X_D65, Y_D65, Z_D65 = tsplit(to_domain_1(XYZ_D65), copy=False)
 
     X_p_D65 = constants.b * X_D65 - (constants.b - 1) * Z_D65
     Y_p_D65 = constants.g * Y_D65 - (constants.g - 1) * X_D65
@@ -169,7 +169,8 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=CONSTANTS_JZAZBZ):
     with domain_range_scale('ignore'):
         LMS_p = eotf_inverse_ST2084(LMS, 10000, constants)
 
-    I_z, A_z, B_z = tsplit(vector_dot(MATRIX_JZAZBZ_LMS_P_TO_IZAZBZ, LMS_p))
+    I_z, A_z, B_z = tsplit(
+        vector_dot(MATRIX_JZAZBZ_LMS_P_TO_IZAZBZ, LMS_p), copy=False)
 
     J_z = ((1 + constants.d) * I_z) / (1 + constants.d * I_z) - constants.d_0
 
@@ -238,7 +239,7 @@ def JzAzBz_to_XYZ(JzAzBz, constants=CONSTANTS_JZAZBZ):
     array([ 0.2065402...,  0.1219723...,  0.0513696...])
     """
 
-    J_z, A_z, B_z = tsplit(to_domain_1(JzAzBz))
+    J_z, A_z, B_z = tsplit(to_domain_1(JzAzBz), copy=False)
 
     I_z = ((J_z + constants.d_0) / (1 + constants.d - constants.d *
                                     (J_z + constants.d_0)))
@@ -248,7 +249,7 @@ def JzAzBz_to_XYZ(JzAzBz, constants=CONSTANTS_JZAZBZ):
         LMS = eotf_ST2084(LMS_p, 10000, constants)
 
     X_p_D65, Y_p_D65, Z_p_D65 = tsplit(
-        vector_dot(MATRIX_JZAZBZ_LMS_TO_XYZ, LMS))
+        vector_dot(MATRIX_JZAZBZ_LMS_TO_XYZ, LMS), copy=False)
 
     X_D65 = (X_p_D65 + (constants.b - 1) * Z_p_D65) / constants.b
     Y_D65 = (Y_p_D65 + (constants.g - 1) * X_D65) / constants.g
@@ -167,7 +167,7 @@ def CMY_to_CMYK(CMY):
     array([ 0.        ,  0.9324630...,  0.9103045...,  0.5437948...])
     """
 
-    C, M, Y = tsplit(to_domain_1(CMY))
+    C, M, Y = tsplit(to_domain_1(CMY), copy=False)
 
     K = np.where(C < 1, C, 1)
     K = np.where(M < K, M, K)
@@ -226,7 +226,7 @@ def CMYK_to_CMY(CMYK):
     array([ 0.5098039...,  0.0196078...,  0.7490196...])
     """
 
-    C, M, Y, K = tsplit(to_domain_1(CMYK))
+    C, M, Y, K = tsplit(to_domain_1(CMYK), copy=False)
 
     CMY = tstack([C * (1 - K) + K, M * (1 - K) + K, Y * (1 - K) + K])
 
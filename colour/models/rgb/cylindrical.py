@@ -105,7 +105,7 @@ def RGB_to_HSV(RGB):
 
     V = maximum
 
-    R, G, B = tsplit(RGB)
+    R, G, B = tsplit(RGB, copy=False)
 
     S = as_float_array(delta / maximum)
     S[np.asarray(delta == 0)] = 0
@@ -166,7 +166,7 @@ def HSV_to_RGB(HSV):
     array([ 0.4562051...,  0.0308107...,  0.0409195...])
     """
 
-    H, S, V = tsplit(to_domain_1(HSV))
+    H, S, V = tsplit(to_domain_1(HSV), copy=False)
 
     h = as_float_array(H * 6)
     h[np.asarray(h == 6)] = 0
@@ -238,7 +238,7 @@ def RGB_to_HSL(RGB):
     maximum = np.amax(RGB, -1)
     delta = np.ptp(RGB, -1)
 
-    R, G, B = tsplit(RGB)
+    R, G, B = tsplit(RGB, copy=False)
 
     L = (maximum + minimum) / 2
 
@@ -305,7 +305,7 @@ def HSL_to_RGB(HSL):
     array([ 0.4562051...,  0.0308107...,  0.0409195...])
     """
 
-    H, S, L = tsplit(to_domain_1(HSL))
+    H, S, L = tsplit(to_domain_1(HSL), copy=False)
 
     def H_to_RGB(vi, vj, vH):
         """
@@ -336,7 +336,7 @@ def HSL_to_RGB(HSL):
     i = 2 * L - j
 
     R = H_to_RGB(i, j, H + (1 / 3))
-    G = H_to_RGB(i, j, H)
+    G = H_to_RGB(i, j, np.copy(H))
     B = H_to_RGB(i, j, H - (1 / 3))
 
     R = np.where(S == 0, L, R)
@@ -393,7 +393,7 @@ def RGB_to_HCL(RGB, gamma=3, Y_0=100):
     array([-0.0316785...,  0.2841715...,  0.2285964...])
     """
 
-    R, G, B = tsplit(to_domain_1(RGB))
+    R, G, B = tsplit(to_domain_1(RGB), copy=False)
 
     Min = np.minimum(np.minimum(R, G), B)
     Max = np.maximum(np.maximum(R, G), B)
@@ -477,7 +477,7 @@ def HCL_to_RGB(HCL, gamma=3, Y_0=100):
     array([ 0.4562033...,  0.0308104...,  0.0409192...])
     """
 
-    H, C, L = tsplit(to_domain_1(HCL))
+    H, C, L = tsplit(to_domain_1(HCL), copy=False)
 
     Q = np.exp((1 - (3 * C) / (4 * L)) * (gamma / Y_0))
 
@@ -426,7 +426,7 @@ def RGB_to_YCbCr(RGB,
 
     RGB_float = RGB.astype(DEFAULT_FLOAT_DTYPE) - RGB_min
     RGB_float *= 1 / (RGB_max - RGB_min)
-    R, G, B = tsplit(RGB_float)
+    R, G, B = tsplit(RGB_float, copy=False)
 
     Y = Kr * R + (1 - Kr - Kb) * G + Kb * B
     Cb = 0.5 * (B - Y) / (1 - Kb)
@@ -652,7 +652,7 @@ def RGB_to_YcCbcCrc(RGB,
     array([422, 512, 512]...)
     """
 
-    R, G, B = tsplit(to_domain_1(RGB))
+    R, G, B = tsplit(to_domain_1(RGB), copy=False)
     Y_min, Y_max, C_min, C_max = kwargs.get(
         'out_range', ranges_YCbCr(out_bits, out_legal, out_int))
 
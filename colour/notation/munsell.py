@@ -128,7 +128,7 @@ from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (
-    CaseInsensitiveMapping, Lookup, as_float_array, as_float, as_int,
+    CaseInsensitiveMapping, LRUCache, Lookup, as_float_array, as_float, as_int,
     as_numeric, domain_range_scale, from_range_1, from_range_10,
     get_domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
     is_integer, is_numeric, tsplit, usage_warning, validate_method)
@@ -194,9 +194,7 @@ ILLUMINANT_NAME_MUNSELL = 'C'
 CCS_ILLUMINANT_MUNSELL = (CCS_ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][ILLUMINANT_NAME_MUNSELL])
 
-_MUNSELL_SPECIFICATIONS_CACHE = None
-_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_CACHE_MUNSELL = LRUCache('colour.notation.munsell._CACHE_MUNSELL')
 
 
 def _munsell_specifications():
@@ -226,15 +224,18 @@ def _munsell_specifications():
         *Munsell Renotation System* specifications.
     """
 
-    global _MUNSELL_SPECIFICATIONS_CACHE
+    specifications = _CACHE_MUNSELL.get('Specifications')
 
-    if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = np.array([
-            munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*colour[0]))
-            for colour in MUNSELL_COLOURS_ALL
-        ])
-    return _MUNSELL_SPECIFICATIONS_CACHE
+    if specifications is None:
+        specifications = _CACHE_MUNSELL.set(
+            'Specifications',
+            np.array([
+                munsell_colour_to_munsell_specification(
+                    MUNSELL_COLOUR_FORMAT.format(*colour[0]))
+                for colour in MUNSELL_COLOURS_ALL
+            ]))
+
+    return specifications
 
 
 def _munsell_value_ASTMD1535_interpolator():
@@ -248,15 +249,17 @@ def _munsell_value_ASTMD1535_interpolator():
         *Munsell* value interpolator for *ASTM D1535-08e1* method.
     """
 
-    global _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    interpolator = _CACHE_MUNSELL.get('Value ASTM D1535-08 Interpolator')
 
-    munsell_values = np.arange(0, 10, 0.001)
-    if _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE is None:
-        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = Extrapolator(
-            LinearInterpolator(
-                luminance_ASTMD1535(munsell_values), munsell_values))
+    if interpolator is None:
+        munsell_values = np.arange(0, 10, 0.001)
+        interpolator = _CACHE_MUNSELL.set(
+            'Value ASTM D1535-08 Interpolator',
+            Extrapolator(
+                LinearInterpolator(
+                    luminance_ASTMD1535(munsell_values), munsell_values)))
 
-    return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    return interpolator
 
 
 def _munsell_maximum_chromas_from_renotation():
@@ -270,9 +273,9 @@ def _munsell_maximum_chromas_from_renotation():
         Maximum *Munsell* chromas.
     """
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    maximum_chromas = _CACHE_MUNSELL.get('Maximum Chromas From Renotation')
 
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
+    if maximum_chromas is None:
         chromas = OrderedDict()
         for munsell_colour in MUNSELL_COLOURS_ALL:
             hue, value, chroma, code = munsell_colour_to_munsell_specification(
@@ -283,9 +286,11 @@ def _munsell_maximum_chromas_from_renotation():
 
             chromas[index] = chroma
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+        maximum_chromas = _CACHE_MUNSELL.set(
+            'Maximum Chromas From Renotation',
+            tuple(zip(chromas.keys(), chromas.values())))
+
+    return maximum_chromas
 
 
 def munsell_value_Priest1920(Y):
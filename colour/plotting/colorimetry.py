@@ -327,7 +327,7 @@ def plot_multi_sds(sds, plot_kwargs=None, **kwargs):
                 XYZ = sd_to_XYZ(sd, cmfs, illuminant)
 
             if normalise_sd_colours:
-                XYZ /= XYZ[..., 1]
+                XYZ = XYZ / XYZ[..., 1]
 
             plot_settings['color'] = np.clip(
                 XYZ_to_plotting_colourspace(XYZ), 0, 1)
@@ -769,7 +769,7 @@ def plot_sds_in_chromaticity_diagram(
 
         if use_sd_colours:
             if normalise_sd_colours:
-                XYZ /= XYZ[..., 1]
+                XYZ = XYZ / XYZ[..., 1]
 
             plot_settings['color'] = np.clip(
                 XYZ_to_plotting_colourspace(XYZ), 0, 1)
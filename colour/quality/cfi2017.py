@@ -25,7 +25,7 @@ from colour.colorimetry import (
     sd_blackbody, MSDS_CMFS, sd_ones, sd_CIE_illuminant_D_series)
 from colour.models import XYZ_to_UCS, UCS_to_uv, JMh_CIECAM02_to_CAM02UCS
 from colour.temperature import uv_to_CCT_Ohno2013, CCT_to_xy_CIE_D
-from colour.utilities import as_int, usage_warning
+from colour.utilities import LRUCache, as_int, usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -58,7 +58,7 @@ RESOURCES_DIRECTORY_CIE2017 = os.path.join(
 RESOURCES_DIRECTORY_CIE2017 : unicode
 """
 
-_CACHE_TCS_CIE2017 = {}
+_CACHE_TCS_CIE2017 = LRUCache('colour.quality.cfi2017._CACHE_TCS_CIE2017')
 
 
 class TCS_ColorimetryData_CIE2017(
@@ -207,8 +207,6 @@ def load_TCS_CIE2017(shape):
     99
     """
 
-    global _CACHE_TCS_CIE2017
-
     interval = shape.interval
 
     assert interval in (1, 5), (
@@ -216,8 +214,9 @@ def load_TCS_CIE2017(shape):
 
     filename = 'tcs_cfi2017_{0}_nm.csv.gz'.format(as_int(interval))
 
-    if filename in _CACHE_TCS_CIE2017:
-        return _CACHE_TCS_CIE2017[filename]
+    tcs = _CACHE_TCS_CIE2017.get(filename)
+    if tcs is not None:
+        return tcs
 
     data = np.genfromtxt(
         str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
@@ -226,9 +225,7 @@ def load_TCS_CIE2017(shape):
 
     tcs = MultiSpectralDistributions(data[:, 1:], data[:, 0], labels)
 
-    _CACHE_TCS_CIE2017[filename] = tcs
-
-    return tcs
+    return _CACHE_TCS_CIE2017.set(filename, tcs)
 
 
 def CCT_reference_illuminant(sd):
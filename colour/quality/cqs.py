@@ -205,7 +205,7 @@ def colour_quality_scale(sd_test, additional_data=False,
         scaling_f = 3.2
     else:
         XYZ_r = sd_to_XYZ(sd_reference, cmfs)
-        XYZ_r /= XYZ_r[1]
+        XYZ_r = XYZ_r / XYZ_r[1]
         CCT_f = CCT_factor(reference_vs_colorimetry_data, XYZ_r)
         scaling_f = 3.104
 
@@ -331,10 +331,10 @@ def vs_colorimetry_data(sd_test,
     """
 
     XYZ_t = sd_to_XYZ(sd_test, cmfs)
-    XYZ_t /= XYZ_t[1]
+    XYZ_t = XYZ_t / XYZ_t[1]
 
     XYZ_r = sd_to_XYZ(sd_reference, cmfs)
-    XYZ_r /= XYZ_r[1]
+    XYZ_r = XYZ_r / XYZ_r[1]
     xy_r = XYZ_to_xy(XYZ_r)
 
     vs_data = []
@@ -48,7 +48,7 @@ class TestErrorFunction(unittest.TestCase):
 
         self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._shape)
         self._XYZ_D65 = sd_to_XYZ(self._sd_D65)
-        self._XYZ_D65 /= self._XYZ_D65[1]
+        self._XYZ_D65 = self._XYZ_D65 / self._XYZ_D65[1]
         self._xy_D65 = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
             'D65']
 
@@ -120,7 +120,7 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
     for Ti in np.linspace(start, end, count):
         sd = sd_blackbody(Ti, shape)
         XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ /= np.max(XYZ)
+        XYZ = XYZ / np.max(XYZ)
         UVW = XYZ_to_UCS(XYZ)
         ui, vi = UCS_to_uv(UVW)
         di = np.hypot(ux - ui, vx - vi)
@@ -350,7 +350,7 @@ def _CCT_to_uv_Ohno2013(CCT_D_uv,
 
     sd = sd_blackbody(CCT, shape)
     XYZ = sd_to_XYZ(sd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
+    XYZ = XYZ / np.max(XYZ)
     UVW = XYZ_to_UCS(XYZ)
     u0, v0 = UCS_to_uv(UVW)
 
@@ -359,7 +359,7 @@ def _CCT_to_uv_Ohno2013(CCT_D_uv,
     else:
         sd = sd_blackbody(CCT + delta, shape)
         XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
+        XYZ = XYZ / np.max(XYZ)
         UVW = XYZ_to_UCS(XYZ)
         u1, v1 = UCS_to_uv(UVW)
 
@@ -15,6 +15,8 @@ from .common import (
     to_domain_1, to_domain_10, to_domain_100, to_domain_degrees, to_domain_int,
     from_range_1, from_range_10, from_range_100, from_range_degrees,
     from_range_int, copy_definition, validate_method)
+from .caching import (is_caching_enabled, set_caching_enable, caching_enable,
+                      LRUCache, CACHE_REGISTRY, clear_caches)
 from .verbose import (
     ColourWarning, ColourUsageWarning, ColourRuntimeWarning, message_box,
     show_warning, warning, runtime_warning, usage_warning, filter_warnings,
@@ -52,6 +54,10 @@ __all__ += [
     'from_range_degrees', 'from_range_int', 'copy_definition',
     'validate_method'
 ]
+__all__ += [
+    'is_caching_enabled', 'set_caching_enable', 'caching_enable', 'LRUCache',
+    'CACHE_REGISTRY', 'clear_caches'
+]
 __all__ += [
     'ColourWarning', 'ColourUsageWarning', 'ColourRuntimeWarning',
     'message_box', 'show_warning', 'warning', 'runtime_warning',
@@ -601,7 +601,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a, dtype=None):
+def tstack(a, dtype=None, out=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -614,11 +614,20 @@ def tstack(a, dtype=None):
     dtype : object
         Type to use for initial conversion to *ndarray*, default to the type
         defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    out : ndarray, optional
+        Array to write the stacked arrays into, its last axis length must be
+        equal to the arrays count, e.g. the array that was split with
+        :func:`colour.utilities.tsplit` definition.
 
     Returns
     -------
     ndarray
 
+    Notes
+    -----
+    -   The arrays are written into a single output array allocated with
+        their broadcast shape, or into given ``out`` array.
+
     Examples
     --------
     >>> a = 0
@@ -648,17 +657,31 @@ def tstack(a, dtype=None):
              [ 3.,  3.,  3.],
              [ 4.,  4.,  4.],
              [ 5.,  5.,  5.]]]])
+    >>> b = np.zeros((1, 6, 3))
+    >>> tstack([a, a, a], out=b) is b
+    True
     """
 
     if dtype is None:
         dtype = DEFAULT_FLOAT_DTYPE
 
-    a = as_array(a, dtype)
+    a = [as_array(x, dtype) for x in a]
+
+    if out is None:
+        shape = a[0].shape
+        for x in a[1:]:
+            if x.shape != shape:
+                shape = np.broadcast(np.broadcast_to(0, shape), x).shape
+
+        out = np.empty(shape + (len(a), ), dtype)
+
+    for i, x in enumerate(a):
+        out[..., i] = x
 
-    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+    return out
 
 
-def tsplit(a, dtype=None):
+def tsplit(a, dtype=None, copy=True):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -669,11 +692,21 @@ def tsplit(a, dtype=None):
     dtype : object
         Type to use for initial conversion to *ndarray*, default to the type
         defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    copy : bool, optional
+        Whether to return a copy of the array, if *False*, a read-only view
+        of the array with its last axis moved first is returned.
 
     Returns
     -------
     ndarray
 
+    Notes
+    -----
+    -   With ``copy`` set to *False*, the split arrays are strided views that
+        share memory with given array, provided it has the requested type.
+        They are read-only so that in-place operations cannot modify the
+        given array.
+
     Examples
     --------
     >>> a = np.array([0, 0, 0])
@@ -705,6 +738,12 @@ def tsplit(a, dtype=None):
            [[ 0.,  1.,  2.,  3.,  4.,  5.]],
     <BLANKLINE>
            [[ 0.,  1.,  2.,  3.,  4.,  5.]]])
+    >>> a = np.array([[0.0, 0.5, 1.0], [1.0, 0.5, 0.0]])
+    >>> x, y, z = tsplit(a, copy=False)
+    >>> x
+    array([ 0.,  1.])
+    >>> np.shares_memory(a, x)
+    True
     """
 
     if dtype is None:
@@ -712,6 +751,12 @@ def tsplit(a, dtype=None):
 
     a = as_array(a, dtype)
 
+    if not copy:
+        a = np.moveaxis(a, -1, 0)
+        a.flags.writeable = False
+
+        return a
+
     return np.array([a[..., x] for x in range(a.shape[-1])])
 
 
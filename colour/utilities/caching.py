@@ -0,0 +1,537 @@
+# -*- coding: utf-8 -*-
+"""
+Caching
+=======
+
+Defines the caching facilities used by *Colour* to store the results of
+expensive computations:
+
+-   :func:`colour.utilities.is_caching_enabled`
+-   :func:`colour.utilities.set_caching_enable`
+-   :class:`colour.utilities.caching_enable`
+-   :class:`colour.utilities.LRUCache`
+-   :attr:`colour.utilities.CACHE_REGISTRY`
+-   :func:`colour.utilities.clear_caches`
+"""
+
+import functools
+import numpy as np
+import scipy.sparse
+import sys
+import threading
+from collections import OrderedDict
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'is_caching_enabled', 'set_caching_enable', 'caching_enable', 'LRUCache',
+    'CACHE_REGISTRY', 'clear_caches'
+]
+
+_CACHING_ENABLED = True
+"""
+Global variable storing the current *Colour* caching enabled state.
+
+_CACHING_ENABLED : bool
+"""
+
+
+def is_caching_enabled():
+    """
+    Returns whether *Colour* caching is enabled.
+
+    Returns
+    -------
+    bool
+        Whether *Colour* caching is enabled.
+
+    Examples
+    --------
+    >>> with caching_enable(False):
+    ...     is_caching_enabled()
+    False
+    >>> with caching_enable(True):
+    ...     is_caching_enabled()
+    True
+    """
+
+    return _CACHING_ENABLED
+
+
+def set_caching_enable(enable):
+    """
+    Sets *Colour* caching enabled state.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable *Colour* caching.
+
+    Examples
+    --------
+    >>> with caching_enable(is_caching_enabled()):
+    ...     print(is_caching_enabled())
+    ...     set_caching_enable(False)
+    ...     print(is_caching_enabled())
+    True
+    False
+    """
+
+    global _CACHING_ENABLED
+
+    _CACHING_ENABLED = enable
+
+
+class caching_enable:
+    """
+    A context manager and decorator temporarily setting *Colour* caching
+    enabled state.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable or disable *Colour* caching.
+    """
+
+    def __init__(self, enable):
+        self._enable = enable
+        self._previous_state = is_caching_enabled()
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        set_caching_enable(self._enable)
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        set_caching_enable(self._previous_state)
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+def _read_only(value):
+    """
+    Returns a read-only version of given value: *ndarray* and compressed
+    *scipy.sparse* matrix instances are copied and their *writeable* flag
+    unset, *tuple* and *list* instances are processed recursively and other
+    objects are returned as is.
+
+    Parameters
+    ----------
+    value : object
+        Value to return the read-only version of.
+
+    Returns
+    -------
+    object
+        Read-only value.
+    """
+
+    if isinstance(value, np.ndarray):
+        value = np.copy(value)
+        value.setflags(write=False)
+    elif scipy.sparse.isspmatrix_csr(value) or scipy.sparse.isspmatrix_csc(
+            value):
+        value = value.copy()
+        for array in (value.data, value.indices, value.indptr):
+            array.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        value = tuple(_read_only(element) for element in value)
+
+    return value
+
+
+def _nbytes(value):
+    """
+    Returns the approximate size in bytes of given value.
+
+    Parameters
+    ----------
+    value : object
+        Value to return the size in bytes of.
+
+    Returns
+    -------
+    int
+        Approximate size in bytes.
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif scipy.sparse.isspmatrix_csr(value) or scipy.sparse.isspmatrix_csc(
+            value):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    elif isinstance(value, (tuple, list)):
+        return sum(_nbytes(element) for element in value)
+    else:
+        return sys.getsizeof(value)
+
+
+CACHE_REGISTRY = OrderedDict()
+"""
+Registry of the *Colour* caches, i.e. :class:`colour.utilities.LRUCache`
+class instances, by name.
+
+CACHE_REGISTRY : OrderedDict
+"""
+
+
+class LRUCache:
+    """
+    Defines a thread-safe, bounded, *Least Recently Used* (LRU) cache.
+
+    The cache evicts its least recently used items whenever either the items
+    count exceeds ``maximum_size`` or the items size in bytes exceeds
+    ``maximum_nbytes``. The *ndarray* values are copied and made read-only
+    upon storage so that they can be returned without copy upon retrieval.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name, the cache is registered in
+        :attr:`colour.utilities.CACHE_REGISTRY` attribute with that name.
+    maximum_size : int, optional
+        Maximum items count, *None* meaning unbounded.
+    maximum_nbytes : int, optional
+        Maximum items size in bytes, *None* meaning unbounded.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.LRUCache.name`
+    -   :attr:`~colour.utilities.LRUCache.maximum_size`
+    -   :attr:`~colour.utilities.LRUCache.maximum_nbytes`
+    -   :attr:`~colour.utilities.LRUCache.nbytes`
+    -   :attr:`~colour.utilities.LRUCache.hits`
+    -   :attr:`~colour.utilities.LRUCache.misses`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.LRUCache.__init__`
+    -   :meth:`~colour.utilities.LRUCache.__repr__`
+    -   :meth:`~colour.utilities.LRUCache.__contains__`
+    -   :meth:`~colour.utilities.LRUCache.__len__`
+    -   :meth:`~colour.utilities.LRUCache.get`
+    -   :meth:`~colour.utilities.LRUCache.set`
+    -   :meth:`~colour.utilities.LRUCache.clear`
+
+    Notes
+    -----
+    -   The cache is bypassed, i.e. nothing is retrieved nor stored, when
+        *Colour* caching is disabled with the
+        :func:`colour.utilities.set_caching_enable` definition.
+
+    Examples
+    --------
+    >>> cache = LRUCache('Example', maximum_size=2)
+    >>> a = cache.set('a', np.array([1, 2, 3]))
+    >>> a.flags.writeable
+    False
+    >>> cache.get('a')
+    array([1, 2, 3])
+    >>> cache.get('b') is None
+    True
+    >>> b = cache.set('b', np.array([4, 5, 6]))
+    >>> c = cache.set('c', np.array([7, 8, 9]))
+    >>> 'a' in cache
+    False
+    >>> print(cache)
+    LRUCache('Example', size=2, nbytes=48, hits=1, misses=1)
+    """
+
+    def __init__(self, name, maximum_size=None, maximum_nbytes=None):
+        self._name = name
+        self._maximum_size = maximum_size
+        self._maximum_nbytes = maximum_nbytes
+
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+        CACHE_REGISTRY[name] = self
+
+    @property
+    def name(self):
+        """
+        Getter property for the cache name.
+
+        Returns
+        -------
+        unicode
+            Cache name.
+        """
+
+        return self._name
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the cache maximum items count, the least
+        recently used items are evicted if the new limit is exceeded.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the cache maximum items count with.
+
+        Returns
+        -------
+        int
+            Cache maximum items count.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for **self.maximum_size** property.
+        """
+
+        with self._lock:
+            self._maximum_size = value
+            self._evict()
+
+    @property
+    def maximum_nbytes(self):
+        """
+        Getter and setter property for the cache maximum items size in bytes,
+        the least recently used items are evicted if the new limit is
+        exceeded.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the cache maximum items size in bytes with.
+
+        Returns
+        -------
+        int
+            Cache maximum items size in bytes.
+        """
+
+        return self._maximum_nbytes
+
+    @maximum_nbytes.setter
+    def maximum_nbytes(self, value):
+        """
+        Setter for **self.maximum_nbytes** property.
+        """
+
+        with self._lock:
+            self._maximum_nbytes = value
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """
+        Getter property for the cache approximate items size in bytes.
+
+        Returns
+        -------
+        int
+            Cache approximate items size in bytes.
+        """
+
+        return self._nbytes
+
+    @property
+    def hits(self):
+        """
+        Getter property for the cache hits count.
+
+        Returns
+        -------
+        int
+            Cache hits count.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter property for the cache misses count.
+
+        Returns
+        -------
+        int
+            Cache misses count.
+        """
+
+        return self._misses
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the cache.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, size={2}, nbytes={3}, hits={4}, misses={5})'.format(
+            self.__class__.__name__, self._name, len(self), self._nbytes,
+            self._hits, self._misses)
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache contains given key.
+
+        Parameters
+        ----------
+        key : object
+            Key to check the existence of.
+
+        Returns
+        -------
+        bool
+            Whether the cache contains given key.
+        """
+
+        return key in self._data
+
+    def __len__(self):
+        """
+        Returns the cache items count.
+
+        Returns
+        -------
+        int
+            Cache items count.
+        """
+
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """
+        Returns the value for given key and marks it as the most recently
+        used, or given default value if the key is not in the cache.
+
+        Parameters
+        ----------
+        key : object
+            Key to retrieve the value of.
+        default : object, optional
+            Value to return if the key is not in the cache.
+
+        Returns
+        -------
+        object
+            Value for given key or default value.
+        """
+
+        if not _CACHING_ENABLED:
+            return default
+
+        with self._lock:
+            if key not in self._data:
+                self._misses += 1
+
+                return default
+
+            self._hits += 1
+            self._data.move_to_end(key)
+
+            return self._data[key][0]
+
+    def set(self, key, value):
+        """
+        Stores given value for given key and evicts the least recently used
+        items if the cache limits are exceeded.
+
+        Parameters
+        ----------
+        key : object
+            Key to store the value for.
+        value : object
+            Value to store.
+
+        Returns
+        -------
+        object
+            Stored value, i.e. a read-only copy of given value if it is an
+            *ndarray*. Given value is returned unchanged and is not stored if
+            *Colour* caching is disabled.
+        """
+
+        if not _CACHING_ENABLED:
+            return value
+
+        value = _read_only(value)
+
+        nbytes = _nbytes(value)
+
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= self._data.pop(key)[1]
+
+            self._data[key] = (value, nbytes)
+            self._nbytes += nbytes
+
+            self._evict()
+
+        return value
+
+    def _evict(self):
+        """
+        Evicts the least recently used items until the cache limits are not
+        exceeded. The most recently used item is kept even if it exceeds the
+        bytes limit, a size limit of zero empties the cache.
+        """
+
+        while self._data and (
+            (self._maximum_size is not None and
+             len(self._data) > self._maximum_size) or
+            (self._maximum_nbytes is not None and
+             self._nbytes > self._maximum_nbytes and len(self._data) > 1)):
+            self._nbytes -= self._data.popitem(last=False)[1][1]
+
+    def clear(self):
+        """
+        Clears the cache items and resets the hits and misses counts.
+        """
+
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+
+def clear_caches():
+    """
+    Clears all the caches registered in
+    :attr:`colour.utilities.CACHE_REGISTRY` attribute.
+
+    Examples
+    --------
+    >>> clear_caches()
+    """
+
+    for cache in CACHE_REGISTRY.values():
+        cache.clear()
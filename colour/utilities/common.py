@@ -217,7 +217,7 @@ def _initializer(kwargs):
     """
     Initializer for the multiprocessing pool. It is mainly use to ensure that
     processes on *Windows* correctly inherit from the current domain-range
-    scale.
+    scale and then calls the user initializer if any.
 
     Parameters
     ----------
@@ -231,6 +231,10 @@ def _initializer(kwargs):
     # sub-processes.
     _DOMAIN_RANGE_SCALE = kwargs.get('scale', 'reference')  # pragma: no cover
 
+    initializer = kwargs.get('initializer')  # pragma: no cover
+    if initializer is not None:  # pragma: no cover
+        initializer(*kwargs.get('initargs', ()))
+
 
 @contextmanager
 def multiprocessing_pool(*args, **kwargs):
@@ -244,6 +248,13 @@ def multiprocessing_pool(*args, **kwargs):
     \\**kwargs : dict, optional
         Keywords arguments.
 
+    Notes
+    -----
+    -   The ``initializer`` and ``initargs`` keywords arguments are honoured:
+        the initializer is called in each worker process after the
+        domain-range scale has been set, or once in the current process when
+        multiprocessing is disabled.
+
     Examples
     --------
     >>> from functools import partial
@@ -268,7 +279,9 @@ def multiprocessing_pool(*args, **kwargs):
         """
 
         def __init__(self, *args, **kwargs):
-            pass
+            initializer = kwargs.get('initializer')
+            if initializer is not None:
+                initializer(*kwargs.get('initargs', ()))
 
         def map(self, func, iterable, chunksize=None):
             """
@@ -284,13 +297,21 @@ def multiprocessing_pool(*args, **kwargs):
 
             pass
 
-    kwargs['initializer'] = _initializer
-    kwargs['initargs'] = ({'scale': get_domain_range_scale()}, )
+    initializer = kwargs.pop('initializer', None)
+    initargs = kwargs.pop('initargs', ())
 
     if _MULTIPROCESSING_ENABLED:
         pool_factory = multiprocessing.Pool
+        kwargs['initializer'] = _initializer
+        kwargs['initargs'] = ({
+            'scale': get_domain_range_scale(),
+            'initializer': initializer,
+            'initargs': initargs
+        }, )
     else:
         pool_factory = _DummyPool
+        kwargs['initializer'] = initializer
+        kwargs['initargs'] = initargs
 
     pool = pool_factory(*args, **kwargs)
 
@@ -253,6 +253,79 @@ class TestSetFloatPrecision(unittest.TestCase):
 
             self.assertEqual(dtype_getter(convert(a, source, target)), dtype)
 
+    def test_set_float_precision_enforcement_image(self):
+        """
+        Tests whether :func:`colour.utilities.array.set_float_precision` effect
+        is applied through the image processing public API, i.e. bit depth
+        conversion, *RGB* colourspaces conversions, transfer functions and
+        *LUTs* application.
+        """
+
+        from colour import (CCTF_DECODINGS, CCTF_ENCODINGS, RGB_COLOURSPACES,
+                            RGB_to_RGB, RGB_to_XYZ, XYZ_to_RGB)
+        from colour.algebra import (table_interpolation_tetrahedral,
+                                    vector_dot)
+        from colour.io import (LUT1D, LUT3x1D, LUT3D, LUTSequence,
+                               convert_bit_depth)
+
+        dtype = np.float32
+        set_float_precision(dtype)
+
+        RGB_i = np.reshape(np.linspace(0, 1, 4 * 6 * 3), (4, 6, 3))
+
+        for bit_depth in ('uint8', 'uint16'):
+            RGB = convert_bit_depth(
+                convert_bit_depth(RGB_i, bit_depth), 'float32')
+            self.assertEqual(RGB.dtype, dtype)
+            self.assertEqual(as_float_array(RGB).dtype, dtype)
+
+        RGB = as_float_array(RGB_i)
+        self.assertEqual(RGB.dtype, dtype)
+
+        sRGB = RGB_COLOURSPACES['sRGB']
+        for colourspace in RGB_COLOURSPACES.values():
+            self.assertEqual(
+                RGB_to_RGB(
+                    RGB,
+                    sRGB,
+                    colourspace,
+                    apply_cctf_decoding=True,
+                    apply_cctf_encoding=True).dtype, dtype)
+
+        self.assertEqual(
+            RGB_to_XYZ(RGB, sRGB.whitepoint, sRGB.whitepoint,
+                       sRGB.matrix_RGB_to_XYZ).dtype, dtype)
+        self.assertEqual(
+            XYZ_to_RGB(RGB, sRGB.whitepoint, sRGB.whitepoint,
+                       sRGB.matrix_XYZ_to_RGB).dtype, dtype)
+        self.assertEqual(vector_dot(sRGB.matrix_RGB_to_XYZ, RGB).dtype, dtype)
+
+        for cctfs in (CCTF_DECODINGS, CCTF_ENCODINGS):
+            for cctf in cctfs.values():
+                self.assertEqual(cctf(RGB).dtype, dtype)
+
+        LUTs = [
+            LUT1D(),
+            LUT1D(LUT1D.linear_table(16) ** (1 / 2.2)),
+            LUT3x1D(),
+            LUT3x1D(LUT3x1D.linear_table(16) ** (1 / 2.2)),
+            LUT3D(),
+            LUT3D(LUT3D.linear_table(16) ** (1 / 2.2)),
+        ]
+        for LUT in LUTs:
+            self.assertEqual(LUT.table.dtype, dtype)
+            self.assertEqual(LUT.apply(RGB).dtype, dtype)
+
+        self.assertEqual(
+            LUTs[-1].apply(RGB,
+                           interpolator=table_interpolation_tetrahedral).dtype,
+            dtype)
+        self.assertEqual(LUTSequence(*LUTs).apply(RGB).dtype, dtype)
+
+        for bit_depth in ('uint8', 'uint16', 'float16', 'float32'):
+            self.assertEqual(
+                convert_bit_depth(RGB, bit_depth).dtype, np.dtype(bit_depth))
+
     def tearDown(self):
         """
         After tests actions.
@@ -527,6 +600,28 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+        np.testing.assert_almost_equal(
+            tstack([a, 1, np.zeros(3)]),
+            np.array([[
+                [[0, 1, 0], [1, 1, 0], [2, 1, 0]],
+                [[3, 1, 0], [4, 1, 0], [5, 1, 0]],
+            ]]))
+
+        self.assertEqual(tstack([a, a], dtype=np.float32).dtype, np.float32)
+
+    def test_out_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition ``out``
+        argument.
+        """
+
+        a = np.reshape(np.arange(0, 6), (2, 3))
+        out = np.zeros((2, 3, 3), dtype=np.float32)
+
+        self.assertIs(tstack([a, a * 2, a * 3], out=out), out)
+        np.testing.assert_almost_equal(out[..., 2], a * 3)
+        self.assertEqual(out.dtype, np.float32)
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -580,6 +675,36 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_copy_tsplit(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition ``copy``
+        argument.
+        """
+
+        a = np.reshape(np.arange(0, 18, dtype=np.float64), (2, 3, 3))
+
+        x, y, z = tsplit(a, copy=False)
+        np.testing.assert_almost_equal(y, tsplit(a)[1])
+        self.assertTrue(np.shares_memory(a, y))
+        self.assertFalse(y.flags.writeable)
+        self.assertTrue(a.flags.writeable)
+        self.assertFalse(np.shares_memory(a, tsplit(a)))
+
+        def assign():
+            """
+            Assigns to a view returned by
+            :func:`colour.utilities.array.tsplit` definition.
+            """
+
+            y[0] = 0
+
+        self.assertRaises(ValueError, assign)
+
+        np.testing.assert_almost_equal(
+            tstack(tsplit(a, copy=False)), a, decimal=7)
+        self.assertFalse(
+            np.shares_memory(a, tsplit(a.astype(np.int64), copy=False)))
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.caching` module.
+"""
+
+import numpy as np
+import scipy.sparse
+import unittest
+
+from colour.utilities import (is_caching_enabled, set_caching_enable,
+                              caching_enable, LRUCache, CACHE_REGISTRY,
+                              clear_caches)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'TestIsCachingEnabled', 'TestSetCachingEnable', 'TestCachingEnable',
+    'TestLRUCache', 'TestClearCaches'
+]
+
+
+class TestIsCachingEnabled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.caching.is_caching_enabled` definition
+    unit tests methods.
+    """
+
+    def test_is_caching_enabled(self):
+        """
+        Tests :func:`colour.utilities.caching.is_caching_enabled` definition.
+        """
+
+        with caching_enable(True):
+            self.assertTrue(is_caching_enabled())
+
+        with caching_enable(False):
+            self.assertFalse(is_caching_enabled())
+
+
+class TestSetCachingEnable(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.caching.set_caching_enable` definition
+    unit tests methods.
+    """
+
+    def test_set_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.caching.set_caching_enable` definition.
+        """
+
+        with caching_enable(is_caching_enabled()):
+            set_caching_enable(True)
+            self.assertTrue(is_caching_enabled())
+
+        with caching_enable(is_caching_enabled()):
+            set_caching_enable(False)
+            self.assertFalse(is_caching_enabled())
+
+
+class TestCachingEnable(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.caching.caching_enable` definition unit
+    tests methods.
+    """
+
+    def test_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.caching.caching_enable` definition.
+        """
+
+        with caching_enable(True):
+            self.assertTrue(is_caching_enabled())
+
+        with caching_enable(False):
+            self.assertFalse(is_caching_enabled())
+
+        @caching_enable(True)
+        def fn_a():
+            """
+            :func:`caching_enable` unit tests :func:`fn_a` definition.
+            """
+
+            self.assertTrue(is_caching_enabled())
+
+        fn_a()
+
+        @caching_enable(False)
+        def fn_b():
+            """
+            :func:`caching_enable` unit tests :func:`fn_b` definition.
+            """
+
+            self.assertFalse(is_caching_enabled())
+
+        fn_b()
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.caching.LRUCache` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'maximum_size', 'maximum_nbytes',
+                               'nbytes', 'hits', 'misses')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__repr__', '__contains__', '__len__',
+                            'get', 'set', 'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.caching.LRUCache.get` method.
+        """
+
+        cache = LRUCache('TestLRUCache.test_get')
+        self.assertIs(CACHE_REGISTRY['TestLRUCache.test_get'], cache)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+
+        a = np.array([1, 2, 3])
+        cache.set('a', a)
+        a_c = cache.get('a')
+        np.testing.assert_equal(a_c, a)
+        self.assertIs(cache.get('a'), a_c)
+        self.assertEqual(cache.hits, 2)
+
+        with caching_enable(False):
+            self.assertIsNone(cache.get('a'))
+
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 2)
+
+    def test_set(self):
+        """
+        Tests :meth:`colour.utilities.caching.LRUCache.set` method.
+        """
+
+        cache = LRUCache('TestLRUCache.test_set')
+
+        a = np.array([1.0, 2.0, 3.0])
+        a_c = cache.set('a', a)
+        self.assertIsNot(a_c, a)
+        self.assertFalse(a_c.flags.writeable)
+        self.assertTrue(a.flags.writeable)
+
+        a[0] = 0
+        np.testing.assert_equal(cache.get('a'), [1.0, 2.0, 3.0])
+
+        b_c = cache.set('b', (np.array([1.0, 2.0]), 3.0))
+        self.assertIsInstance(b_c, tuple)
+        self.assertFalse(b_c[0].flags.writeable)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, 24 + 16 + 24)
+
+        with caching_enable(False):
+            c = np.array([1.0, 2.0, 3.0])
+            c_c = cache.set('c', c)
+            self.assertIs(c_c, c)
+            self.assertTrue(c_c.flags.writeable)
+
+        self.assertNotIn('c', cache)
+
+        d = scipy.sparse.csr_matrix(np.identity(3))
+        d_c = cache.set('d', d)
+        self.assertIsNot(d_c, d)
+        self.assertFalse(d_c.data.flags.writeable)
+        self.assertTrue(d.data.flags.writeable)
+        self.assertEqual(cache.nbytes, 24 + 16 + 24 + 24 + 12 + 16)
+
+    def test_eviction(self):
+        """
+        Tests :class:`colour.utilities.caching.LRUCache` class least recently
+        used items eviction.
+        """
+
+        cache = LRUCache('TestLRUCache.test_eviction', maximum_size=2)
+
+        cache.set('a', np.ones(3))
+        cache.set('b', np.ones(3))
+        cache.get('a')
+        cache.set('c', np.ones(3))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.nbytes, 48)
+
+        cache = LRUCache('TestLRUCache.test_eviction', maximum_nbytes=8 * 10)
+
+        cache.set('a', np.ones(4))
+        cache.set('b', np.ones(4))
+        self.assertEqual(len(cache), 2)
+        cache.set('c', np.ones(4))
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('a', cache)
+
+        cache.set('d', np.ones(16))
+        self.assertEqual(len(cache), 1)
+        self.assertIn('d', cache)
+
+        cache = LRUCache('TestLRUCache.test_eviction')
+
+        for key in 'abcd':
+            cache.set(key, np.ones(4))
+
+        cache.maximum_size = 3
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn('a', cache)
+
+        cache.maximum_nbytes = 8 * 8
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.nbytes, 8 * 8)
+
+        cache = LRUCache('TestLRUCache.test_eviction', maximum_size=0)
+
+        cache.set('a', np.ones(4))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.caching.LRUCache.clear` method.
+        """
+
+        cache = LRUCache('TestLRUCache.test_clear')
+
+        cache.set('a', np.ones(3))
+        cache.get('a')
+        cache.get('b')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+
+class TestClearCaches(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.caching.clear_caches` definition unit
+    tests methods.
+    """
+
+    def test_clear_caches(self):
+        """
+        Tests :func:`colour.utilities.caching.clear_caches` definition.
+        """
+
+        cache = LRUCache('TestClearCaches.test_clear_caches')
+        cache.set('a', np.ones(3))
+
+        clear_caches()
+
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,12 +9,12 @@ from collections import OrderedDict
 from functools import partial
 
 from colour.utilities import (
-    batch, multiprocessing_pool, is_iterable, is_string, is_numeric,
-    is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
-    get_domain_range_scale, set_domain_range_scale, domain_range_scale,
-    to_domain_1, to_domain_10, to_domain_100, to_domain_int, to_domain_degrees,
-    from_range_1, from_range_10, from_range_100, from_range_int,
-    from_range_degrees, validate_method)
+    batch, disable_multiprocessing, multiprocessing_pool, is_iterable,
+    is_string, is_numeric, is_integer, is_sibling, filter_kwargs,
+    filter_mapping, first_item, get_domain_range_scale, set_domain_range_scale,
+    domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
+    to_domain_int, to_domain_degrees, from_range_1, from_range_10,
+    from_range_100, from_range_int, from_range_degrees, validate_method)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -81,6 +81,48 @@ def _add(a, b):
     return a + b  # pragma: no cover
 
 
+_INITIALIZER_STATE = {}
+"""
+State set by the multiprocessing pool initializer.
+
+_INITIALIZER_STATE : dict
+"""
+
+
+def _initializer(b):
+    """
+    Initializer for the multiprocessing pool.
+
+    Parameters
+    ----------
+    b : numeric
+        Variable :math:`b`.
+    """
+
+    _INITIALIZER_STATE['b'] = b
+
+
+def _add_initializer(a):
+    """
+    Function to map with a multiprocessing pool using the variable :math:`b`
+    set by the pool initializer.
+
+    Parameters
+    ----------
+    a : numeric
+        Variable :math:`a`.
+
+    Returns
+    -------
+    numeric
+        Addition result.
+    """
+
+    # NOTE: No coverage information is available as this code is executed in
+    # sub-processes.
+    return a + _INITIALIZER_STATE['b']  # pragma: no cover
+
+
 class TestMultiprocessingPool(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.multiprocessing_pool` definition
@@ -97,6 +139,27 @@ class TestMultiprocessingPool(unittest.TestCase):
                 pool.map(partial(_add, b=2), range(10)),
                 [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
 
+    def test_initializer_multiprocessing_pool(self):
+        """
+        Tests :func:`colour.utilities.common.multiprocessing_pool` definition
+        initializer support.
+        """
+
+        with multiprocessing_pool(
+                initializer=_initializer, initargs=(2, )) as pool:
+            self.assertListEqual(
+                pool.map(_add_initializer, range(10)),
+                [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+
+        with disable_multiprocessing():
+            with multiprocessing_pool(
+                    initializer=_initializer, initargs=(3, )) as pool:
+                self.assertListEqual(
+                    pool.map(_add_initializer, range(10)),
+                    [3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+        _INITIALIZER_STATE.clear()
+
 
 class TestIsIterable(unittest.TestCase):
     """
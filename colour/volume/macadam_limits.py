@@ -10,6 +10,7 @@ import numpy as np
 from scipy.spatial import Delaunay
 
 from colour.models import xyY_to_XYZ
+from colour.utilities import LRUCache
 from colour.volume import OPTIMAL_COLOUR_STIMULI_ILLUMINANTS
 
 __author__ = 'Colour Developers'
@@ -21,8 +22,11 @@ __status__ = 'Production'
 
 __all__ = ['is_within_macadam_limits']
 
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = {}
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = {}
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = LRUCache(
+    'colour.volume.macadam_limits._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ')
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = LRUCache(
+    'colour.volume.macadam_limits.'
+    '_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS')
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
@@ -52,7 +56,8 @@ def _XYZ_optimal_colour_stimuli(illuminant):
     vertices = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ.get(illuminant)
 
     if vertices is None:
-        _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ[illuminant] = vertices = (
+        vertices = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ.set(
+            illuminant,
             xyY_to_XYZ(optimal_colour_stimuli) / 100)
 
     return vertices
@@ -101,8 +106,8 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
         illuminant)
 
     if triangulation is None:
-        _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
+        triangulation = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS.set(
+            illuminant, Delaunay(optimal_colour_stimuli))
 
     simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
     simplex = np.where(simplex >= 0, True, False)
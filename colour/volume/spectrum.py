@@ -26,7 +26,7 @@ import numpy as np
 from colour.colorimetry import MSDS_CMFS, msds_to_XYZ, SpectralShape, sd_ones
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.volume import is_within_mesh_volume
-from colour.utilities import zeros, validate_method
+from colour.utilities import LRUCache, zeros, validate_method
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -48,8 +48,14 @@ interval of 5.
 SPECTRAL_SHAPE_OUTER_SURFACE_XYZ : SpectralShape
 """
 
-_CACHE_OUTER_SURFACE_XYZ = {}
-_CACHE_OUTER_SURFACE_XYZ_POINTS = {}
+_CACHE_OUTER_SURFACE_XYZ = LRUCache(
+    'colour.volume.spectrum._CACHE_OUTER_SURFACE_XYZ',
+    maximum_size=64,
+    maximum_nbytes=2 ** 26)
+_CACHE_OUTER_SURFACE_XYZ_POINTS = LRUCache(
+    'colour.volume.spectrum._CACHE_OUTER_SURFACE_XYZ_POINTS',
+    maximum_size=64,
+    maximum_nbytes=2 ** 26)
 
 
 def generate_pulse_waves(bins, pulse_order='Bins', filter_jagged_pulses=False):
@@ -320,9 +326,9 @@ def XYZ_outer_surface(cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
     if XYZ is None:
         pulse_waves = generate_pulse_waves(
             len(cmfs.wavelengths), point_order, filter_jagged_points)
-        XYZ = msds_to_XYZ(pulse_waves, cmfs, illuminant, **settings) / 100
-
-        _CACHE_OUTER_SURFACE_XYZ[key] = XYZ
+        XYZ = _CACHE_OUTER_SURFACE_XYZ.set(
+            key,
+            msds_to_XYZ(pulse_waves, cmfs, illuminant, **settings) / 100)
 
     return XYZ
 
@@ -389,7 +395,7 @@ def is_within_visible_spectrum(
     vertices = _CACHE_OUTER_SURFACE_XYZ_POINTS.get(key)
 
     if vertices is None:
-        _CACHE_OUTER_SURFACE_XYZ_POINTS[key] = vertices = (solid_RoschMacAdam(
-            cmfs, illuminant, **kwargs))
+        vertices = _CACHE_OUTER_SURFACE_XYZ_POINTS.set(
+            key, solid_RoschMacAdam(cmfs, illuminant, **kwargs))
 
     return is_within_mesh_volume(XYZ, vertices, tolerance)
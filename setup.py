@@ -115,6 +115,7 @@ package_data = \
  'colour.characterisation.datasets': ['rawtoaces/*'],
  'colour.examples.io': ['resources/*'],
  'colour.examples.plotting': ['resources/*'],
+ 'colour.graph': ['resources/*'],
  'colour.io.luts.tests': ['resources/cinespace/*',
                           'resources/iridas_cube/*',
                           'resources/resolve_cube/*',
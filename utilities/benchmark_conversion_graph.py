@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Conversion Graph
+==========================
+
+Measures the cost, i.e. the execution time per element, and the precision
+loss, i.e. the round-trip error, of the automatic colour conversion graph
+edges on the host machine and writes them to the conversion graph weights
+file along the next hops table used to find the shortest conversion paths.
+"""
+
+import argparse
+import csv
+import numpy as np
+import timeit
+
+from colour.characterisation import SDS_COLOURCHECKERS
+from colour.colorimetry import SDS_ILLUMINANTS, sd_to_XYZ
+from colour.graph import convert
+from colour.graph.conversion import (
+    CONVERSION_GRAPH_NODE_LABELS, CONVERSION_SPECIFICATIONS,
+    PATH_CONVERSION_NEXT_HOPS, PATH_CONVERSION_WEIGHTS, _build_graph,
+    _build_conversion_next_hops, _conversion_weights_digest,
+    _read_conversion_weights, _write_conversion_next_hops)
+from colour.utilities import domain_range_scale, suppress_warnings
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'generate_samples', 'tile_sample', 'measure_cost', 'measure_error',
+    'benchmark_conversion_graph'
+]
+
+
+def generate_samples():
+    """
+    Generates samples for each node of the automatic colour conversion graph
+    from the *ColorChecker* colour rendition chart.
+
+    Returns
+    -------
+    dict
+        Samples and their elements count by node.
+    """
+
+    SDS = SDS_COLOURCHECKERS['ColorChecker N Ohta']
+
+    with domain_range_scale('1'):
+        XYZ = np.array([
+            sd_to_XYZ(sd, illuminant=SDS_ILLUMINANTS['D65'])
+            for sd in SDS.values()
+        ])
+
+    samples = {
+        'spectral distribution': (SDS['dark skin'], 1),
+        'wavelength': (np.linspace(400, 700, len(XYZ)), len(XYZ)),
+    }
+
+    for node in CONVERSION_GRAPH_NODE_LABELS:
+        if node in samples:
+            continue
+
+        try:
+            a = convert(XYZ, 'CIE XYZ', node)
+        except Exception as error:
+            # Some conversions, e.g. to *Munsell* colours, are not defined for
+            # all the *ColorChecker* colours, the undefined ones are skipped.
+            a = []
+            for XYZ_i in XYZ:
+                try:
+                    a.append(convert(XYZ_i, 'CIE XYZ', node))
+                except Exception:
+                    pass
+
+            if not a:
+                print('Skipping "{0}" node: {1}'.format(
+                    CONVERSION_GRAPH_NODE_LABELS[node], error))
+                continue
+
+            a = np.array(a)
+
+        # *Hexadecimal* representations are returned as object arrays.
+        if isinstance(a, np.ndarray) and a.dtype == object:
+            a = a.astype(np.str_)
+
+        samples[node] = (a, len(XYZ) if isinstance(a, tuple) else len(a))
+
+    return samples
+
+
+def tile_sample(a, size):
+    """
+    Tiles given sample given number of times.
+
+    Parameters
+    ----------
+    a : object
+        Sample to tile.
+    size : int
+        Repetitions count.
+
+    Returns
+    -------
+    object
+        Tiled sample or *None* if the sample cannot be tiled.
+    """
+
+    if isinstance(a, np.ndarray):
+        return np.tile(a, (size, ) + (1, ) * (a.ndim - 1))
+    elif isinstance(a, tuple):
+        return type(a)(
+            *[None if field is None else np.tile(field, size) for field in a])
+
+
+def measure_cost(specification, a, count, repeat=3):
+    """
+    Measures the cost of given conversion specification, i.e. its execution
+    time per element.
+
+    Parameters
+    ----------
+    specification : Conversion_Specification
+        Conversion specification.
+    a : object
+        Sample to convert.
+    count : int
+        Elements count of the sample.
+    repeat : int, optional
+        Measurements count, the fastest one is retained.
+
+    Returns
+    -------
+    numeric
+        Execution time per element in nanoseconds.
+    """
+
+    with domain_range_scale('1'):
+        duration = min(
+            timeit.repeat(
+                lambda: specification.conversion_function(a),
+                number=1,
+                repeat=repeat))
+
+    return duration / count * 1e9
+
+
+def measure_error(specification, inverse_specification, a):
+    """
+    Measures the precision loss of given conversion specification, i.e. the
+    maximum relative round-trip error with given inverse conversion
+    specification.
+
+    Parameters
+    ----------
+    specification : Conversion_Specification
+        Conversion specification.
+    inverse_specification : Conversion_Specification
+        Inverse conversion specification.
+    a : ndarray
+        Sample to convert.
+
+    Returns
+    -------
+    numeric
+        Maximum relative round-trip error.
+    """
+
+    with domain_range_scale('1'):
+        a_r = inverse_specification.conversion_function(
+            specification.conversion_function(a))
+
+    return float(
+        np.max(np.abs(a_r - a)) / max(np.max(np.abs(a)),
+                                      np.finfo(float).eps))
+
+
+def benchmark_conversion_graph(path=PATH_CONVERSION_WEIGHTS,
+                               path_next_hops=PATH_CONVERSION_NEXT_HOPS,
+                               size=64,
+                               repeat=3,
+                               budget=1):
+    """
+    Benchmarks the automatic colour conversion graph edges and writes their
+    weights and the resulting next hops table to given paths.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Conversion graph weights file path.
+    path_next_hops : unicode, optional
+        Conversion graph next hops table file path.
+    size : int, optional
+        Count of *ColorChecker* colour rendition chart repetitions used as
+        samples for the fast conversions.
+    repeat : int, optional
+        Measurements count, the fastest one is retained.
+    budget : numeric, optional
+        Time budget in seconds of a single measurement on the repeated
+        samples, the conversions exceeding it are measured only once on the
+        *ColorChecker* colour rendition chart.
+    """
+
+    with suppress_warnings(python_warnings=True, colour_usage_warnings=True):
+        samples = generate_samples()
+
+        specifications = {(specification.source, specification.target):
+                          specification
+                          for specification in CONVERSION_SPECIFICATIONS}
+
+        rows = []
+        for specification in CONVERSION_SPECIFICATIONS:
+            source, target = (
+                CONVERSION_GRAPH_NODE_LABELS[specification.source],
+                CONVERSION_GRAPH_NODE_LABELS[specification.target])
+
+            if specification.source not in samples:
+                continue
+
+            a, count = samples[specification.source]
+            try:
+                cost = measure_cost(specification, a, count, 1)
+            except Exception as error:
+                # Some conversions, e.g. to spectral distributions, are not
+                # vectorised and are measured with a single element.
+                try:
+                    a, count = a[0], 1
+                    cost = measure_cost(specification, a, count, 1)
+                except Exception:
+                    print('Skipping "{0}" --> "{1}" edge: {2}'.format(
+                        source, target, error))
+                    continue
+
+            # The fast conversions are measured again on a tiled sample so
+            # that the per-call overhead is amortised.
+            a_t = tile_sample(a, size) if count > 1 else None
+            if a_t is not None and cost * count * size * 1e-9 < budget:
+                cost = measure_cost(specification, a_t, count * size, repeat)
+
+            error = ''
+            inverse_specification = specifications.get((specification.target,
+                                                        specification.source))
+            if (inverse_specification is not None and
+                    isinstance(a, np.ndarray) and a.dtype.kind == 'f'):
+                try:
+                    error = '{0:.3e}'.format(
+                        measure_error(specification, inverse_specification, a))
+                except Exception:
+                    pass
+
+            print('{0:<24}{1:<28}{2:>12.1f} ns{3:>14}'.format(
+                source, target, cost, error))
+
+            rows.append([source, target, '{0:.1f}'.format(cost), error])
+
+    with open(path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file, lineterminator='\n')
+        writer.writerow(['source', 'target', 'cost', 'error'])
+        writer.writerows(rows)
+
+    # The next hops table is built from the weights as read by the automatic
+    # colour conversion graph.
+    weights = _read_conversion_weights(path)
+    specifications = []
+    for specification in CONVERSION_SPECIFICATIONS:
+        cost, error = weights.get((specification.source, specification.target),
+                                  (None, None))
+        specifications.append(specification._replace(cost=cost, error=error))
+
+    _write_conversion_next_hops(
+        _build_conversion_next_hops(_build_graph(specifications)),
+        path_next_hops, _conversion_weights_digest(specifications))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the automatic colour conversion graph edges '
+        'and regenerate their weights and next hops table.')
+    parser.add_argument('--path', default=PATH_CONVERSION_WEIGHTS)
+    parser.add_argument('--path-next-hops', default=PATH_CONVERSION_NEXT_HOPS)
+    parser.add_argument('--size', type=int, default=64)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget', type=float, default=1)
+
+    arguments = parser.parse_args()
+
+    benchmark_conversion_graph(arguments.path, arguments.path_next_hops,
+                               arguments.size, arguments.repeat,
+                               arguments.budget)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Table Interpolation
+=============================
+
+Reports the execution time and peak memory of the table interpolation
+definitions alongside the reference implementations gathering all the
+encompassing vertices at once with the
+:func:`colour.algebra.interpolation.vertices_and_relative_coordinates`
+definition.
+"""
+
+import argparse
+import numpy as np
+import time
+import tracemalloc
+
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from colour.algebra.interpolation import vertices_and_relative_coordinates
+from colour.io import LUT3D
+from colour.utilities import as_float_array, tsplit
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'table_interpolation_trilinear_reference',
+    'table_interpolation_tetrahedral_reference', 'KERNELS', 'measure',
+    'benchmark_table_interpolation'
+]
+
+
+def table_interpolation_trilinear_reference(V_xyz, table):
+    """
+    Performs trilinear interpolation of given :math:`V_{xyz}` values using
+    given interpolation table by gathering all the encompassing vertices at
+    once.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+    """
+
+    V_xyz = as_float_array(V_xyz)
+
+    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
+
+    vertices = np.moveaxis(vertices, 0, 1)
+    x, y, z = [f[:, np.newaxis] for f in tsplit(V_xyzr)]
+
+    weights = np.moveaxis(
+        np.transpose(
+            [(1 - x) * (1 - y) * (1 - z), (1 - x) * (1 - y) * z,
+             (1 - x) * y * (1 - z), (1 - x) * y * z, x * (1 - y) * (1 - z),
+             x * (1 - y) * z, x * y * (1 - z), x * y * z]), 0, -1)
+
+    return np.reshape(np.sum(vertices * weights, 1), V_xyz.shape)
+
+
+def table_interpolation_tetrahedral_reference(V_xyz, table):
+    """
+    Performs tetrahedral interpolation of given :math:`V_{xyz}` values using
+    given interpolation table by gathering all the encompassing vertices at
+    once.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+    """
+
+    V_xyz = as_float_array(V_xyz)
+
+    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
+
+    vertices = np.moveaxis(vertices, 0, -1)
+    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
+    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
+
+    xyz_o = np.select([
+        np.logical_and(x > y, y > z),
+        np.logical_and(x > y, x > z),
+        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
+        np.logical_and(x <= y, z > y),
+        np.logical_and(x <= y, z > x),
+        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
+    ], [
+        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
+        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
+        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
+        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
+        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
+        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
+    ])
+
+    return np.reshape(xyz_o, V_xyz.shape)
+
+
+KERNELS = {
+    'Trilinear - Reference': table_interpolation_trilinear_reference,
+    'Trilinear': table_interpolation_trilinear,
+    'Tetrahedral - Reference': table_interpolation_tetrahedral_reference,
+    'Tetrahedral': table_interpolation_tetrahedral,
+}
+"""
+Table interpolation kernels to benchmark.
+
+KERNELS : dict
+"""
+
+
+def measure(kernel, V_xyz, table):
+    """
+    Measures the execution time and peak memory of given table interpolation
+    kernel.
+
+    Parameters
+    ----------
+    kernel : callable
+        Table interpolation kernel.
+    V_xyz : ndarray
+        :math:`V_{xyz}` values to interpolate.
+    table : ndarray
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    tuple
+        Interpolated values, execution time in seconds and peak memory in
+        bytes allocated in addition to the interpolated values.
+    """
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    V_o = kernel(V_xyz, table)
+    duration = time.perf_counter() - start
+
+    peak = tracemalloc.get_traced_memory()[1] - V_o.nbytes
+    tracemalloc.stop()
+
+    return V_o, duration, peak
+
+
+def benchmark_table_interpolation(width=3840, height=2160, size=33):
+    """
+    Benchmarks the table interpolation kernels on a random image with given
+    dimensions and prints the results.
+
+    Parameters
+    ----------
+    width : int, optional
+        Image width.
+    height : int, optional
+        Image height.
+    size : int, optional
+        Interpolation table size.
+    """
+
+    table = LUT3D.linear_table(size) ** (1 / 2.2)
+    prng = np.random.RandomState(4)
+
+    print('{0}x{1} image, {2}^3 table'.format(width, height, size))
+    print('{0:<24}{1:<10}{2:>10}{3:>14}{4:>14}'.format(
+        'Kernel', 'Type', 'Time (s)', 'Peak (MiB)', 'Max Error'))
+
+    for dtype in (np.float64, np.float32):
+        V_xyz = prng.random_sample([height, width, 3]).astype(dtype)
+
+        V_r = {}
+        for name, kernel in KERNELS.items():
+            V_o, duration, peak = measure(kernel, V_xyz, table)
+
+            method = name.split(' - ')[0]
+            error = (np.max(np.abs(V_o - V_r[method])) if method in V_r else 0)
+            V_r.setdefault(method, V_o)
+
+            print('{0:<24}{1:<10}{2:>10.3f}{3:>14.1f}{4:>14.2e}'.format(
+                name,
+                np.dtype(dtype).name, duration, peak / 2 ** 20, error))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the table interpolation kernels.')
+    parser.add_argument('--width', type=int, default=3840)
+    parser.add_argument('--height', type=int, default=2160)
+    parser.add_argument('--size', type=int, default=33)
+
+    arguments = parser.parse_args()
+
+    benchmark_table_interpolation(arguments.width, arguments.height,
+                                  arguments.size)